@@ -0,0 +1,24 @@
+from pee.melhor_prim.heuristica import Heuristica
+
+"""
+    Classe 'HeurContagem', que implementa uma função heurística para o problema de contagem.
+
+    A estimativa é a distância que falta percorrer até ao valor final, ou 0 se o valor final já foi atingido. Como o
+    custo de um incremento é o quadrado do incremento (ver 'OperadorIncremento'), avançar 'd' unidades custa pelo menos
+    'd', pelo que a heurística é admissível. É também consistente: uma transição com incremento 'i' altera a estimativa
+    no máximo em |i|, que nunca excede o seu custo i**2 para incrementos inteiros não nulos.
+"""
+
+class HeurContagem(Heuristica):
+
+    def __init__(self, valor_final):
+        self.__valor_final = valor_final
+
+
+    @property
+    def consistente(self):
+        return True
+
+
+    def h(self, estado):
+        return max(0, self.__valor_final - estado.id_valor())
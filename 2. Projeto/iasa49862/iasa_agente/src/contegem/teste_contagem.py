@@ -1,10 +1,16 @@
+from contegem.modelo.heur_contagem import HeurContagem
 from contegem.modelo.problema_contagem import ProblemaContagem
 from pee.larg.procura_largura import ProcuraLargura
+from pee.mec_proc.filtro_bloom import FiltroBloom
 from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
 from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.proc_vetor.procura_largura_vetor import ProcuraLarguraVetor
+from pee.prof.procura_idaa import ProcuraIDAA
 from pee.prof.procura_prof_iter import ProcuraProfIter
 from pee.prof.procura_prof_lim import ProcuraProfLim
 from pee.prof.procura_profundidade import ProcuraProfundidade
+from pee.prof.procura_ramificacao_limite import ProcuraRamificacaoLimite
+from pee.prof.procura_retrocesso import ProcuraRetrocesso
 
 """
     Script para testar a resolução de um problema de contagem utilizando diferentes estratégias de procura,
@@ -108,6 +114,26 @@ sol(mec_proc, solucao)
 print("")
 
 
+# Testa a procura em largura com um filtro de Bloom de estados visitados, que descarta os nós para estados já
+# memorizados (e.g., depois de um incremento -1) guardando apenas alguns bits por estado.
+print("PROCURA EM LARGURA COM FILTRO DE BLOOM: ")
+mec_proc = ProcuraLargura()
+mec_proc.filtro = FiltroBloom(100)
+solucao = mec_proc.procurar(problema)
+sol(mec_proc, solucao)
+print("")
+
+
+# Testa a procura em largura com os nós guardados em vetores paralelos ('TabelaNos'): encontra a mesma solução e gera
+# os mesmos nós que a procura em largura, sem criar um objeto 'No' por nó (os custos são guardados como reais durante a
+# procura, mas a solução tem os custos inteiros dos operadores).
+print("PROCURA EM LARGURA COM NÓS EM VETORES: ")
+mec_proc = ProcuraLarguraVetor()
+solucao = mec_proc.procurar(problema)
+sol(mec_proc, solucao)
+print("")
+
+
 # Testa a procura em profundidade limitada, que explora até um limite de profundidade (5 neste caso),
 # podendo falhar se o objetivo estiver além do limite (página 9 de "10-pee-1.pdf").
 print("PROCURA EM PROFUNDIDADE LIMITADA: ")
@@ -117,6 +143,15 @@ sol(mec_proc, solucao)
 print("")
 
 
+# Testa a procura em profundidade com retrocesso, limitada a 5 como a anterior: encontra a mesma solução, mas gera os
+# sucessores um de cada vez, guardando apenas um nó por nível do percurso.
+print("PROCURA EM PROFUNDIDADE COM RETROCESSO: ")
+mec_proc = ProcuraRetrocesso(5)
+solucao = mec_proc.procurar(problema)
+sol(mec_proc, solucao)
+print("")
+
+
 # Testa a procura em profundidade iterativa, que incrementa o limite de profundidade (de 1 até 10)
 # até encontrar uma solução ou atingir o limite máximo, combinando a eficiência da profundidade
 # com a completude da largura (página 9 de "10-pee-1.pdf").
@@ -127,6 +162,15 @@ sol(mec_proc, solucao)
 print("")
 
 
+# Testa a procura em profundidade iterativa com uma tabela de transposição, que descarta os estados já alcançados a
+# uma profundidade menor (e.g., depois de um incremento -1), dentro de cada iteração e entre iterações.
+print("PROCURA EM PROFUNDIDADE ITERATIVA COM TABELA DE TRANSPOSIÇÃO: ")
+mec_proc = ProcuraProfIter(5, dim_tabela = 1000)
+solucao = mec_proc.procurar(problema, 1, 10)
+sol(mec_proc, solucao)
+print("")
+
+
 # Testa a procura de custo uniforme, que ordena nós pelo custo acumulado g(n), garantindo a solução
 # com menor custo total, assumindo custos positivos para os operadores (página 19 de "11-pee-2.pdf").
 print("PROCURA CUSTO UNIFORME: ")
@@ -136,8 +180,23 @@ sol(mec_proc, solucao)
 print("")
 
 
+# Testa a procura IDA*, que itera sobre um limite de f(n) = g(n) + h(n) com a memória de uma procura em profundidade,
+# encontrando a solução de menor custo; mostra o limite e os nós expandidos em cada iteração.
+print("PROCURA IDA*: ")
+mec_proc = ProcuraIDAA()
+solucao = mec_proc.procurar(problema, HeurContagem(VALOR_FINAL))
+sol(mec_proc, solucao)
+for limite, nos_expandidos in mec_proc.iteracoes:
+    print(f"Limite: {limite}  Nós expandidos: {nos_expandidos}")
+print("")
 
 
-
-
-
+# Testa a procura em profundidade por ramificação e limite, com o limite inicial dado por uma procura sôfrega; mostra o
+# custo de cada solução encontrada e os nós expandidos até essa solução.
+print("PROCURA RAMIFICAÇÃO E LIMITE: ")
+mec_proc = ProcuraRamificacaoLimite()
+solucao = mec_proc.procurar(problema, HeurContagem(VALOR_FINAL), sofrega = True)
+sol(mec_proc, solucao)
+for custo, nos_expandidos in mec_proc.solucoes:
+    print(f"Custo: {custo}  Nós expandidos: {nos_expandidos}")
+print("")
@@ -20,6 +20,12 @@ from sae.ambiente.elemento import Elemento
     Esta classe encapsula o estado atual, os estados possíveis, os elementos do ambiente e os operadores como atributos 
     privados, acessíveis via propriedades e métodos, e fornece funcionalidades para atualizar o modelo, calcular 
     distâncias e exibir o ambiente.
+
+    Os estados do ambiente, que é uma grelha, têm também uma codificação densa em inteiros: a célula (x, y) tem o número
+    y·dim_x + x, entre 0 e dim_x·dim_y - 1 ('obter_celula' e 'obter_num_celulas'). As células livres são registadas num
+    vetor de bytes indexado pela célula, pelo que a verificação de um estado ('in') é O(1), em vez de percorrer a lista
+    de estados; as procuras com memória em vetores (e.g., 'ProcuraAADensa') usam a mesma codificação para indexar os
+    custos, os antecessores e os estados fechados.
 """
 
 
@@ -36,6 +42,12 @@ class ModeloMundo(ModeloPlan):
         # ambiente, a serem preenchidos com base em percepções.
         self.__estados   = []
 
+        # Inicializa as dimensões da grelha e o vetor de células livres, indexado pela célula de cada posição, que são
+        # calculados a partir das posições do ambiente.
+        self.__dim_x  = 0
+        self.__dim_y  = 0
+        self.__livres = bytearray()
+
         # Define o atributo privado `__alterado` como False, indicando que o modelo não foi modificado desde a última
         # atualização.
         self.__alterado  = False
@@ -61,6 +73,18 @@ class ModeloMundo(ModeloPlan):
         return self.__elementos
 
 
+    # Propriedade que devolve a dimensão X da grelha (número de colunas), usada na codificação das células.
+    @property
+    def dim_x(self):
+        return self.__dim_x
+
+
+    # Propriedade que devolve a dimensão Y da grelha (número de linhas).
+    @property
+    def dim_y(self):
+        return self.__dim_y
+
+
     # Metodo que devolve o estado atual do agente no ambiente.
     # Retorna a instância de `EstadoAgente` que representa a posição atual do agente, essencial para o planeamento e a
     # execução de ações no controle deliberativo.
@@ -88,6 +112,32 @@ class ModeloMundo(ModeloPlan):
         return self.__operadores
 
 
+    # Metodo que devolve os antecessores de um estado, como uma lista de pares (operador, estado antecessor).
+    # Os movimentos são reversíveis: o antecessor por um operador é a posição de onde esse movimento leva ao estado,
+    # obtida com `OperadorMover.aplicar_inverso`.
+    def obter_antecessores(self, estado):
+        antecessores = []
+        for operador in self.__operadores:
+            estado_ant = operador.aplicar_inverso(estado)
+            if estado_ant is not None:
+                antecessores.append((operador, estado_ant))
+        return antecessores
+
+
+    # Metodo que devolve o número de células da grelha, ou seja, o número de inteiros usados na codificação densa dos
+    # estados.
+    def obter_num_celulas(self):
+        return self.__dim_x * self.__dim_y
+
+
+    # Metodo que devolve a célula de um estado, y·dim_x + x, ou None se a posição estiver fora da grelha.
+    def obter_celula(self, estado):
+        x, y = estado.posicao
+        if 0 <= x < self.__dim_x and 0 <= y < self.__dim_y:
+            return y * self.__dim_x + x
+        return None
+
+
     # Metodo que devolve o elemento associado à posição de um estado.
     # Consulta o dicionário de elementos para verificar se há um elemento (como alvo ou obstáculo) na posição do
     # estado fornecido, retornando None se não houver.
@@ -132,6 +182,14 @@ class ModeloMundo(ModeloPlan):
             # atualizando os estados possíveis no ambiente.
             self.__estados = [EstadoAgente(posicao) for posicao in percepcao.posicoes]
 
+            # Calcula as dimensões da grelha a partir das posições do ambiente e marca as células livres no vetor
+            # indexado pela célula.
+            self.__dim_x = max((x for x, _ in percepcao.posicoes), default = -1) + 1
+            self.__dim_y = max((y for _, y in percepcao.posicoes), default = -1) + 1
+            self.__livres = bytearray(self.__dim_x * self.__dim_y)
+            for x, y in percepcao.posicoes:
+                self.__livres[y * self.__dim_x + x] = 1
+
 
     # Metodo que exibe o estado do modelo do mundo em uma interface visual.
     # Itera sobre os elementos do ambiente, exibindo alvos e obstáculos na interface fornecida, e marca a posição
@@ -151,11 +209,14 @@ class ModeloMundo(ModeloPlan):
         vista.marcar_posicao(self.__estado.posicao)
 
 
-    # Este metodo utiliza o operador `in` para determinar se o estado fornecido está presente na lista de estados
-    # possíveis (`__estados`), permitindo verificar a validade de um estado no contexto do ambiente. É essencial
-    # para o planeamento deliberativo, garantindo que apenas estados válidos sejam considerados durante a procura.
+    # Este metodo utiliza o operador `in` para determinar se o estado fornecido é um dos estados possíveis do ambiente,
+    # permitindo verificar a validade de um estado no contexto do ambiente. É essencial para o planeamento deliberativo,
+    # garantindo que apenas estados válidos sejam considerados durante a procura.
+    #
+    # Como é chamado para cada sucessor gerado pelos operadores, a verificação é O(1): a posição do estado é convertida
+    # na sua célula e consultada no vetor de células livres, em vez de percorrer a lista de estados.
     def __contains__(self, estado):
 
-        # Verifica se o estado fornecido está presente na lista de estados possíveis `__estados`, utilizando o operador
-        # `in` para realizar a comparação.
-        return estado in self.__estados
+        # Verifica se a posição está dentro da grelha e se a sua célula está marcada como livre.
+        x, y = estado.posicao
+        return 0 <= x < self.__dim_x and 0 <= y < self.__dim_y and self.__livres[y * self.__dim_x + x] == 1
@@ -91,6 +91,16 @@ class OperadorMover:
             # Retorna o novo estado se for válido, permitindo sua inclusão na procura ou no plano.
             return novo_estado
 
+    # Este metodo calcula o estado antecessor de um estado por este operador, ou seja, o estado a partir do qual a
+    # aplicação do operador produz o estado fornecido. Como os movimentos são reversíveis, a posição antecessora obtém-se
+    # com a translação no sentido oposto. Retorna None se o antecessor não for um estado válido do modelo do mundo.
+    # Ele é usado por procuras que exploram o espaço de estados a partir do objetivo, como `ProcuraBidireccional`.
+    def aplicar_inverso(self, estado):
+        posicao_ant = self.__translacao(estado.posicao, -self.accao.passo, self.ang)
+        estado_ant = EstadoAgente(posicao_ant)
+        if estado_ant in self.__modelo_mundo:
+            return estado_ant
+
     # Este metodo determina o custo da transição com base na distância euclidiana entre as posições dos estados,
     # garantindo um custo mínimo de 1 para evitar custos nulos. Ele é essencial para algoritmos de procura como
     # `ProcuraCustoUnif`, que ordenam nós com base no custo acumulado.
@@ -0,0 +1,57 @@
+import time
+
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.melhor_prim.procura_aa import ProcuraAA
+from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.proc_densa.procura_aa_densa import ProcuraAADensa
+from pee.proc_densa.procura_custo_unif_densa import ProcuraCustoUnifDensa
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para comparar as procuras com memória em vetores indexados pela célula dos estados ('ProcuraAADensa' e
+    'ProcuraCustoUnifDensa') com as procuras em grafos correspondentes ('ProcuraAA' e 'ProcuraCustoUnif').
+
+    Para cada ambiente definido em 'DEF_AMB' são planeados os percursos até aos objetivos selecionados pelo mecanismo de
+    deliberação ('MecDelib'), tal como faz o agente deliberativo em cada replaneamento. Para cada procura são
+    apresentados o total de nós expandidos, o custo total das soluções, que deve ser igual nas duas variantes, e o tempo
+    total de planeamento (em ms).
+"""
+
+
+# Número máximo de objetivos planeados por ambiente.
+MAX_OBJECTIVOS = 3
+
+# Número de repetições de cada procura, para estabilizar a medição do tempo.
+REPETICOES = 5
+
+# Procuras comparadas, com a indicação de usarem a heurística.
+PROCURAS = [(ProcuraAA, True), (ProcuraAADensa, True), (ProcuraCustoUnif, False), (ProcuraCustoUnifDensa, False)]
+
+
+if __name__ == "__main__":
+
+    print(f"{'amb':<5}{'procura':<24}{'expandidos':>12}{'custo':>10}{'ms':>10}")
+
+    for num_amb in DEF_AMB:
+
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]
+
+        for tipo_procura, informada in PROCURAS:
+            expandidos = 0
+            custo = 0
+            inicio = time.perf_counter()
+            for estado_final in objectivos:
+                problema = ProblemaPlan(modelo_mundo, estado_final)
+                argumentos = (HeurDist(estado_final),) if informada else ()
+                for _ in range(REPETICOES):
+                    mec_proc = tipo_procura()
+                    solucao = mec_proc.procurar(problema, *argumentos)
+                expandidos += mec_proc.estatisticas.nos_expandidos
+                custo += solucao.custo
+            tempo = (time.perf_counter() - inicio) / REPETICOES
+
+            print(f"{num_amb:<5}{tipo_procura.__name__:<24}{expandidos:>12}{custo:>10.1f}{tempo * 1000:>10.1f}")
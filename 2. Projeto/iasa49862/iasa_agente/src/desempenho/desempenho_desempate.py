@@ -0,0 +1,58 @@
+from controlo_delib.mec_delib import MecDelib
+from controlo_delib.modelo.modelo_mundo import ModeloMundo
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.procura_aa import ProcuraAA
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.agente.transdutor import Transdutor
+from sae.ambiente.ambiente import Ambiente
+from sae.defamb import DEF_AMB
+
+"""
+    Script para comparar as políticas de desempate ('Desempate') da procura A* com a heurística 'HeurDist' em todos os
+    ambientes definidos em 'DEF_AMB'.
+
+    Para cada ambiente, o modelo do mundo é obtido a partir da percepção inicial e são planeados os percursos até aos
+    objetivos selecionados pelo mecanismo de deliberação ('MecDelib'), tal como faz o agente deliberativo. Para cada
+    política é apresentado o total de nós expandidos e o custo total das soluções, que deve ser igual em todas as
+    políticas, pois o desempate não altera a optimalidade da procura A*.
+"""
+
+
+# Cria o modelo do mundo de um ambiente a partir da sua percepção inicial.
+def criar_modelo_mundo(num_amb):
+    transdutor = Transdutor()
+    transdutor.iniciar(Ambiente(DEF_AMB[num_amb]))
+    modelo_mundo = ModeloMundo()
+    modelo_mundo.actualizar(transdutor.percepcionar())
+    return modelo_mundo
+
+
+# Número máximo de objetivos planeados por ambiente.
+MAX_OBJECTIVOS = 3
+
+
+if __name__ == "__main__":
+
+    print(f"{'amb':<5}" + "".join(f"{desempate.value:>10}" for desempate in Desempate) + f"{'custo':>10}")
+
+    for num_amb in DEF_AMB:
+
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]
+
+        expandidos = {desempate: 0 for desempate in Desempate}
+        custos = {desempate: 0 for desempate in Desempate}
+
+        for estado_final in objectivos:
+            problema = ProblemaPlan(modelo_mundo, estado_final)
+            heuristica = HeurDist(estado_final)
+            for desempate in Desempate:
+                mec_proc = ProcuraAA(desempate = desempate)
+                solucao = mec_proc.procurar(problema, heuristica)
+                expandidos[desempate] += mec_proc.estatisticas.nos_expandidos
+                custos[desempate] += solucao.custo
+
+        assert len(set(custos.values())) == 1
+        print(f"{num_amb:<5}" + "".join(f"{expandidos[desempate]:>10}" for desempate in Desempate)
+              + f"{custos[Desempate.NENHUM]:>10}")
@@ -0,0 +1,60 @@
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.feixe.procura_feixe import ProcuraFeixe
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.procura_aa import ProcuraAA
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para avaliar a procura em feixe ('ProcuraFeixe', com f(n) = g(n) + h(n)) em comparação com a procura A*
+    ('ProcuraAA') em todos os ambientes definidos em 'DEF_AMB'.
+
+    Para cada largura do feixe são apresentados, somados sobre os objetivos de todos os ambientes, o número de
+    objetivos em que o feixe descartou o percurso ótimo (solução mais cara do que a de A*), o número de objetivos sem
+    solução, o total de nós expandidos e o máximo de nós em memória, em comparação com os valores de A*.
+"""
+
+
+# Larguras do feixe avaliadas.
+LARGURAS = [1, 2, 4, 8, 16, 32]
+
+# Número máximo de objetivos planeados por ambiente.
+MAX_OBJECTIVOS = 3
+
+
+if __name__ == "__main__":
+
+    # Problemas de planeamento e custo ótimo de cada um, obtido com A*.
+    problemas = []
+    expandidos_aa = 0
+    memoria_aa = 0
+    for num_amb in DEF_AMB:
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        for estado_final in MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]:
+            problema = ProblemaPlan(modelo_mundo, estado_final)
+            heuristica = HeurDist(estado_final)
+            mec_proc = ProcuraAA()
+            solucao = mec_proc.procurar(problema, heuristica)
+            problemas.append((num_amb, problema, heuristica, solucao.custo))
+            expandidos_aa += mec_proc.estatisticas.nos_expandidos
+            memoria_aa = max(memoria_aa, mec_proc.nos_em_memoria)
+
+    print(f"A*: {len(problemas)} objetivos, {expandidos_aa} nós expandidos, máximo de {memoria_aa} nós em memória")
+    print(f"{'largura':>8}{'podado':>8}{'falhou':>8}{'expandidos':>12}{'memória':>10}")
+
+    for largura in LARGURAS:
+        podados = falhados = expandidos = memoria = 0
+        for num_amb, problema, heuristica, custo_otimo in problemas:
+            mec_proc = ProcuraFeixe(AvaliadorAA(), largura)
+            solucao = mec_proc.procurar(problema, heuristica)
+            if solucao is None:
+                falhados += 1
+            elif solucao.custo > custo_otimo:
+                podados += 1
+                print(f"  largura {largura}: percurso ótimo podado no ambiente {num_amb} "
+                      f"(custo {solucao.custo} > {custo_otimo})")
+            expandidos += mec_proc.estatisticas.nos_expandidos
+            memoria = max(memoria, mec_proc.nos_em_memoria)
+        print(f"{largura:>8}{podados:>8}{falhados:>8}{expandidos:>12}{memoria:>10}")
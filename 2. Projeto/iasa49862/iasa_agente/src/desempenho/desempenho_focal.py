@@ -0,0 +1,43 @@
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.melhor_prim.procura_aa import ProcuraAA
+from pee.melhor_prim.procura_focal import ProcuraFocal
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+
+"""
+    Script para avaliar o compromisso entre tempo de procura e qualidade da solução da procura focal ('ProcuraFocal')
+    no ambiente labiríntico DEF_AMB[4], em comparação com a procura A* ('ProcuraAA').
+
+    Para cada objetivo selecionado pelo mecanismo de deliberação e para cada valor de ε, é apresentado o custo da
+    solução, o número de nós expandidos e o limite de subotimalidade provado (custo / f_min), que nunca excede 1 + ε.
+"""
+
+
+# Ambiente usado na avaliação.
+NUM_AMB = 4
+
+# Valores de ε avaliados.
+EPSILONS = [0, 0.1, 0.25, 0.5, 1.0, 2.0]
+
+
+if __name__ == "__main__":
+
+    modelo_mundo = criar_modelo_mundo(NUM_AMB)
+
+    for estado_final in MecDelib(modelo_mundo).deliberar():
+
+        problema = ProblemaPlan(modelo_mundo, estado_final)
+        heuristica = HeurDist(estado_final)
+
+        mec_proc = ProcuraAA()
+        solucao = mec_proc.procurar(problema, heuristica)
+        print(f"objetivo {estado_final.posicao}: A* custo {solucao.custo}, "
+              f"{mec_proc.estatisticas.nos_expandidos} nós expandidos")
+
+        for epsilon in EPSILONS:
+            mec_proc = ProcuraFocal(epsilon)
+            solucao = mec_proc.procurar(problema, heuristica)
+            assert mec_proc.limite_subotimalidade <= 1 + epsilon + 1e-9
+            print(f"  ε = {epsilon:<5} custo {solucao.custo:>4}  expandidos {mec_proc.estatisticas.nos_expandidos:>6}"
+                  f"  limite {mec_proc.limite_subotimalidade:.3f}  tempo {mec_proc.estatisticas.tempo:.3f} s")
@@ -0,0 +1,85 @@
+import time
+
+from contegem.modelo.problema_contagem import ProblemaContagem
+from pee.larg.fronteira_fifo import FronteiraFIFO
+from pee.larg.procura_largura import ProcuraLargura
+from pee.prof.fronteira_lifo import FronteiraLIFO
+from pee.prof.procura_prof_iter import ProcuraProfIter
+from pee.prof.procura_prof_lim import ProcuraProfLim
+
+"""
+    Script para medir a escalabilidade das fronteiras FIFO e LIFO no 'ProblemaContagem', com 'VALOR_FINAL' crescente.
+
+    Compara as fronteiras atuais ('FronteiraFIFO' e 'FronteiraLIFO', suportadas por uma 'deque' com inserção e remoção
+    O(1)) com réplicas das fronteiras anteriores, suportadas por uma lista com 'pop(0)' e 'insert(0, ...)' em O(n).
+
+    Para cada valor final é apresentada a solução (dimensão e custo, que devem coincidir entre as duas versões, pois a
+    ordem de expansão é a mesma), o número de nós processados, a dimensão máxima da fronteira e o tempo de procura.
+"""
+
+
+# Réplica da fronteira FIFO anterior, com remoção O(n) do início de uma lista.
+class FronteiraFIFOLista(FronteiraFIFO):
+
+    def iniciar(self):
+        self._nos = []
+
+    def remover(self):
+        return self._nos.pop(0)
+
+
+# Réplica da fronteira LIFO anterior, com inserção O(n) no início de uma lista.
+class FronteiraLIFOLista(FronteiraLIFO):
+
+    def iniciar(self):
+        self._nos = []
+
+    def inserir(self, no):
+        self._nos.insert(0, no)
+
+    def remover(self):
+        return self._nos.pop(0)
+
+
+# Executa uma procura com o mecanismo indicado e apresenta uma linha com os resultados.
+def medir(nome, mec_proc, problema, *args):
+    inicio = time.perf_counter()
+    solucao = mec_proc.procurar(problema, *args)
+    tempo = time.perf_counter() - inicio
+    estatisticas = mec_proc.estatisticas
+    print(f"  {nome:<22}{solucao.dimensao:>6}{solucao.custo:>8}{mec_proc.nos_processados:>12}"
+          f"{estatisticas.max_fronteira:>10}{tempo:>10.3f}")
+
+
+# Incrementos do problema de contagem.
+INCREMENTOS = [1, 2, -1]
+
+# Valores finais crescentes; a procura em largura em árvore cresce exponencialmente com a profundidade da solução.
+VALORES_FINAIS = [10, 12, 14, 16, 18, 20, 22]
+
+
+if __name__ == "__main__":
+
+    for valor_final in VALORES_FINAIS:
+
+        problema = ProblemaContagem(0, valor_final, INCREMENTOS)
+        prof_max = (valor_final + 1) // 2
+
+        print(f"VALOR_FINAL = {valor_final}")
+        print(f"  {'procura':<22}{'dim':>6}{'custo':>8}{'nós':>12}{'fronteira':>10}{'tempo':>10}")
+
+        mec_proc = ProcuraLargura()
+        mec_proc._fronteira = FronteiraFIFOLista()
+        medir("largura (lista)", mec_proc, problema)
+        medir("largura (deque)", ProcuraLargura(), problema)
+
+        mec_proc = ProcuraProfLim(prof_max)
+        mec_proc._fronteira = FronteiraLIFOLista()
+        medir("prof. limitada (lista)", mec_proc, problema)
+        medir("prof. limitada (deque)", ProcuraProfLim(prof_max), problema)
+
+        mec_proc = ProcuraProfIter()
+        mec_proc._fronteira = FronteiraLIFOLista()
+        medir("prof. iter. (lista)", mec_proc, problema, 1, prof_max)
+        medir("prof. iter. (deque)", ProcuraProfIter(), problema, 1, prof_max)
+        print("")
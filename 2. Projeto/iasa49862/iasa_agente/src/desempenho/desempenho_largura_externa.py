@@ -0,0 +1,55 @@
+import tracemalloc
+
+from contegem.modelo.problema_contagem import ProblemaContagem
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.larg.procura_largura_externa import ProcuraLarguraExterna
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para dimensionar a procura em largura em memória externa ('ProcuraLarguraExterna').
+
+    São resolvidos problemas de contagem com valores finais crescentes e o primeiro objetivo de cada ambiente definido
+    em 'DEF_AMB', com blocos de 'DIM_BLOCO' registos. Para cada problema são apresentados a dimensão da solução, os nós
+    expandidos, a maior camada, o máximo de registos em memória, o volume de dados escritos e lidos (em KiB) e o pico de
+    memória alocada pelo Python durante a procura (em KiB, medido com 'tracemalloc'), que depende da dimensão do bloco e
+    não da dimensão das camadas.
+"""
+
+
+# Dimensão dos blocos de sucessores mantidos em memória (número de registos).
+DIM_BLOCO = 1000
+
+# Valores finais dos problemas de contagem.
+VALORES_FINAIS = [100, 200, 400]
+
+# Incrementos dos problemas de contagem.
+INCREMENTOS = [1, 2, -1]
+
+
+# Resolve um problema e apresenta as métricas da procura.
+def medir(nome, problema):
+    mec_proc = ProcuraLarguraExterna(DIM_BLOCO)
+    tracemalloc.start()
+    solucao = mec_proc.procurar(problema)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    estatisticas = mec_proc.estatisticas
+    print(f"{nome:<16}{solucao.dimensao:>6}{estatisticas.nos_expandidos:>12}{estatisticas.max_fronteira:>10}"
+          f"{estatisticas.max_memoria:>10}{mec_proc.bytes_escritos // 1024:>12}{mec_proc.bytes_lidos // 1024:>12}"
+          f"{pico // 1024:>10}")
+
+
+if __name__ == "__main__":
+
+    print(f"{'problema':<16}{'dim':>6}{'expandidos':>12}{'camada':>10}{'registos':>10}{'escritos':>12}{'lidos':>12}"
+          f"{'pico':>10}")
+
+    for valor_final in VALORES_FINAIS:
+        medir(f"contagem {valor_final}", ProblemaContagem(0, valor_final, INCREMENTOS))
+
+    for num_amb in DEF_AMB:
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        estado_final = MecDelib(modelo_mundo).deliberar()[0]
+        medir(f"amb {num_amb}", ProblemaPlan(modelo_mundo, estado_final))
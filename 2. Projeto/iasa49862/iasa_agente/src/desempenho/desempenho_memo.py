@@ -0,0 +1,84 @@
+import math
+import time
+
+from controlo_delib.mec_delib import MecDelib
+from controlo_delib.modelo.modelo_mundo import ModeloMundo
+from pee.melhor_prim.procura_aa import ProcuraAA
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from plan.plan_pee.planeador_pee import PlaneadorPEE
+from sae.agente.transdutor import Transdutor
+from sae.ambiente.ambiente import Ambiente
+from sae.defamb import DEF_AMB
+
+"""
+    Script para medir a memorização da heurística ('HeuristicaMemo') nas procuras A* dos ambientes definidos em
+    'DEF_AMB', com a heurística 'HeurDist'.
+
+    São feitas duas medições por ambiente:
+    - Em cada procura: a procura A* é executada para os objetivos selecionados pelo mecanismo de deliberação, com a
+      memorização ativa no avaliador ('ProcuraInformada.dim_memo'), e são apresentadas as consultas à heurística, a
+      taxa de acertos da memória (consultas poupadas à heurística original) e o tempo, comparado com a procura sem
+      memorização.
+    - Entre replaneamentos: o agente executa o primeiro passo de cada plano e replaneia para o mesmo objetivo até o
+      alcançar, como o agente deliberativo, com o 'PlaneadorPEE' a manter a memória entre planeamentos; é apresentada a
+      taxa de acertos acumulada.
+"""
+
+
+# Número máximo de objetivos por ambiente.
+MAX_OBJECTIVOS = 3
+
+
+# Cria o transdutor e o modelo do mundo de um ambiente a partir da sua percepção inicial.
+def criar_agente(num_amb):
+    transdutor = Transdutor()
+    transdutor.iniciar(Ambiente(DEF_AMB[num_amb]))
+    modelo_mundo = ModeloMundo()
+    modelo_mundo.actualizar(transdutor.percepcionar())
+    return transdutor, modelo_mundo
+
+
+# Executa a procura A* para cada objetivo, com ou sem memorização, devolvendo o tempo total (em ms), as consultas e os
+# acertos da memória.
+def medir_procuras(modelo_mundo, objectivos, dim_memo):
+    consultas = acertos = 0
+    inicio = time.perf_counter()
+    for estado_final in objectivos:
+        mec_proc = ProcuraAA()
+        mec_proc.dim_memo = dim_memo
+        mec_proc.procurar(ProblemaPlan(modelo_mundo, estado_final), HeurDist(estado_final))
+        if dim_memo is not None:
+            consultas += mec_proc.heuristica.consultas
+            acertos += mec_proc.heuristica.acertos
+    return (time.perf_counter() - inicio) * 1000, consultas, acertos
+
+
+# Replaneia em cada passo até alcançar o objetivo, devolvendo o número de planeamentos e a taxa de acertos acumulada.
+def medir_replaneamento(transdutor, modelo_mundo, estado_final):
+    planeador = PlaneadorPEE(dim_memo = math.inf)
+    planeamentos = 0
+    while modelo_mundo.obter_estado() != estado_final:
+        plano = planeador.planear(modelo_mundo, [estado_final])
+        planeamentos += 1
+        transdutor.actuar(plano.obter_accao(modelo_mundo.obter_estado()).accao)
+        modelo_mundo.actualizar(transdutor.percepcionar())
+    return planeamentos, planeador.heuristica.taxa_acertos if planeador.heuristica else 0
+
+
+if __name__ == "__main__":
+
+    print(f"{'amb':<5}{'consultas':>11}{'acertos':>9}{'ms sem':>9}{'ms com':>9}"
+          f"{'replaneamentos':>16}{'acertos':>9}")
+
+    for num_amb in DEF_AMB:
+
+        transdutor, modelo_mundo = criar_agente(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]
+
+        tempo_sem, _, _ = medir_procuras(modelo_mundo, objectivos, None)
+        tempo_com, consultas, acertos = medir_procuras(modelo_mundo, objectivos, math.inf)
+        planeamentos, taxa = medir_replaneamento(transdutor, modelo_mundo, objectivos[0])
+
+        print(f"{num_amb:<5}{consultas:>11}{acertos / consultas:>9.1%}{tempo_sem:>9.1f}{tempo_com:>9.1f}"
+              f"{planeamentos:>16}{taxa:>9.1%}")
@@ -0,0 +1,127 @@
+import time
+import tracemalloc
+
+import pee.mec_proc.mecanismo_procura as mecanismo_procura
+from contegem.modelo.problema_contagem import ProblemaContagem
+from pee.larg.procura_largura import ProcuraLargura
+from pee.mec_proc.no import No
+
+"""
+    Script para medir o custo de criação de nós de procura, comparando o nó compacto atual ('No', com '__slots__' e
+    sem finalizador) com uma réplica do nó anterior ('NoAntigo', com '__dict__' por instância, propriedades de acesso e
+    finalizador '__del__').
+
+    São apresentadas duas métricas para cada tipo de nó:
+    - Bytes por nó, medidos com 'tracemalloc' ao criar uma cadeia de nós.
+    - Nós por segundo, tanto na criação isolada de nós como numa procura em largura sobre o 'ProblemaContagem'.
+"""
+
+
+# Réplica do nó anterior, mantida apenas para comparação: cada instância tem um '__dict__', os atributos são acedidos
+# através de propriedades e o finalizador atualiza um contador de classe sempre que um nó é libertado.
+class NoAntigo:
+
+    nos_eleminados = 0
+
+    def __init__(self, estado, operador = None, antecessor = None, custo = 0):
+        self.__prioridade = 0
+        self.__estado = estado
+        self.__operador = operador
+        self.__antecessor = antecessor
+        self.__profundidade = 0 if antecessor is None else antecessor.profundidade + 1
+        self.__custo = custo
+
+    @property
+    def estado(self):
+        return self.__estado
+
+    @property
+    def operador(self):
+        return self.__operador
+
+    @property
+    def antecessor(self):
+        return self.__antecessor
+
+    @property
+    def profundidade(self):
+        return self.__profundidade
+
+    @property
+    def custo(self):
+        return self.__custo
+
+    @property
+    def prioridade(self):
+        return self.__prioridade
+
+    @prioridade.setter
+    def prioridade(self, value):
+        self.__prioridade = value
+
+    def __lt__(self, other):
+        return self.prioridade < other.prioridade
+
+    def __del__(self):
+        NoAntigo.nos_eleminados += 1
+
+
+# Cria uma cadeia de 'num_nos' nós do tipo indicado, em que cada nó tem o anterior como antecessor.
+def criar_cadeia(tipo_no, num_nos):
+    no = tipo_no(0)
+    for i in range(1, num_nos):
+        no = tipo_no(i, None, no, no.custo + 1)
+    return no
+
+
+# Mede os bytes alocados por nó ao criar uma cadeia de nós, usando 'tracemalloc'.
+def bytes_por_no(tipo_no, num_nos):
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    cadeia = criar_cadeia(tipo_no, num_nos)
+    fim, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # A cadeia é libertada iterativamente para não esgotar a pilha de recursão na libertação encadeada.
+    while cadeia is not None:
+        cadeia = cadeia.antecessor
+
+    return (fim - inicio) / num_nos
+
+
+# Mede o número de nós criados (e libertados) por segundo.
+def nos_por_segundo(tipo_no, num_nos):
+    inicio = time.perf_counter()
+    for _ in range(num_nos // 1000):
+        criar_cadeia(tipo_no, 1000)
+    return num_nos / (time.perf_counter() - inicio)
+
+
+# Mede o número de nós gerados por segundo numa procura em largura, usando o tipo de nó indicado no mecanismo de
+# procura.
+def procura_nos_por_segundo(tipo_no, problema):
+    mecanismo_procura.No = tipo_no
+    try:
+        mec_proc = ProcuraLargura()
+        inicio = time.perf_counter()
+        mec_proc.procurar(problema)
+        return mec_proc.nos_processados / (time.perf_counter() - inicio)
+    finally:
+        mecanismo_procura.No = No
+
+
+# Número de nós criados em cada medição.
+NUM_NOS = 200_000
+
+# Problema de contagem usado para medir o desempenho da procura em largura.
+PROBLEMA = ProblemaContagem(0, 12, [1, 2, -1])
+
+
+if __name__ == "__main__":
+
+    print(f"{'Nó':<10}{'bytes/nó':>12}{'nós/s':>14}{'procura nós/s':>16}")
+    for nome, tipo_no in [("NoAntigo", NoAntigo), ("No", No)]:
+        print(f"{nome:<10}"
+              f"{bytes_por_no(tipo_no, NUM_NOS):>12.1f}"
+              f"{nos_por_segundo(tipo_no, NUM_NOS):>14.0f}"
+              f"{procura_nos_por_segundo(tipo_no, PROBLEMA):>16.0f}")
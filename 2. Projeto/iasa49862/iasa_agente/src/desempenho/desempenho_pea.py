@@ -0,0 +1,61 @@
+from contegem.modelo.heur_contagem import HeurContagem
+from contegem.modelo.problema_contagem import ProblemaContagem
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.melhor_prim.procura_aa import ProcuraAA
+from pee.melhor_prim.procura_aa_parcial import ProcuraAAParcial
+from plan.plan_pee.mod_prob.heur_dist import HeurDist
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para comparar a procura A* com expansão parcial ('ProcuraAAParcial') com a procura A* ('ProcuraAA').
+
+    São usados problemas de contagem com um número crescente de incrementos (fator de ramificação elevado), onde a
+    maior parte dos sucessores gerados pela procura A* nunca é expandida, e os problemas de planeamento de todos os
+    ambientes definidos em 'DEF_AMB', com quatro operadores por estado. Para cada procura são apresentados os nós
+    gerados (todos os sucessores construídos, incluindo os descartados), os nós expandidos, o máximo de nós guardados em
+    memória e, para a expansão parcial, as reinserções. A expansão parcial reduz a memória, à custa de mais nós gerados
+    nas reexpansões. O custo das soluções tem de ser igual nas duas procuras.
+"""
+
+
+# Valor final dos problemas de contagem.
+VALOR_FINAL = 200
+
+# Maiores incrementos dos problemas de contagem (incrementos de -1 até ao valor indicado).
+MAX_INCREMENTOS = [5, 20, 50, 100]
+
+# Número máximo de objetivos planeados por ambiente.
+MAX_OBJECTIVOS = 3
+
+
+# Resolve um problema com ambas as procuras e apresenta as métricas de cada uma.
+def comparar(nome, problema, heuristica):
+    resultados = []
+    for mec_proc in (ProcuraAA(), ProcuraAAParcial()):
+        solucao = mec_proc.procurar(problema, heuristica)
+        estatisticas = mec_proc.estatisticas
+        resultados.append((solucao.custo, estatisticas))
+    assert resultados[0][0] == resultados[1][0]
+    (custo, aa), (_, pea) = resultados
+    print(f"{nome:<14}{custo:>8}{aa.nos_gerados:>10}{aa.nos_expandidos:>10}{aa.max_memoria:>10}"
+          f"{pea.nos_gerados:>10}{pea.nos_expandidos:>10}{pea.max_memoria:>10}{pea.nos_reinseridos:>10}")
+
+
+if __name__ == "__main__":
+
+    print(f"{'':<14}{'':>8}{'A*':>30}{'PEA*':>40}")
+    print(f"{'problema':<14}{'custo':>8}" + f"{'gerados':>10}{'expandidos':>10}{'memória':>10}" * 2
+          + f"{'reinser.':>10}")
+
+    for max_incremento in MAX_INCREMENTOS:
+        incrementos = [-1] + list(range(1, max_incremento + 1))
+        problema = ProblemaContagem(0, VALOR_FINAL, incrementos)
+        comparar(f"contagem {len(incrementos)}", problema, HeurContagem(VALOR_FINAL))
+
+    for num_amb in DEF_AMB:
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        for num_obj, estado_final in enumerate(MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]):
+            problema = ProblemaPlan(modelo_mundo, estado_final)
+            comparar(f"amb {num_amb} obj {num_obj}", problema, HeurDist(estado_final))
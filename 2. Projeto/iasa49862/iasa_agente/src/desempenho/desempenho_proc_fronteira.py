@@ -0,0 +1,54 @@
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.proc_fronteira.procura_custo_unif_fronteira import ProcuraCustoUnifFronteira
+from pee.proc_fronteira.procura_largura_fronteira import ProcuraLarguraFronteira
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para comparar as procuras de fronteira ('ProcuraLarguraFronteira' e 'ProcuraCustoUnifFronteira'), sem lista
+    de fechados, com a procura de custo uniforme ('ProcuraCustoUnif') em todos os ambientes definidos em 'DEF_AMB'.
+
+    A 'ProcuraLargura' não é incluída por ser uma procura em árvore, sem deteção de estados repetidos, o que nas grelhas
+    do modelo do mundo cresce exponencialmente; com custos unitários, a procura em largura de fronteira encontra
+    soluções do mesmo custo que a procura de custo uniforme.
+
+    Para cada procura são apresentados, somados sobre os objetivos de cada ambiente, o máximo de nós em memória e o
+    total de nós expandidos, que nas procuras de fronteira inclui as procuras de reconstrução do percurso. O custo das
+    soluções tem de ser igual em todas as procuras.
+"""
+
+
+# Número máximo de objetivos planeados por ambiente.
+MAX_OBJECTIVOS = 3
+
+# Procuras comparadas.
+PROCURAS = [("custo unif.", ProcuraCustoUnif), ("largura fr.", ProcuraLarguraFronteira),
+            ("custo unif. fr.", ProcuraCustoUnifFronteira)]
+
+
+if __name__ == "__main__":
+
+    print(f"{'':<5}" + "".join(f"{nome:>24}" for nome, _ in PROCURAS))
+    print(f"{'amb':<5}" + f"{'memória':>12}{'expandidos':>12}" * len(PROCURAS))
+
+    for num_amb in DEF_AMB:
+
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        objectivos = MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]
+
+        memoria = [0] * len(PROCURAS)
+        expandidos = [0] * len(PROCURAS)
+        for estado_final in objectivos:
+            problema = ProblemaPlan(modelo_mundo, estado_final)
+            custos = set()
+            for i, (_, procura) in enumerate(PROCURAS):
+                mec_proc = procura()
+                solucao = mec_proc.procurar(problema)
+                custos.add(solucao.custo)
+                memoria[i] = max(memoria[i], mec_proc.nos_em_memoria)
+                expandidos[i] += mec_proc.estatisticas.nos_expandidos
+            assert len(custos) == 1
+
+        print(f"{num_amb:<5}" + "".join(f"{memoria[i]:>12}{expandidos[i]:>12}" for i in range(len(PROCURAS))))
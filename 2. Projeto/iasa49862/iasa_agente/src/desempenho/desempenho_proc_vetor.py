@@ -0,0 +1,62 @@
+import time
+import tracemalloc
+
+from contegem.modelo.problema_contagem import ProblemaContagem
+from controlo_delib.mec_delib import MecDelib
+from desempenho.desempenho_desempate import criar_modelo_mundo
+from pee.larg.procura_largura import ProcuraLargura
+from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.proc_vetor.procura_custo_unif_vetor import ProcuraCustoUnifVetor
+from pee.proc_vetor.procura_largura_vetor import ProcuraLarguraVetor
+from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
+from sae.defamb import DEF_AMB
+
+"""
+    Script para comparar as procuras com nós em vetores paralelos ('ProcuraLarguraVetor' e 'ProcuraCustoUnifVetor')
+    com as procuras correspondentes com objetos 'No' ('ProcuraLargura' e 'ProcuraCustoUnif').
+
+    A procura em largura é comparada em problemas de contagem com valores finais crescentes e a procura de custo
+    uniforme nos objetivos de cada ambiente definido em 'DEF_AMB'. Para cada procura são apresentados o custo da
+    solução, os nós gerados, o tempo (em ms), o pico de memória alocada pelo Python durante a procura (em KiB, medido
+    com 'tracemalloc') e os bytes por nó gerado, que incluem os estados gerados pelo problema, comuns às duas procuras.
+"""
+
+
+# Valores finais dos problemas de contagem.
+VALORES_FINAIS = [10, 11, 12]
+
+# Incrementos dos problemas de contagem.
+INCREMENTOS = [1, 2, -1]
+
+# Número máximo de objetivos de cada ambiente.
+MAX_OBJECTIVOS = 3
+
+
+# Resolve um problema com a procura indicada e apresenta as métricas da procura.
+def medir(nome, mec_proc, problema):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    solucao = mec_proc.procurar(problema)
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nos_gerados = mec_proc.estatisticas.nos_gerados
+    print(f"{nome:<16}{type(mec_proc).__name__:<24}{solucao.custo:>8.1f}{nos_gerados:>10}{tempo * 1000:>10.1f}"
+          f"{pico // 1024:>10}{pico / nos_gerados:>10.1f}")
+
+
+if __name__ == "__main__":
+
+    print(f"{'problema':<16}{'procura':<24}{'custo':>8}{'gerados':>10}{'ms':>10}{'pico':>10}{'bytes/nó':>10}")
+
+    for valor_final in VALORES_FINAIS:
+        problema = ProblemaContagem(0, valor_final, INCREMENTOS)
+        for mec_proc in [ProcuraLargura(), ProcuraLarguraVetor()]:
+            medir(f"contagem {valor_final}", mec_proc, problema)
+
+    for num_amb in DEF_AMB:
+        modelo_mundo = criar_modelo_mundo(num_amb)
+        for estado_final in MecDelib(modelo_mundo).deliberar()[:MAX_OBJECTIVOS]:
+            problema = ProblemaPlan(modelo_mundo, estado_final)
+            for mec_proc in [ProcuraCustoUnif(), ProcuraCustoUnifVetor()]:
+                medir(f"amb {num_amb}", mec_proc, problema)
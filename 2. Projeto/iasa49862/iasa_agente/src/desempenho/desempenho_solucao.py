@@ -0,0 +1,82 @@
+import time
+
+from pee.mec_proc.no import No
+from pee.mec_proc.passo_solucao import PassoSolucao
+from pee.mec_proc.solucao import Solucao
+from plan.plano_pee import PlanoPEE
+
+"""
+    Script para medir o custo de construir uma solução e de executar o plano correspondente em função da dimensão do
+    percurso, comparando a solução e o plano atuais ('Solucao', com reconstrução linear e passos diferidos, e 'PlanoPEE',
+    com cursor) com réplicas das versões anteriores ('SolucaoAntiga', que insere cada passo no início da lista, e
+    'PlanoAntigo', que copia os passos e remove o primeiro em cada ação).
+
+    Para cada dimensão é apresentado o tempo (em ms) de construir a solução a partir do nó final, criar o plano e obter
+    todas as ações do plano, como faz o agente deliberativo ao executar um plano longo.
+"""
+
+
+# Réplica da solução anterior, mantida apenas para comparação: o percurso é reconstruído na criação, inserindo cada
+# passo no início da lista (O(n²) na dimensão do percurso).
+class SolucaoAntiga:
+
+    def __init__(self, no_final):
+        self.__passos = []
+        no = no_final
+        while no.antecessor:
+            self.__passos.insert(0, PassoSolucao(no.antecessor.estado, no.operador))
+            no = no.antecessor
+
+    def __iter__(self):
+        return iter(self.__passos)
+
+
+# Réplica do plano anterior, mantida apenas para comparação: copia os passos da solução e remove o primeiro em cada
+# ação (O(n) por ação).
+class PlanoAntigo:
+
+    def __init__(self, solucao):
+        self.__passos = [passo for passo in solucao]
+
+    def obter_accao(self, estado):
+        if self.__passos:
+            passo = self.__passos.pop(0)
+            if passo.estado == estado:
+                return passo.operador
+
+    @property
+    def dimensao(self):
+        return len(self.__passos)
+
+
+# Cria uma cadeia de nós com a dimensão indicada, em que o estado de cada nó é a sua profundidade e o operador é a
+# profundidade do nó antecessor.
+def criar_cadeia(dimensao):
+    no = No(0)
+    for i in range(1, dimensao + 1):
+        no = No(i, i - 1, no, no.custo + 1)
+    return no
+
+
+# Mede o tempo (em ms) de construir a solução, criar o plano e obter todas as ações do plano.
+def medir(tipo_solucao, tipo_plano, no_final):
+    inicio = time.perf_counter()
+    plano = tipo_plano(tipo_solucao(no_final))
+    estado = 0
+    while plano.dimensao:
+        estado = plano.obter_accao(estado) + 1
+    return (time.perf_counter() - inicio) * 1000
+
+
+# Dimensões dos percursos medidos.
+DIMENSOES = [100, 1000, 10000, 50000]
+
+
+if __name__ == "__main__":
+
+    print(f"{'dimensão':<10}{'anterior':>12}{'atual':>12}")
+    for dimensao in DIMENSOES:
+        no_final = criar_cadeia(dimensao)
+        print(f"{dimensao:<10}"
+              f"{medir(SolucaoAntiga, PlanoAntigo, no_final):>12.1f}"
+              f"{medir(Solucao, PlanoPEE, no_final):>12.1f}")
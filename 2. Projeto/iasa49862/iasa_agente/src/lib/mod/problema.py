@@ -56,3 +56,35 @@ class Problema(ABC):
     def objectivo(self, estado):
         """Abstract Method"""
 
+
+    # Propriedade que devolve o estado final (objetivo) do problema, quando o objetivo é um único estado.
+    #
+    # Só é necessária para mecanismos de procura que exploram o espaço de estados para trás, como
+    # 'ProcuraBidireccional'; por omissão devolve None, indicando que o objetivo não é um único estado conhecido.
+    @property
+    def estado_final(self):
+        return None
+
+
+    # Metodo que devolve os antecessores de um estado, como uma lista de pares (operador, estado antecessor) tais que a
+    # aplicação do operador ao estado antecessor produz o estado indicado.
+    #
+    # Só é necessário para mecanismos de procura que exploram o espaço de estados para trás, como
+    # 'ProcuraBidireccional'; por omissão devolve None, indicando que o problema não fornece os antecessores.
+    def antecessores(self, estado):
+        return None
+
+
+    # Metodo que devolve o número de códigos da codificação densa dos estados, em que cada estado corresponde a um
+    # inteiro entre 0 e o número de códigos - 1.
+    #
+    # Só é necessário para mecanismos de procura que guardam a memória em vetores indexados pelo código do estado, como
+    # 'ProcuraAADensa'; por omissão devolve None, indicando que o problema não tem codificação densa.
+    def num_codigos(self):
+        return None
+
+
+    # Metodo que devolve o código (inteiro) de um estado na codificação densa; opcional, como 'num_codigos' (por
+    # omissão devolve None).
+    def codigo(self, estado):
+        return None
@@ -0,0 +1,178 @@
+import math
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+
+"""
+    Classe 'ProcuraBidireccional', derivada de 'MecanismoProcura', responsável por implementar a procura bidirecional
+    para problemas com um único estado objetivo.
+
+    A procura avança em simultâneo a partir do estado inicial (procura para a frente, com os operadores do problema) e a
+    partir do estado final (procura para trás, com 'Problema.antecessores'), expandindo em cada passo o lado com a menor
+    fronteira. O problema tem de disponibilizar o estado objetivo em 'Problema.estado_final' e os antecessores de um
+    estado em 'Problema.antecessores', como faz 'ProblemaPlan' através do modelo do mundo, cujos movimentos são
+    reversíveis; caso contrário, a procura gera 'ValueError'.
+
+    Sem heurística, cada lado é uma procura de custo uniforme (com custos unitários, equivale à procura em largura); com
+    heurísticas, cada lado é uma procura A* dirigida ao extremo oposto (bidirecional "front-to-end"), usando
+    'heuristica' (até ao estado final) para a frente e 'heuristica_inversa' (até ao estado inicial) para trás. As
+    heurísticas só são usadas se forem fornecidas ambas.
+
+    Sempre que é gerado um nó cujo estado já foi alcançado pelo outro lado, é atualizado o custo 'mu' do melhor percurso
+    conhecido que passa por esse estado. A procura termina quando nenhum percurso ainda por descobrir pode ser mais
+    barato do que 'mu':
+    - sem heurística, quando a soma dos menores custos das duas fronteiras não é inferior a 'mu';
+    - com heurísticas admissíveis e consistentes, quando o maior dos menores f(n) das duas fronteiras não é inferior a
+      'mu'.
+    As duas metades do percurso são então unidas numa 'Solucao' normal, desde o estado inicial até ao estado final.
+"""
+
+class ProcuraBidireccional(MecanismoProcura):
+
+    # Inicializa uma instância da procura bidirecional; as fronteiras são criadas em cada procura, de acordo com as
+    # heurísticas fornecidas.
+    def __init__(self):
+        super().__init__(None)
+
+
+    # Inicializa a memória de ambos os lados da procura: fronteira e nós por estado ('_explorados_frente' e
+    # '_explorados_tras').
+    def _iniciar_memoria(self):
+        self._fronteira.iniciar()
+        self._fronteira_tras.iniciar()
+        self._explorados_frente = {}
+        self._explorados_tras = {}
+
+
+    # Número de nós guardados pela procura, em ambos os lados.
+    def _nos_memoria(self, no):
+        return len(self._explorados_frente) + len(self._explorados_tras)
+
+
+    # A procura mantém os nós por estado de cada lado, de que precisa para unir os percursos, pelo que não aceita o
+    # filtro de estados visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura bidirecional para o problema, devolvendo a solução de menor custo ou None se não existir. Gera
+    # 'ValueError' se o problema não fornecer o estado final ou os antecessores dos estados.
+    def procurar(self, problema, heuristica = None, heuristica_inversa = None):
+
+        # Verifica que o problema permite a procura para trás, a partir do estado final.
+        if problema.estado_final is None:
+            raise ValueError(f"a procura '{type(self).__name__}' requer um problema com um único estado final "
+                             f"('Problema.estado_final')")
+        if problema.antecessores(problema.estado_final) is None:
+            raise ValueError(f"a procura '{type(self).__name__}' requer um problema que forneça os antecessores dos "
+                             f"estados ('Problema.antecessores')")
+
+        # Cria as fronteiras de ambos os lados, ordenadas por g(n) ou, com as duas heurísticas, por f(n) = g(n) + h(n).
+        heuristica_ativa = heuristica is not None and heuristica_inversa is not None
+        self._fronteira = FronteiraPrioridade(self.__avaliador(heuristica if heuristica_ativa else None))
+        self._fronteira_tras = FronteiraPrioridade(self.__avaliador(heuristica_inversa if heuristica_ativa else None))
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+
+        # Melhor percurso conhecido: custo e par de nós (para a frente, para trás) do estado de encontro.
+        self.__mu = math.inf
+        self.__encontro = None
+
+        self.__memorizar(No(problema.estado_inicial), self._fronteira, self._explorados_frente,
+                         self._explorados_tras, True)
+        self.__memorizar(No(problema.estado_final), self._fronteira_tras, self._explorados_tras,
+                         self._explorados_frente, False)
+        estatisticas.nos_gerados += 2
+
+        while not self._fronteira.vazia and not self._fronteira_tras.vazia:
+
+            # Critério de paragem: nenhum percurso por descobrir pode melhorar 'mu'.
+            minimo_frente = self._fronteira.consultar().prioridade
+            minimo_tras = self._fronteira_tras.consultar().prioridade
+            limite = max(minimo_frente, minimo_tras) if heuristica_ativa else minimo_frente + minimo_tras
+            if limite >= self.__mu:
+                break
+
+            # Expande o lado com a menor fronteira.
+            if self._fronteira.dimensao <= self._fronteira_tras.dimensao:
+                no = self._fronteira.remover()
+                sucessores = self._expandir(problema, no)
+                fronteira, explorados, explorados_outro, frente = \
+                    self._fronteira, self._explorados_frente, self._explorados_tras, True
+            else:
+                no = self._fronteira_tras.remover()
+                sucessores = self._expandir_tras(problema, no)
+                fronteira, explorados, explorados_outro, frente = \
+                    self._fronteira_tras, self._explorados_tras, self._explorados_frente, False
+
+            estatisticas.nos_expandidos += 1
+            estatisticas.nos_gerados += len(sucessores)
+            for no_sucessor in sucessores:
+                self.__memorizar(no_sucessor, fronteira, explorados, explorados_outro, frente)
+
+            estatisticas.actualizar_memoria(self._fronteira.dimensao + self._fronteira_tras.dimensao,
+                                            self._nos_memoria(no))
+
+        estatisticas.terminar()
+        if self.__encontro is None:
+            return None
+        return Solucao(self.__unir(*self.__encontro))
+
+
+    # Expande um nó da procura para trás, gerando um nó para cada antecessor do seu estado. Na procura para trás, o
+    # antecessor de um nó é o nó seguinte no percurso até ao estado final, e o operador é o que leva do estado do nó ao
+    # estado do seu antecessor.
+    def _expandir_tras(self, problema, no):
+        sucessores = []
+        for operador, estado_ant in problema.antecessores(no.estado):
+            custo = no.custo + operador.custo(estado_ant, no.estado)
+            sucessores.append(No(estado_ant, operador, no, custo))
+        return sucessores
+
+
+    # Memoriza um nó de um dos lados se for o primeiro ou o de menor custo para o seu estado, e atualiza o melhor
+    # percurso se o estado já tiver sido alcançado pelo outro lado.
+    def __memorizar(self, no, fronteira, explorados, explorados_outro, frente):
+
+        existente = explorados.get(no.estado)
+        if existente is not None and existente.custo <= no.custo:
+            self._estatisticas.nos_podados += 1
+            return
+
+        explorados[no.estado] = no
+        fronteira.inserir(no)
+
+        no_outro = explorados_outro.get(no.estado)
+        if no_outro is not None and no.custo + no_outro.custo < self.__mu:
+            self.__mu = no.custo + no_outro.custo
+            self.__encontro = (no, no_outro) if frente else (no_outro, no)
+
+
+    # Une o nó da procura para a frente e o nó da procura para trás do estado de encontro, acrescentando ao percurso do
+    # primeiro os passos do segundo até ao estado final, e devolve o nó final do percurso completo.
+    @staticmethod
+    def __unir(no_frente, no_tras):
+        no = no_frente
+        while no_tras.antecessor is not None:
+            estado_seguinte = no_tras.antecessor.estado
+            operador = no_tras.operador
+            no = No(estado_seguinte, operador, no, no.custo + operador.custo(no.estado, estado_seguinte))
+            no_tras = no_tras.antecessor
+        return no
+
+
+    # Devolve o avaliador de um dos lados: A* com a heurística, se existir, ou custo uniforme.
+    @staticmethod
+    def __avaliador(heuristica):
+        if heuristica is None:
+            return AvaliadorCustoUnif()
+        avaliador = AvaliadorAA()
+        avaliador.heuristica = heuristica
+        return avaliador
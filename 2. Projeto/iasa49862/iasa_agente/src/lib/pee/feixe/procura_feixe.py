@@ -0,0 +1,108 @@
+import heapq
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_heur import AvaliadorHeur
+
+"""
+    Classe 'ProcuraFeixe', derivada de 'MecanismoProcura', responsável por implementar a procura em feixe (Beam Search).
+
+    A procura avança por camadas de profundidade, como a procura em largura, mas de cada camada mantém apenas os
+    'largura' melhores nós segundo um avaliador ('Avaliador'), por exemplo f(n) = g(n) + h(n) ('AvaliadorAA') ou h(n)
+    ('AvaliadorSof'). Em cada camada:
+    - se algum nó da camada satisfaz o objetivo, é devolvida a solução de menor custo entre esses nós;
+    - caso contrário, os nós da camada são expandidos e, entre os sucessores cujo estado ainda não foi visitado, fica o
+      de menor custo para cada estado; destes, os 'largura' de menor prioridade formam a camada seguinte.
+
+    Os estados visitados são apenas os das camadas mantidas, pelo que a memória é O(k·d), para uma largura k e uma
+    profundidade d, e o trabalho por camada é O(k·b), para um fator de ramificação b. A procura não é completa nem
+    ótima: o feixe pode descartar o percurso ótimo, ou todos os percursos para o objetivo. Termina sem solução quando a
+    camada fica vazia ou quando é atingida a profundidade máxima ('prof_max').
+"""
+
+class ProcuraFeixe(MecanismoProcura):
+
+    # Inicializa uma instância da procura em feixe com o avaliador, a largura do feixe e a profundidade máxima (None
+    # para não limitar).
+    def __init__(self, avaliador, largura, prof_max = None):
+        super().__init__(None)
+        self._avaliador = avaliador
+        self.__largura = largura
+        self.__prof_max = prof_max
+
+
+    # Propriedade que devolve a largura do feixe.
+    @property
+    def largura(self):
+        return self.__largura
+
+
+    # Inicializa a memória da procura: o conjunto dos estados visitados pelas camadas mantidas.
+    def _iniciar_memoria(self):
+        self._visitados = set()
+
+
+    # Número de nós guardados pela procura: os das camadas mantidas.
+    def _nos_memoria(self, no):
+        return len(self._visitados)
+
+
+    # A procura guarda os estados visitados pelas camadas mantidas, pelo que não aceita o filtro de estados
+    # visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura em feixe para o problema; se o avaliador usar uma heurística, esta tem de ser fornecida.
+    def procurar(self, problema, heuristica = None):
+
+        if isinstance(self._avaliador, AvaliadorHeur):
+            self._avaliador.heuristica = heuristica
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+
+        no = No(problema.estado_inicial)
+        estatisticas.nos_gerados += 1
+        self._visitados.add(no.estado)
+        camada = [no]
+
+        while camada:
+
+            # Devolve a solução de menor custo entre os nós da camada que satisfazem o objetivo.
+            objectivos = [no for no in camada if problema.objectivo(no.estado)]
+            if objectivos:
+                estatisticas.terminar()
+                return Solucao(min(objectivos, key = lambda no: no.custo))
+
+            if self.__prof_max is not None and camada[0].profundidade >= self.__prof_max:
+                break
+
+            # Expande a camada, mantendo o sucessor de menor custo para cada estado ainda não visitado.
+            candidatos = {}
+            for no in camada:
+                sucessores = self._expandir(problema, no)
+                estatisticas.nos_expandidos += 1
+                estatisticas.nos_gerados += len(sucessores)
+                for no_sucessor in sucessores:
+                    existente = candidatos.get(no_sucessor.estado)
+                    if no_sucessor.estado in self._visitados or \
+                            (existente is not None and existente.custo <= no_sucessor.custo):
+                        estatisticas.nos_podados += 1
+                        continue
+                    candidatos[no_sucessor.estado] = no_sucessor
+
+            # Mantém os melhores nós segundo o avaliador; os restantes são descartados.
+            for no in candidatos.values():
+                no.prioridade = self._avaliador.prioridade(no)
+            camada = heapq.nsmallest(self.__largura, candidatos.values(), key = lambda no: no.prioridade)
+            estatisticas.nos_podados += len(candidatos) - len(camada)
+            self._visitados.update(no.estado for no in camada)
+
+            estatisticas.actualizar_memoria(len(camada), self._nos_memoria(no))
+
+        estatisticas.terminar()
+        return None
@@ -0,0 +1,201 @@
+import heapq
+import os
+import pickle
+import tempfile
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+
+"""
+    Classe 'ProcuraLarguraExterna', que implementa a procura em largura em memória externa (External-Memory
+    Breadth-First Search), para espaços de estados maiores do que a memória disponível.
+
+    A procura avança por camadas de profundidade, guardadas em disco. Cada camada é um ficheiro de registos (id_valor,
+    estado, id_valor do antecessor, índice do operador), ordenados por 'Estado.id_valor()' e sem repetições. Para gerar
+    a camada seguinte, a camada atual é lida sequencialmente e os sucessores são acumulados em memória em blocos de
+    'dim_bloco' registos; cada bloco cheio é ordenado e escrito num ficheiro temporário. No fim da camada, os blocos são
+    fundidos ('heapq.merge') e a deteção de estados repetidos é feita nessa fusão, em simultâneo com a leitura ordenada
+    da camada atual e da anterior (deteção diferida de repetidos): um sucessor é descartado se o seu estado repetir
+    outro sucessor ou existir numa dessas duas camadas. Num grafo não orientado (operadores reversíveis, como no
+    'ModeloMundo'), os sucessores de uma camada só podem repetir estados dessas duas camadas; com operadores
+    irreversíveis (e.g., 'ProblemaContagem'), estados de camadas mais antigas podem reaparecer, o que aumenta o trabalho
+    mas mantém a solução de menor profundidade.
+
+    A memória usada é a de um bloco, independente da dimensão das camadas; o teste de objetivo é feito quando cada
+    estado é lido da sua camada. As camadas são mantidas até ao fim da procura para reconstruir o percurso, procurando
+    em cada camada o antecessor do estado da camada seguinte. Os estados são guardados com 'pickle', pelo que têm de ser
+    serializáveis. São registados os bytes escritos e lidos ('bytes_escritos' e 'bytes_lidos'); o máximo de registos em
+    memória e a maior camada são registados em 'EstatisticasProcura.max_memoria' e 'max_fronteira'.
+"""
+
+class ProcuraLarguraExterna(MecanismoProcura):
+
+    # Inicializa a procura com a dimensão dos blocos em memória (número de registos) e a diretoria dos ficheiros
+    # temporários (None para usar a diretoria temporária do sistema).
+    def __init__(self, dim_bloco = 100000, directorio = None):
+        super().__init__(None)
+        self.__dim_bloco = dim_bloco
+        self.__directorio = directorio
+        self.__bytes_escritos = 0
+        self.__bytes_lidos = 0
+
+
+    # Propriedade que devolve o número de bytes escritos em disco na última procura.
+    @property
+    def bytes_escritos(self):
+        return self.__bytes_escritos
+
+
+    # Propriedade que devolve o número de bytes lidos do disco na última procura.
+    @property
+    def bytes_lidos(self):
+        return self.__bytes_lidos
+
+
+    # Os estados repetidos são descartados ao fundir as camadas em disco, pelo que a procura não aceita o filtro de
+    # estados visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura em largura em memória externa, devolvendo a solução de menor profundidade ou None.
+    def procurar(self, problema):
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self.__bytes_escritos = 0
+        self.__bytes_lidos = 0
+
+        with tempfile.TemporaryDirectory(prefix = "procura_largura_", dir = self.__directorio) as directorio:
+
+            self.__directorio_procura = directorio
+            estado = problema.estado_inicial
+            camadas = [self.__escrever_registos("camada_0", [(estado.id_valor(), estado, None, None)])]
+            estatisticas.nos_gerados += 1
+
+            while camadas[-1] is not None:
+
+                # Lê a camada atual, testando o objetivo e gerando os sucessores em blocos ordenados.
+                blocos = []
+                bloco = []
+                for id_valor, estado, _, _ in self.__ler_registos(camadas[-1]):
+
+                    if problema.objectivo(estado):
+                        solucao = self.__solucao(problema, camadas, id_valor)
+                        estatisticas.terminar()
+                        return solucao
+
+                    for indice, operador in enumerate(problema.operadores):
+                        estado_suc = operador.aplicar(estado)
+                        if estado_suc is not None:
+                            bloco.append((estado_suc.id_valor(), estado_suc, id_valor, indice))
+                            estatisticas.nos_gerados += 1
+
+                    estatisticas.nos_expandidos += 1
+                    estatisticas.actualizar_memoria(0, len(bloco))
+                    if len(bloco) >= self.__dim_bloco:
+                        blocos.append(self.__escrever_bloco(len(camadas), len(blocos), bloco))
+                        bloco = []
+
+                if bloco:
+                    blocos.append(self.__escrever_bloco(len(camadas), len(blocos), bloco))
+
+                # Funde os blocos na camada seguinte, descartando os estados repetidos.
+                camadas.append(self.__fundir(len(camadas), blocos, camadas[-2:]))
+
+        estatisticas.terminar()
+        return None
+
+
+    # Ordena um bloco de registos por id_valor e escreve-o num ficheiro temporário, devolvendo o seu caminho.
+    def __escrever_bloco(self, num_camada, num_bloco, bloco):
+        bloco.sort(key = lambda registo: registo[0])
+        return self.__escrever_registos(f"bloco_{num_camada}_{num_bloco}", bloco)
+
+
+    # Funde os blocos ordenados numa nova camada, descartando os registos repetidos entre si ou presentes nas camadas
+    # anteriores indicadas. Os blocos são removidos; devolve o caminho da camada ou None se ficar vazia.
+    def __fundir(self, num_camada, blocos, anteriores):
+
+        fundidos = heapq.merge(*(self.__ler_registos(bloco) for bloco in blocos), key = lambda registo: registo[0])
+        leitores = [self.__ler_registos(camada) for camada in anteriores]
+        atuais = [next(leitor, None) for leitor in leitores]
+
+        def unicos():
+            ultimo = None
+            for registo in fundidos:
+                id_valor = registo[0]
+                if id_valor == ultimo:
+                    self._estatisticas.nos_podados += 1
+                    continue
+                ultimo = id_valor
+
+                # Avança as camadas anteriores até ao id_valor do registo, verificando se o estado já existe.
+                repetido = False
+                for i, leitor in enumerate(leitores):
+                    while atuais[i] is not None and atuais[i][0] < id_valor:
+                        atuais[i] = next(leitor, None)
+                    if atuais[i] is not None and atuais[i][0] == id_valor:
+                        repetido = True
+                if repetido:
+                    self._estatisticas.nos_podados += 1
+                    continue
+                yield registo
+
+        camada = self.__escrever_registos(f"camada_{num_camada}", unicos())
+        for bloco in blocos:
+            os.remove(bloco)
+        return camada
+
+
+    # Escreve os registos num ficheiro da procura, devolvendo o seu caminho, ou None se não houver registos.
+    def __escrever_registos(self, nome, registos):
+        caminho = os.path.join(self.__directorio_procura, nome)
+        num_registos = 0
+        with open(caminho, "wb") as ficheiro:
+            for registo in registos:
+                pickle.dump(registo, ficheiro, pickle.HIGHEST_PROTOCOL)
+                num_registos += 1
+            self.__bytes_escritos += ficheiro.tell()
+
+        if num_registos == 0:
+            os.remove(caminho)
+            return None
+        self._estatisticas.actualizar_memoria(num_registos if nome.startswith("camada") else 0, 0)
+        return caminho
+
+
+    # Lê sequencialmente os registos de um ficheiro da procura.
+    def __ler_registos(self, caminho):
+        if caminho is None:
+            return
+        with open(caminho, "rb") as ficheiro:
+            try:
+                while True:
+                    yield pickle.load(ficheiro)
+            except EOFError:
+                pass
+            finally:
+                self.__bytes_lidos += ficheiro.tell()
+
+
+    # Reconstrói a solução a partir do id_valor do estado objetivo na última camada, procurando em cada camada anterior
+    # o registo do antecessor.
+    def __solucao(self, problema, camadas, id_valor):
+
+        percurso = []
+        for camada in reversed(camadas):
+            for registo in self.__ler_registos(camada):
+                if registo[0] == id_valor:
+                    break
+            percurso.append(registo)
+            id_valor = registo[2]
+
+        _, estado, _, _ = percurso.pop()
+        no = No(estado)
+        for _, estado, _, indice in reversed(percurso):
+            operador = problema.operadores[indice]
+            no = No(estado, operador, no, no.custo + operador.custo(no.estado, estado))
+        return Solucao(no)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+import time
+
+"""
+    Classe 'EstatisticasProcura', responsável por registar as métricas de desempenho de uma única procura.
+
+    Cada chamada a 'MecanismoProcura.procurar' cria a sua própria instância, pelo que duas procuras a decorrer em
+    simultâneo (em threads distintas ou em planeadores intercalados) não partilham contadores. Os valores são
+    atualizados diretamente pelo mecanismo de procura, sem recorrer a contadores de classe nem a finalizadores nos nós.
+
+    As métricas permitem avaliar a complexidade temporal (nós gerados e expandidos, tempo de procura) e espacial
+    (máximo de nós em memória e dimensão máxima da fronteira) de cada estratégia de procura.
+"""
+
+@dataclass
+class EstatisticasProcura():
+
+    # Número de nós gerados (criados) durante a procura, incluindo o nó inicial.
+    nos_gerados: int = 0
+
+    # Número de nós retirados da fronteira e expandidos.
+    nos_expandidos: int = 0
+
+    # Número de nós sucessores descartados por corresponderem a estados já explorados.
+    nos_podados: int = 0
+
+    # Número de nós aceites para estados já expandidos (fechados), por terem um percurso de menor custo.
+    nos_reabertos: int = 0
+
+    # Número de nós obsoletos retirados da fronteira e ignorados, por terem sido substituídos por um percurso melhor.
+    nos_obsoletos: int = 0
+
+    # Número de nós esquecidos (removidos da memória) por procuras com memória limitada.
+    nos_esquecidos: int = 0
+
+    # Número de nós reinseridos na fronteira depois de uma expansão parcial, com o valor de f(n) seguinte.
+    nos_reinseridos: int = 0
+
+    # Dimensão máxima atingida pela fronteira durante a procura.
+    max_fronteira: int = 0
+
+    # Máximo de nós simultaneamente em memória (fronteira mais nós memorizados pelo mecanismo).
+    max_memoria: int = 0
+
+    # Tempo de procura (em segundos), medido com 'time.perf_counter'.
+    tempo: float = 0.0
+
+    # Instante de início da procura, usado para calcular o tempo decorrido.
+    inicio: float = 0.0
+
+
+    # Regista o início da procura, guardando o instante atual.
+    def iniciar(self):
+        self.inicio = time.perf_counter()
+
+
+    # Regista o fim da procura, calculando o tempo decorrido desde 'iniciar'.
+    def terminar(self):
+        self.tempo = time.perf_counter() - self.inicio
+
+
+    # Atualiza os máximos de fronteira e de memória com os valores correntes da procura.
+    def actualizar_memoria(self, dim_fronteira, nos_memoria):
+        if dim_fronteira > self.max_fronteira:
+            self.max_fronteira = dim_fronteira
+        if nos_memoria > self.max_memoria:
+            self.max_memoria = nos_memoria
+
+
+    # Acumula nestas estatísticas as de outra procura (e.g., uma iteração de uma procura iterativa): os contadores e o
+    # tempo são somados e os máximos de fronteira e de memória são combinados.
+    def acumular(self, estatisticas):
+        self.nos_gerados += estatisticas.nos_gerados
+        self.nos_expandidos += estatisticas.nos_expandidos
+        self.nos_podados += estatisticas.nos_podados
+        self.nos_reabertos += estatisticas.nos_reabertos
+        self.nos_obsoletos += estatisticas.nos_obsoletos
+        self.nos_esquecidos += estatisticas.nos_esquecidos
+        self.nos_reinseridos += estatisticas.nos_reinseridos
+        self.tempo += estatisticas.tempo
+        self.actualizar_memoria(estatisticas.max_fronteira, estatisticas.max_memoria)
@@ -0,0 +1,101 @@
+import math
+
+"""
+    Classe 'FiltroBloom', responsável por implementar um conjunto probabilístico de estados (filtro de Bloom), usado
+    pelos mecanismos de procura como conjunto de estados visitados ou fechados em espaços de estados muito grandes ou
+    ilimitados.
+
+    Em vez de guardar os estados (ou nós) visitados, o filtro guarda apenas um vetor de bits: cada estado marca
+    'num_hashes' bits, em posições calculadas a partir de 'Estado.id_valor()' por dupla dispersão (double hashing) com
+    a função de mistura SplitMix64. Um estado é considerado visitado se todos os seus bits estiverem marcados, pelo que
+    o filtro nunca dá falsos negativos, mas pode dar falsos positivos: um estado nunca visitado pode ser descartado
+    pela procura, que deixa assim de ser completa e ótima com probabilidade pequena.
+
+    O vetor de bits é dimensionado para a 'capacidade' (número de estados) e a taxa de falsos positivos indicadas, com
+    m = -n·ln(p) / ln(2)² bits e k = (m / n)·ln(2) funções de dispersão; para p = 1% são cerca de 9,6 bits por estado.
+    Acima da capacidade o filtro continua a funcionar, mas a taxa de falsos positivos aumenta ('taxa_estimada').
+
+    O filtro tem a interface de um 'set' usada pelas procuras ('add', 'in', 'len'), podendo substituir diretamente o
+    conjunto de estados fechados ou visitados.
+"""
+
+class FiltroBloom:
+
+    # Máscara de 64 bits e constantes da função de mistura SplitMix64.
+    MASCARA = 0xFFFFFFFFFFFFFFFF
+    GAMA = 0x9E3779B97F4A7C15
+    MULT_1 = 0xBF58476D1CE4E5B9
+    MULT_2 = 0x94D049BB133111EB
+
+
+    # Inicializa um filtro vazio dimensionado para a capacidade (número de estados), que tem de ser pelo menos 1, e a
+    # taxa de falsos positivos, que tem de estar entre 0 e 1 (exclusive).
+    def __init__(self, capacidade, taxa_falsos_positivos = 0.01):
+        if capacidade < 1:
+            raise ValueError("a capacidade do filtro de Bloom tem de ser pelo menos 1")
+        if not 0 < taxa_falsos_positivos < 1:
+            raise ValueError("a taxa de falsos positivos do filtro de Bloom tem de estar entre 0 e 1 (exclusive)")
+        self.__capacidade = capacidade
+        self.__taxa = taxa_falsos_positivos
+        self.__num_bits = max(8, math.ceil(-capacidade * math.log(taxa_falsos_positivos) / math.log(2) ** 2))
+        self.__num_hashes = max(1, round(self.__num_bits / capacidade * math.log(2)))
+        self.limpar()
+
+
+    # Propriedade que devolve o número de bits do filtro.
+    @property
+    def num_bits(self):
+        return self.__num_bits
+
+
+    # Propriedade que devolve o número de funções de dispersão (bits marcados por estado).
+    @property
+    def num_hashes(self):
+        return self.__num_hashes
+
+
+    # Propriedade que devolve a taxa de falsos positivos estimada para o número de estados inseridos.
+    @property
+    def taxa_estimada(self):
+        return (1 - math.exp(-self.__num_hashes * self.__inseridos / self.__num_bits)) ** self.__num_hashes
+
+
+    # Esvazia o filtro, antes de uma nova procura.
+    def limpar(self):
+        self.__bits = bytearray((self.__num_bits + 7) // 8)
+        self.__inseridos = 0
+
+
+    # Insere um estado no filtro, marcando os seus bits.
+    def add(self, estado):
+        bits = self.__bits
+        for posicao in self.__posicoes(estado):
+            bits[posicao >> 3] |= 1 << (posicao & 7)
+        self.__inseridos += 1
+
+
+    # Verifica se um estado pode ter sido inserido (todos os seus bits marcados).
+    def __contains__(self, estado):
+        bits = self.__bits
+        for posicao in self.__posicoes(estado):
+            if not bits[posicao >> 3] & (1 << (posicao & 7)):
+                return False
+        return True
+
+
+    # Número de estados inseridos no filtro.
+    def __len__(self):
+        return self.__inseridos
+
+
+    # Devolve as posições dos bits de um estado, calculadas por dupla dispersão a partir de duas metades de 32 bits da
+    # mistura SplitMix64 do seu id_valor.
+    def __posicoes(self, estado):
+        z = (estado.id_valor() + FiltroBloom.GAMA) & FiltroBloom.MASCARA
+        z = ((z ^ (z >> 30)) * FiltroBloom.MULT_1) & FiltroBloom.MASCARA
+        z = ((z ^ (z >> 27)) * FiltroBloom.MULT_2) & FiltroBloom.MASCARA
+        z ^= z >> 31
+        h1 = z & 0xFFFFFFFF
+        h2 = (z >> 32) | 1
+        num_bits = self.__num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.__num_hashes)]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import deque
 
 """
     Classe abstrata Fronteira, responsável por defenir a estrutura base para uma fronteira de exploração.
@@ -11,6 +12,11 @@ from abc import ABC, abstractmethod
     
     Esta classe abstrai as operações básicas de inicialização, inserção e remoção de nós, permitindo diferentes 
     implementações (e.g.,FIFO, LIFO) conforme o tipo de procura.
+
+    Por omissão os nós são guardados numa 'deque', que permite inserir e remover em ambas as extremidades em tempo
+    O(1). Uma lista Python teria custo O(n) em 'pop(0)' e 'insert(0, ...)', tornando a procura quadrática quando a
+    fronteira atinge dezenas de milhares de nós. Subclasses que precisem de outra estrutura (e.g., um heap) redefinem
+    o metodo 'iniciar'.
 """
 class Fronteira(ABC):
 
@@ -32,10 +38,16 @@ class Fronteira(ABC):
         # Retorna True se a lista de nós estiver vazia, False caso contrário.
         return len(self._nos) == 0
 
+
+    # Propriedade 'dimensao', responsável por indicar o número de nós atualmente na fronteira.
+    @property
+    def dimensao(self):
+        return len(self._nos)
+
     # Metodo que inicializa ou reinicializa a fronteira, configurando-a como vazia.
     def iniciar(self):
-        # Define a lista interna de nós como uma lista vazia.
-        self._nos = []
+        # Define a estrutura interna de nós como uma 'deque' vazia, com inserção e remoção O(1) em ambas as extremidades.
+        self._nos = deque()
 
 
     # Metodo abstrato que insere um nó na fronteira de exploração.
@@ -52,5 +64,5 @@ class Fronteira(ABC):
 
     # Metodo que remove e retorna um nó da fronteira.
     def remover(self):
-        # Remove e retorna o primeiro nó da lista interna de nós, seguindo uma lógica FIFO.
-        return self._nos.pop(0)
\ No newline at end of file
+        # Remove e retorna o primeiro nó da estrutura interna de nós, seguindo uma lógica FIFO, em tempo O(1).
+        return self._nos.popleft()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC
 
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
 from pee.mec_proc.no import No
 from pee.mec_proc.solucao import Solucao
 
@@ -17,6 +18,11 @@ from pee.mec_proc.solucao import Solucao
     
     Esta classe abstrai o processo genérico de procura, deixando a cargo das subclasses a definição de como a memória 
     de nós explorados é iniciada e gerida, bem como a estratégia específica de exploração (e.g., profundidade, largura).
+
+    Opcionalmente, pode ser associado ao mecanismo um filtro de estados visitados ('filtro', e.g., 'FiltroBloom'): nas
+    procuras em árvore (largura e profundidade), um nó cujo estado já foi memorizado é descartado, com o custo de alguns
+    bits por estado em vez de um nó; as procuras em grafos ('ProcuraGrafo') usam o filtro como lista de fechados. As
+    procuras que não usam o filtro ou que perderiam a solução ótima com ele (e.g., IDA*) rejeitam-no.
 """
 
 class MecanismoProcura(ABC):
@@ -34,23 +40,57 @@ class MecanismoProcura(ABC):
     def __init__(self, fronteira):
         self._fronteira = fronteira
 
+        # Filtro de estados visitados; por omissão não é usado.
+        self._filtro = None
+
+        # Estatísticas da última procura realizada; cada chamada a `procurar` cria uma nova instância.
+        self._estatisticas = EstatisticasProcura()
+
+
+    # Propriedade que devolve as estatísticas (`EstatisticasProcura`) da última procura realizada por este mecanismo.
+    @property
+    def estatisticas(self):
+        return self._estatisticas
+
+
+    # Propriedade que devolve o filtro de estados visitados, ou None se não for usado.
+    @property
+    def filtro(self):
+        return self._filtro
+
+
+    # Define o filtro de estados visitados (e.g., 'FiltroBloom'), que é esvaziado no início de cada procura; None
+    # desativa o filtro. Gera 'ValueError' se a procura não aceitar o filtro ('_aceitar_filtro').
+    @filtro.setter
+    def filtro(self, filtro):
+        if filtro is not None and not self._aceitar_filtro():
+            raise ValueError(f"a procura '{type(self).__name__}' não aceita um filtro de estados visitados")
+        self._filtro = filtro
+
+
+    # Metodo protegido '_aceitar_filtro', que indica se a procura aceita um filtro de estados visitados.
+    #
+    # As procuras que não usam o filtro, ou que deixariam de encontrar a solução ótima (ou qualquer solução dentro de
+    # um limite) por descartarem um estado alcançado primeiro por um percurso pior, devolvem False.
+    def _aceitar_filtro(self):
+        return True
+
 
     # Propriedade que devolve o número total de nós processados (criados) durante a procura.
     #
-    # Acessa o contador `nos_criados` da classe `No`, que monitoriza a criação de nós, permitindo avaliar a complexidade
-    # temporal da procura.
+    # Lê o contador `nos_gerados` das estatísticas da procura, permitindo avaliar a complexidade temporal da procura.
     @property
     def nos_processados(self):
-        return No.nos_criados
+        return self._estatisticas.nos_gerados
 
 
     # Propriedade que devolve o número máximo de nós simultaneamente em memória durante a procura.
     #
-    # Acessa o contador `nos_max_mem` da classe `No`, que reflete o pico de uso de memória, útil para avaliar a
-    # complexidade espacial
+    # Lê o contador `max_memoria` das estatísticas da procura, que reflete o pico de uso de memória, útil para avaliar
+    # a complexidade espacial
     @property
     def nos_em_memoria(self):
-        return No.nos_max_mem
+        return self._estatisticas.max_memoria
 
 
     # Metodo protegido '_iniciar_memoria', responsável por inicializar a memória de nós explorados.
@@ -64,17 +104,46 @@ class MecanismoProcura(ABC):
         # Chama o metodo `iniciar` da fronteira para configurá-la como vazia, removendo quaisquer nós residuais.
         self._fronteira.iniciar()
 
+        # Esvazia o filtro de estados visitados, se existir.
+        if self._filtro is not None:
+            self._filtro.limpar()
+
 
     # Metodo protegido '_iniciar_memoria', responsável por memorizar um nó sucessor na estrutura de procura.
     #
     # Este metodo é responsável por decidir como um nó sucessor gerado durante a expansão é armazenado, seja na
     # fronteira, na memória de explorados, ou ambos, dependendo da estratégia de procura.
+    #
+    # Com um filtro de estados visitados, o nó é descartado se o seu estado já foi memorizado.
     def _memorizar(self, no):
 
+        # Descarta o nó se o estado já foi visitado; caso contrário regista-o no filtro.
+        if self._filtro is not None:
+            if no.estado in self._filtro:
+                self._estatisticas.nos_podados += 1
+                return
+            self._filtro.add(no.estado)
+
         # Insere o nó na fronteira usando o metodo `inserir`, respeitando a estratégia da fronteira (e.g., FIFO, LIFO).
         self._fronteira.inserir(no)
 
 
+    # Metodo protegido '_obsoleto', responsável por indicar se um nó retirado da fronteira deve ser ignorado.
+    #
+    # Um nó é obsoleto quando, depois de ter sido inserido na fronteira, foi substituído por outro nó para o mesmo
+    # estado com um percurso melhor. Numa procura em árvore nenhum nó é substituído, pelo que nunca há nós obsoletos.
+    def _obsoleto(self, no):
+        return False
+
+
+    # Metodo protegido '_nos_memoria', responsável por devolver o número de nós atualmente guardados pela procura.
+    #
+    # Numa procura em árvore ficam em memória os nós da fronteira e o percurso (antecessores) do nó em expansão, o que
+    # corresponde à complexidade espacial O(b·d) da procura em profundidade e O(b^d) da procura em largura.
+    def _nos_memoria(self, no):
+        return self._fronteira.dimensao + no.profundidade
+
+
     # Metodo "procurar", responsável por executar a procura de uma solução para o problema fornecido.
     #
     # Este metodo implementa o ciclo principal de procura em espaço de estados, começando pelo estado inicial,
@@ -90,12 +159,17 @@ class MecanismoProcura(ABC):
     # se nenhuma solução for encontrada.
     def procurar(self, problema):
 
+        # Cria as estatísticas desta procura, independentes de qualquer outra procura em curso, e regista o início.
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+
         # Inicializa a memória de nós explorados, garantindo que a procura comece sem estados residuais.
         self._iniciar_memoria()
 
         # Cria um nó inicial com o estado inicial do problema, que será o ponto de partida da procura, como no início
         # de uma navegação por mapa.
         no = No(problema.estado_inicial)
+        estatisticas.nos_gerados += 1
 
         # Memoriza o nó inicial na fronteira, adicionando-o à estrutura para ser processado primeiro.
         self._memorizar(no)
@@ -107,21 +181,36 @@ class MecanismoProcura(ABC):
             # Retira o próximo nó da fronteira para ser analisado, dependendo da estratégia.
             no = self._fronteira.remover()
 
+            # Ignora o nó se tiver sido substituído por um percurso melhor depois de ter sido inserido na fronteira.
+            if self._obsoleto(no):
+                estatisticas.nos_obsoletos += 1
+                continue
+
             # Verifica se o estado do nó atual é o objetivo do problema; se for, a procura termina com sucesso.
             if problema.objectivo(no.estado):
 
                 # Devolve uma solução construída a partir do nó objetivo, representando o percurso desde o início até
                 # ele, como retornar o caminho final em largura.
+                estatisticas.terminar()
                 return Solucao(no)
 
-            # Expande o nó atual, gerando todos os seus sucessores, e perccore-os para os processar.
-            for no_sucessor in self._expandir(problema, no):
+            # Expande o nó atual, gerando todos os seus sucessores.
+            sucessores = self._expandir(problema, no)
+            estatisticas.nos_expandidos += 1
+            estatisticas.nos_gerados += len(sucessores)
+
+            # Percorre os sucessores para os processar.
+            for no_sucessor in sucessores:
 
                 # Passa cada sucessor para o metodo `_memorizar()`, que decide como lidar com ele.
                 self._memorizar(no_sucessor)
 
+            # Atualiza os máximos de fronteira e de nós em memória após memorizar os sucessores.
+            estatisticas.actualizar_memoria(self._fronteira.dimensao, self._nos_memoria(no))
+
         # Se a fronteira ficar vazia sem encontrar o objetivo, devolve `None`, indicando que não há solução, como o fim
         # sem sucesso em 'Procura em Espaços de Estados'
+        estatisticas.terminar()
         return None
 
 
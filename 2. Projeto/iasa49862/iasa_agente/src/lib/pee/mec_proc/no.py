@@ -8,57 +8,22 @@
 
     É uma estrutura fundamental para construir e navegar a árvore de procura, permitindo rastrear o percurso até um
     estado objetivo e avaliar o custo ou profundidade da solução.
+
+    Como cada procura cria e liberta um grande número de nós, a classe é compacta: usa '__slots__' (sem dicionário por
+    instância), atributos de acesso direto em vez de propriedades e não tem finalizador. As métricas da procura (nós
+    gerados, em memória, etc.) são registadas pelo mecanismo de procura numa instância de 'EstatisticasProcura'.
 """
 
 class No:
-    # Contador de nós criados, usado para monitorizar a criação de nós durante a procura.
-    nos_criados    = 0
-
-    # Contador de nós eliminados, usado para acompanhar a libertação de memória.
-    nos_eleminados = 0
-
-    # Máximo número de nós em memória ao mesmo tempo, útil para avaliar a complexidade espacial.
-    nos_max_mem    = 0
-
-    # Propriedade que devolve o estado associado ao nó.
-    @property
-    def estado(self):
-        return self.__estado
-
-    # Propriedade que devolve o operador que gerou o nó.
-    @property
-    def operador(self):
-        return self.__operador
-
-    # Propriedade que devolve o nó antecessor na árvore de procura.
-    @property
-    def antecessor(self):
-        return self.__antecessor
-
-    # Propriedade que devolve a profundidade do nó na árvore de procura.
-    @property
-    def profundidade(self):
-        return self.__profundidade
-
-    # Propriedade que devolve o custo acumulado até o nó.
-    @property
-    def custo(self):
-        return self.__custo
 
-    # Propriedade que devolve a prioridade do nó.
-    @property
-    def prioridade(self):
-        return self.__prioridade
-
-    # Setter para a propriedade prioridade, permitindo atualizar o valor de prioridade do nó.
-    @prioridade.setter
-    def prioridade(self, value):
-        self.__prioridade = value
-
-    # Metodo destrutor, chamado quando o nó é eliminado da memória.
-    # Incrementa o contador de nós eliminados para monitorizar a libertação de memória.
-    def __del__(self):
-        No.nos_eleminados += 1
+    # Atributos do nó, reservados em '__slots__' para evitar o dicionário '__dict__' em cada instância:
+    # - estado: estado do problema associado ao nó.
+    # - operador: operador que gerou o nó (None no nó inicial).
+    # - antecessor: nó antecessor na árvore de procura (None no nó inicial).
+    # - profundidade: profundidade do nó na árvore de procura.
+    # - custo: custo acumulado desde o estado inicial até o nó.
+    # - prioridade: prioridade do nó, atribuída pela fronteira de prioridade.
+    __slots__ = ("estado", "operador", "antecessor", "profundidade", "custo", "prioridade")
 
 
     # Metodo de comparação para ordenação de nós com base na prioridade.
@@ -74,42 +39,23 @@ class No:
     def __init__(self, estado, operador = None, antecessor = None, custo = 0):
 
         # Inicializa a prioridade do nó como 0.
-        self.__prioridade = 0
+        self.prioridade = 0
 
         # Guarda o estado do problema neste nó, como uma configuração específica do espaço de estados.
-        self.__estado = estado
+        self.estado = estado
 
         # Regista o operador que foi aplicado para chegar a este estado, permitindo reconstruir o percurso.
         # None se for o nó inicial.
-        self.__operador = operador
+        self.operador = operador
 
         # Define o nó antecessor (pai) na árvore de procura, criando a ligação para trás;
         # None se este for o nó raiz (estado inicial).
-        self.__antecessor = antecessor
+        self.antecessor = antecessor
 
         # Calcula a profundidade do nó: 0 se não houver antecessor (nó inicial), ou a profundidade do antecessor mais 1,
         # refletindo o número de passos desde o início.
-        if antecessor is None:
-            self.__profundidade = 0
-
-            # Reinicia os contadores quando o nó inicial é criado, indicando o início de uma nova procura.
-            No.nos_criados      = 0
-            No.nos_eleminados   = 0
-            No.nos_max_mem      = 0
-        else:
-            self.__profundidade = antecessor.profundidade + 1
+        self.profundidade = 0 if antecessor is None else antecessor.profundidade + 1
 
         # Armazena o custo acumulado até este nó, útil para estratégias como custo uniforme;
         # pode ser None se não for fornecido ou calculado ainda.
-        self.__custo = custo
-
-        # Incrementa o contador de nós criados, refletindo a criação de um novo nó.
-        No.nos_criados += 1
-
-        # Calcula o número de nós atualmente em memória (criados menos eliminados).
-        nos_memoria = No.nos_criados - No.nos_eleminados
-
-        # Atualiza o máximo número de nós em memória, usado para avaliar o pico de uso de memória.
-        No.nos_max_mem = max(No.nos_max_mem, nos_memoria)
-
-
+        self.custo = custo
@@ -13,6 +13,18 @@ from pee.mec_proc.mecanismo_procura import MecanismoProcura
     A classe mantém uma memória de nós explorados (abertos e fechados) indexada por estado, permitindo acesso eficiente
     para verificar se um estado já foi processado. A decisão de manter ou descartar um nó sucessor é delegada ao método 
     abstrato '_manter'.
+
+    Os estados expandidos (fechados) são registados separadamente em '_fechados'. Um nó retirado da fronteira que já não
+    é o nó memorizado para o seu estado em '_explorados' foi substituído por um percurso melhor e é ignorado, em vez de
+    ser expandido de novo; o número destes nós é registado em 'EstatisticasProcura.nos_obsoletos'.
+
+    Com a lista fechada ('_usar_lista_fechada'), qualquer sucessor para um estado fechado é descartado sem comparar
+    custos e os nós expandidos deixam de ser guardados em '_explorados', que passa a conter apenas os nós abertos. A
+    lista fechada é usada sempre que o mecanismo tem um filtro de estados visitados ('MecanismoProcura.filtro', e.g.,
+    'FiltroBloom'), que substitui o conjunto '_fechados': os estados fechados ocupam então alguns bits em vez de um nó.
+    Como nenhum estado é reaberto, a solução só é ótima se cada estado for expandido pela primeira vez pelo melhor
+    percurso (e.g., custo uniforme ou A* com heurística consistente), e os falsos positivos do filtro podem descartar
+    estados nunca expandidos.
 """
 
 class ProcuraGrafo( MecanismoProcura):
@@ -34,6 +46,16 @@ class ProcuraGrafo( MecanismoProcura):
         # (abertos e fechados) durante a procura.
         self._explorados = {}
 
+        # Indica se a procura descarta os sucessores para estados fechados.
+        self._lista_fechada = self._usar_lista_fechada()
+
+        # Inicializa o conjunto '_fechados' como vazio, que guarda os estados já expandidos; com a lista fechada e um
+        # filtro de estados visitados, o próprio filtro (já esvaziado pela classe base) é o conjunto de fechados.
+        if self._lista_fechada and self._filtro is not None:
+            self._fechados = self._filtro
+        else:
+            self._fechados = set()
+
 
     # Metodo protegido '_memorizar', responsável por memorizar um nó sucessor na estrutura de procura.
     #
@@ -45,18 +67,68 @@ class ProcuraGrafo( MecanismoProcura):
     # associando o estado do nó ao próprio nó. Isso garante que estados repetidos sejam geridos eficientemente.
     def _memorizar(self, no):
 
+        # Com a lista fechada, um sucessor para um estado já expandido é sempre descartado.
+        if self._lista_fechada and no.estado in self._fechados:
+            self._estatisticas.nos_podados += 1
+            return
+
         # Verifica se o nó deve ser mantido, chamando o metodo abstrato '_manter', que será implementado por subclasses
         # para definir a lógica específica.
         if self._manter(no):
 
-            # Se o nó for mantido, insere-o na fronteira usando o metodo '_memorizar' da classe base, respeitando a
-            # estratégia de ordenação da fronteira.
-            super()._memorizar(no)
+            # Se o estado já tinha sido expandido, o nó corresponde a um percurso de menor custo e o estado é reaberto.
+            if no.estado in self._fechados:
+                self._estatisticas.nos_reabertos += 1
+
+            # Se o nó for mantido, insere-o na fronteira, respeitando a estratégia de ordenação da fronteira (o filtro
+            # de estados visitados da classe base não se aplica, pois é usado como lista de fechados).
+            self._fronteira.inserir(no)
 
             # Registra o nó no dicionário '_explorados', mapeando o estado do nó ao próprio nó, para permitir a
             # verificação futura de estados repetidos.
             self._explorados[no.estado] = no
 
+        # Caso contrário, o nó é descartado por corresponder a um estado já explorado com um percurso melhor ou igual.
+        else:
+            self._estatisticas.nos_podados += 1
+
+
+    # Metodo protegido '_expandir', responsável por expandir um nó, registando o seu estado como fechado.
+    #
+    # Com a lista fechada, o nó expandido deixa de ser guardado em '_explorados', bastando o registo do seu estado em
+    # '_fechados'.
+    def _expandir(self, problema, no):
+        self._fechados.add(no.estado)
+        if self._lista_fechada:
+            del self._explorados[no.estado]
+        return super()._expandir(problema, no)
+
+
+    # Metodo protegido '_usar_lista_fechada', que indica se a procura deve usar a lista fechada; por omissão, apenas
+    # quando existe um filtro de estados visitados. As procuras que reabrem estados não aceitam o filtro
+    # ('_aceitar_filtro').
+    def _usar_lista_fechada(self):
+        return self._filtro is not None
+
+
+    # Metodo protegido '_obsoleto', responsável por indicar se um nó retirado da fronteira deve ser ignorado.
+    #
+    # O nó é obsoleto se já não for o nó memorizado para o seu estado em '_explorados', ou seja, se entretanto foi
+    # aceite um nó com um percurso melhor para o mesmo estado.
+    def _obsoleto(self, no):
+        return self._explorados.get(no.estado) is not no
+
+
+    # Metodo protegido '_nos_memoria', responsável por devolver o número de nós atualmente guardados pela procura.
+    #
+    # Numa procura em grafos todos os nós memorizados em '_explorados' (abertos e fechados) permanecem em memória. Com a
+    # lista fechada, '_explorados' contém apenas os nós abertos, pelo que se somam os estados fechados, exceto se
+    # estiverem num filtro de estados visitados.
+    def _nos_memoria(self, no):
+        if self._lista_fechada and self._fechados is not self._filtro:
+            return len(self._explorados) + len(self._fechados)
+        return len(self._explorados)
+
 
     # Metodo abstrato '_manter', responsável por determinar se um nó sucessor deve ser mantido na procura.
     #
@@ -5,6 +5,11 @@
     A solução encapsula as informações sobre o percurso encontrado desde o estado inicial  até o estado objetivo,
     incluindo o nó final da procura, a dimensão (número de passos) e o custo total do caminho. Serve como o resultado
     final do processo de procura, permitindo avaliar a eficiência da solução encontrada.
+
+    Os passos da solução são obtidos de forma diferida: a criação da solução apenas guarda o nó final, e o percurso é
+    reconstruído na primeira consulta dos passos, percorrendo os antecessores e invertendo a lista obtida (O(n) na
+    dimensão do percurso, em vez de inserir cada passo no início da lista). Os objetos 'PassoSolucao' são criados à
+    medida que cada passo é consultado, por índice ou por iteração.
 """
 from pee.mec_proc.passo_solucao import PassoSolucao
 
@@ -13,53 +18,62 @@ class Solucao():
 
     # Inicializa uma instância de uma solução com base no nó final da procura.
     #
-    # Este metodo cria uma solução a partir do nó que representa o estado objetivo, inicializando a lista de passos
-    # e reconstruindo o percurso desde o estado inicial até o objetivo.
-    #
-    # A reconstrução utiliza os antecessores do nó final para formar uma sequência de passos, cada um associado a um
-    # estado e operador
+    # Este metodo cria uma solução a partir do nó que representa o estado objetivo; o percurso desde o estado inicial só
+    # é reconstruído quando os passos forem consultados.
     def __init__(self, no_final):
 
         # Armazena o nó final da procura, que contém o estado objetivo e as informações necessárias para reconstruir o
         # percurso desde o estado inicial.
         self.__no_final = no_final
 
-        # Inicializa a lista de passos como vazia, para armazenar a sequência de passos da solução.
-        self.__passos = []
-
-        # Define uma variável temporária para percorrer os antecessores, começando pelo nó final.
-        no = no_final
+        # Lista dos nós do percurso, do estado inicial ao objetivo, reconstruída na primeira consulta dos passos.
+        self.__nos = None
 
-        # Percorre os antecessores do nó final até alcançar o nó inicial (sem antecessor), reconstruindo o
-        # percurso ao contrário
-        while no.antecessor:
 
-            # Cria um objeto PassoSolucao com o estado do nó antecessor e o operador que gerou o nó atual,
-            # representando uma transição no percurso.
-            passo = PassoSolucao(no.antecessor.estado, no.operador)
-
-            # Insere o passo no início da lista de passos, garantindo que a sequência esteja na ordem correta
-            # (do estado inicial ao objetivo).
-            self.__passos.insert(0, passo)
-
-            # Move para o nó antecessor, continuando a reconstrução do percurso até o estado inicial.
-            no = no.antecessor
+    # Metodo privado que devolve a lista dos nós do percurso, reconstruindo-a na primeira chamada.
+    #
+    # Percorre os antecessores do nó final até ao nó inicial, acrescentando cada nó no fim da lista, e inverte a lista
+    # no fim, obtendo a sequência do estado inicial ao objetivo em tempo linear.
+    def __percurso(self):
+        if self.__nos is None:
+            nos = []
+            no = self.__no_final
+            while no is not None:
+                nos.append(no)
+                no = no.antecessor
+            nos.reverse()
+            self.__nos = nos
+        return self.__nos
+
+
+    # Metodo privado que cria o passo de índice 'indice' (não negativo): o estado de onde parte a transição e o operador
+    # que gerou o nó seguinte do percurso.
+    def __passo(self, nos, indice):
+        return PassoSolucao(nos[indice].estado, nos[indice + 1].operador)
 
 
     # Metodo que torna a solução "percorrivel", permitindo percorrer os passos da solução.
-    # Este metodo devolve um iterador para a lista de passos, possibilitando o uso da solução em ciclos
-    # `for`, como para visualizar o percurso passo a passo.
+    # Este metodo devolve um gerador dos passos, criados à medida que são percorridos, possibilitando o uso da solução
+    # em ciclos `for`, como para visualizar o percurso passo a passo.
     def __iter__(self):
-        # Devolve um iterador para a lista interna de passos, permitindo acesso sequencial aos passos.
-        return iter(self.__passos)
+        nos = self.__percurso()
+        for indice in range(len(nos) - 1):
+            yield self.__passo(nos, indice)
 
 
     # Metodo que permite acesso aos passos da solução por índice.
-    # Este metodo suporta indexação direta (e.g., solucao[0]), devolvendo o passo correspondente ao índice
-    # fornecido, útil para inspecionar passos específicos do percurso.
+    # Este metodo suporta indexação direta (e.g., solucao[0]), índices negativos e fatias, devolvendo o passo (ou a
+    # lista de passos) correspondente, útil para inspecionar passos específicos do percurso.
     def __getitem__(self, index):
-        # Devolve o passo armazenado na lista de passos no índice fornecido, permitindo acesso direto.
-        return self.__passos[index]
+        nos = self.__percurso()
+        num_passos = len(nos) - 1
+        if isinstance(index, slice):
+            return [self.__passo(nos, indice) for indice in range(*index.indices(num_passos))]
+        if index < 0:
+            index += num_passos
+        if not 0 <= index < num_passos:
+            raise IndexError("índice do passo fora da solução")
+        return self.__passo(nos, index)
 
 
     # Propriedade que devolve a dimensão da solução.
@@ -0,0 +1,36 @@
+from pee.melhor_prim.aval.avaliador_heur import AvaliadorHeur
+
+"""
+    Classe 'AvaliadorAAPonderado', derivada de 'AvaliadorHeur', responsável por calcular a prioridade de nós para a
+    procura A* ponderada (Weighted A*).
+
+    A prioridade de um nó é dada por f(n) = g(n) + w·h(n), com um peso w >= 1. Com w = 1 a avaliação é a da procura A*
+    ('AvaliadorAA'); com pesos maiores a heurística ganha importância e a procura aproxima-se da procura gulosa
+    ('AvaliadorSof'), expandindo menos nós. Com uma heurística admissível, o custo da solução encontrada não excede w
+    vezes o custo ótimo.
+
+    O peso pode ser alterado entre procuras, como faz a procura anytime 'ProcuraARAA', que reduz o peso em cada
+    iteração para melhorar a solução.
+"""
+
+class AvaliadorAAPonderado(AvaliadorHeur):
+
+    # Inicializa o avaliador com o peso da heurística.
+    def __init__(self, peso = 1.0):
+        super().__init__()
+        self.peso = peso
+
+
+    @property
+    def peso(self):
+        return self._peso
+
+
+    @peso.setter
+    def peso(self, value):
+        self._peso = value
+
+
+    # Metodo 'prioridade', responsável por calcular a prioridade f(n) = g(n) + w·h(n) de um nó.
+    def prioridade(self, no):
+        return no.custo + self._peso * self.heuristica.h(no.estado)
@@ -1,4 +1,5 @@
 from pee.melhor_prim.aval.avaliador import Avaliador
+from pee.melhor_prim.heuristica_memo import HeuristicaMemo
 
 """
     Classe abstrata 'AvaliadorHeur', derivada de 'Avaliador', responsável por gerir uma heurística para algoritmos de
@@ -17,6 +18,10 @@ from pee.melhor_prim.aval.avaliador import Avaliador
     acumulado g(n) para formar a função de avaliação f(n) = g(n) + h(n). É usada em
     problemas como o puzzle de 8 peças, onde heurísticas como a distância de Manhattan são comuns, ou navegação
     autónoma, onde a distância euclidiana pode ser usada.
+
+    Com 'dim_memo' definido (capacidade da memória, 'math.inf' para ilimitada), cada heurística atribuída ao avaliador
+    é envolvida numa nova 'HeuristicaMemo', pelo que os valores de h(n) são memorizados durante cada procura; uma
+    heurística que já é uma 'HeuristicaMemo' é usada diretamente, mantendo a sua memória.
 """
 
 class AvaliadorHeur(Avaliador):
@@ -25,12 +30,29 @@ class AvaliadorHeur(Avaliador):
 
         self._heuristica = None
 
+        # Capacidade da memorização da heurística; None desativa a memorização.
+        self._dim_memo = None
+
 
     @property
     def heuristica(self):
         return self._heuristica
 
 
+    # Define a heurística do avaliador, envolvendo-a numa nova memória se a memorização estiver ativa.
     @heuristica.setter
     def heuristica(self, value):
-        self._heuristica = value
\ No newline at end of file
+        if self._dim_memo is not None and value is not None and not isinstance(value, HeuristicaMemo):
+            value = HeuristicaMemo(value, self._dim_memo)
+        self._heuristica = value
+
+
+    # Propriedade que devolve a capacidade da memorização da heurística, ou None se estiver desativada.
+    @property
+    def dim_memo(self):
+        return self._dim_memo
+
+
+    @dim_memo.setter
+    def dim_memo(self, value):
+        self._dim_memo = value
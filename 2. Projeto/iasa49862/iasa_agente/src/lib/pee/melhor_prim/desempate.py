@@ -0,0 +1,42 @@
+from enum import Enum
+
+"""
+    Enumeração 'Desempate', que define as políticas de desempate entre nós com a mesma prioridade numa fronteira de
+    prioridade.
+
+    Em mapas abertos, a procura A* com 'HeurDist' encontra grandes patamares de nós com o mesmo valor de f(n). Sem
+    desempate, a ordem entre esses nós depende da estrutura do heap, o que é arbitrário e pode levar à expansão de muito
+    mais nós do que o necessário. Cada política acrescenta à prioridade um ou mais critérios secundários, formando uma
+    chave de ordenação (tuplo) que termina num contador de inserção único, pelo que a ordem é determinística e o heap
+    nunca compara diretamente os nós.
+
+    As políticas são:
+    - NENHUM: apenas a prioridade, sem desempate (comportamento original).
+    - MAIOR_G: prefere o nó com maior custo acumulado g(n), ou seja, mais avançado no percurso.
+    - MENOR_H: prefere o nó com menor estimativa h(n), obtida como f(n) - g(n); com f(n) = g(n) + h(n) (A*) equivale a
+      MAIOR_G, e na procura de custo uniforme (h(n) = 0) reduz-se a FIFO.
+    - FIFO: prefere o nó inserido há mais tempo.
+    - LIFO: prefere o nó inserido mais recentemente.
+"""
+
+class Desempate(Enum):
+    NENHUM  = "nenhum"
+    MAIOR_G = "maior_g"
+    MENOR_H = "menor_h"
+    FIFO    = "fifo"
+    LIFO    = "lifo"
+
+
+    # Devolve a chave de ordenação de um nó, formada pela prioridade e pelos critérios de desempate da política, e
+    # terminada pelo contador de inserção.
+    def chave(self, no, contador):
+        prioridade = no.prioridade
+        if self is Desempate.NENHUM:
+            return prioridade
+        if self is Desempate.MAIOR_G:
+            return (prioridade, -no.custo, contador)
+        if self is Desempate.MENOR_H:
+            return (prioridade, prioridade - no.custo, contador)
+        if self is Desempate.FIFO:
+            return (prioridade, contador)
+        return (prioridade, -contador)
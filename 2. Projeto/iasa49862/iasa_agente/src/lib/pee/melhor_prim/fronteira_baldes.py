@@ -0,0 +1,183 @@
+from collections import deque
+
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+
+"""
+    Classe 'FronteiraBaldes', derivada de 'FronteiraPrioridade', responsável por gerir uma fronteira de prioridade
+    organizada em baldes (fila de Dial), adequada a prioridades inteiras pequenas e não negativas.
+
+    Quando os custos das transições são inteiros limitados, como em 'OperadorMover' (custo 1 na grelha) ou em
+    'OperadorIncremento' (quadrado do incremento), as prioridades da procura de custo uniforme, e da procura A* com uma
+    heurística inteira e consistente, nunca diminuem e ficam sempre numa janela estreita acima da prioridade mínima.
+    Nesse caso cada prioridade tem o seu balde (uma fila de nós) e a fronteira avança um cursor sobre os baldes, com
+    inserção e remoção em tempo O(1) amortizado, em vez do custo O(log n) do heap.
+
+    Dentro de cada balde os nós são removidos por ordem de inserção (FIFO), ou pela ordem inversa com a política de
+    desempate LIFO. As políticas que dependem de g(n) ou h(n) não se representam num balde, pelo que com essas políticas
+    a fronteira usa sempre o heap indexado.
+
+    Tal como no heap indexado, cada estado tem no máximo um nó ativo na fronteira: um nó substituído por um percurso
+    melhor fica no seu balde como entrada obsoleta e é descartado quando chega à frente da fila.
+
+    Se for inserida uma prioridade que não seja inteira, que seja inferior ao cursor (prioridades não monótonas, como
+    na procura gulosa) ou que ultrapasse a amplitude máxima de baldes, a fronteira passa de forma transparente a usar o
+    heap indexado da classe base até ser reiniciada.
+"""
+
+class FronteiraBaldes(FronteiraPrioridade):
+
+    # Inicializa uma instância de 'FronteiraBaldes' com um avaliador, uma política de desempate e a amplitude máxima de
+    # prioridades, acima da prioridade mínima, que pode ser gerida com baldes.
+    def __init__(self, avaliador, desempate = Desempate.NENHUM, amplitude_max = 1024):
+
+        # Armazena a amplitude máxima antes de chamar o construtor da classe base, que inicializa a fronteira.
+        self.__amplitude_max = amplitude_max
+
+        # Chama o construtor da classe base 'FronteiraPrioridade', que guarda o avaliador e a política de desempate e
+        # inicializa a fronteira.
+        super().__init__(avaliador, desempate)
+
+
+    # Propriedade que indica se a fronteira está a usar baldes (True) ou o heap indexado da classe base (False).
+    @property
+    def baldes(self):
+        return self._baldes is not None
+
+
+    # Propriedade que indica se a fronteira está vazia, ou seja, se não há nós ativos.
+    @property
+    def vazia(self):
+        return not self._indices
+
+
+    # Propriedade que devolve o número de nós ativos na fronteira (sem contar entradas obsoletas nos baldes).
+    @property
+    def dimensao(self):
+        return len(self._indices)
+
+
+    # Inicializa ou reinicializa a fronteira como vazia, voltando a usar baldes.
+    #
+    # Além do heap e do índice da classe base, cria o dicionário '_baldes', que associa cada prioridade à fila de nós
+    # com essa prioridade, e o cursor '_minimo', que indica a menor prioridade que pode ter nós ativos. Com políticas de
+    # desempate que não se representam num balde, '_baldes' fica a None e a fronteira usa o heap.
+    def iniciar(self):
+        super().iniciar()
+        self._baldes = {} if self._desempate in (Desempate.NENHUM, Desempate.FIFO, Desempate.LIFO) else None
+        self._minimo = None
+
+
+    # Coloca um nó, com a prioridade já calculada, no balde correspondente à sua prioridade.
+    #
+    # Em modo de baldes, o índice '_indices' associa cada estado ao seu nó ativo. Se a prioridade não puder ser gerida
+    # com baldes, a fronteira passa para o heap indexado antes de colocar o nó.
+    def _inserir_no(self, no):
+
+        # Em modo de heap, delega na classe base.
+        if self._baldes is None:
+            super()._inserir_no(no)
+            return
+
+        # Obtém o balde correspondente à prioridade; se a prioridade não for adequada, passa para o heap.
+        chave = self.__chave(no.prioridade)
+        if chave is None:
+            self.__passar_heap()
+            super()._inserir_no(no)
+            return
+
+        # Regista o nó como o nó ativo do seu estado (o nó anterior, se existir, fica obsoleto no seu balde) e
+        # acrescenta-o ao fim do balde.
+        self._indices[no.estado] = no
+        balde = self._baldes.get(chave)
+        if balde is None:
+            balde = self._baldes[chave] = deque()
+        balde.append(no)
+
+
+    # Remove e devolve o nó ativo com a menor prioridade da fronteira.
+    #
+    # O cursor avança sobre os baldes vazios até encontrar um balde com nós; as entradas obsoletas encontradas pelo
+    # caminho são descartadas.
+    def remover(self):
+
+        # Em modo de heap, delega na classe base.
+        if self._baldes is None:
+            return super().remover()
+
+        baldes = self._baldes
+        while True:
+            balde = baldes.get(self._minimo)
+
+            # Balde vazio ou inexistente: remove-o e avança o cursor para a prioridade seguinte.
+            if not balde:
+                baldes.pop(self._minimo, None)
+                self._minimo += 1
+                continue
+
+            # Retira o primeiro nó do balde (o último, com desempate LIFO) e devolve-o se for o nó ativo do seu estado.
+            no = balde.pop() if self._desempate is Desempate.LIFO else balde.popleft()
+            if self._indices.get(no.estado) is no:
+                del self._indices[no.estado]
+                return no
+
+
+    # Devolve, sem o remover, o nó ativo com a menor prioridade da fronteira, descartando as entradas obsoletas que
+    # encontrar.
+    def consultar(self):
+
+        # Em modo de heap, delega na classe base.
+        if self._baldes is None:
+            return super().consultar()
+
+        baldes = self._baldes
+        while True:
+            balde = baldes.get(self._minimo)
+            if not balde:
+                baldes.pop(self._minimo, None)
+                self._minimo += 1
+                continue
+
+            no = balde[-1] if self._desempate is Desempate.LIFO else balde[0]
+            if self._indices.get(no.estado) is no:
+                return no
+            if self._desempate is Desempate.LIFO:
+                balde.pop()
+            else:
+                balde.popleft()
+
+
+    # Devolve a lista dos nós ativos na fronteira.
+    def nos(self):
+        if self._baldes is None:
+            return super().nos()
+        return list(self._indices.values())
+
+
+    # Devolve o balde (prioridade inteira) correspondente a uma prioridade, ou None se a prioridade não puder ser
+    # gerida com baldes: não inteira, inferior ao cursor ou acima da amplitude máxima.
+    def __chave(self, prioridade):
+
+        if isinstance(prioridade, float) and prioridade.is_integer():
+            prioridade = int(prioridade)
+        if not isinstance(prioridade, int) or prioridade < 0:
+            return None
+
+        # Primeira prioridade inserida: posiciona o cursor.
+        if self._minimo is None:
+            self._minimo = prioridade
+        elif not self._minimo <= prioridade <= self._minimo + self.__amplitude_max:
+            return None
+
+        return prioridade
+
+
+    # Passa a fronteira para o heap indexado da classe base, transferindo os nós ativos dos baldes para o heap.
+    def __passar_heap(self):
+
+        nos_ativos = list(self._indices.values())
+        self._baldes = None
+        self._nos = []
+        self._indices = {}
+        for no in nos_ativos:
+            super()._inserir_no(no)
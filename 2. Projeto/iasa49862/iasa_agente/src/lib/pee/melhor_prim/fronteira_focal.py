@@ -0,0 +1,124 @@
+import heapq
+
+from pee.mec_proc.fronteira import Fronteira
+
+"""
+    Classe 'FronteiraFocal', derivada de 'Fronteira', responsável por gerir a fronteira da procura focal (A*ε).
+
+    A fronteira mantém a lista OPEN, ordenada por f(n) = g(n) + h(n) (avaliador principal), e a sublista FOCAL, com os
+    nós de OPEN cujo f(n) não excede (1 + ε)·f_min, onde f_min é o menor f(n) em OPEN. O nó removido é o melhor de FOCAL
+    segundo um segundo avaliador, barato e não necessariamente admissível, como a estimativa dos passos que faltam
+    (h(n), 'AvaliadorSof'). Com uma heurística admissível, o custo da solução não excede (1 + ε) vezes o ótimo.
+
+    As listas são três heaps com remoção diferida, sobre os nós ativos (um por estado, no dicionário '_activos'):
+    - '_open', ordenado por f(n), que fornece f_min;
+    - '_focal', ordenado pela estimativa secundária, com os nós dentro do limite (1 + ε)·f_min;
+    - '_pendentes', ordenado por f(n), com os nós acima do limite, que passam para '_focal' quando f_min aumenta.
+    Uma entrada é obsoleta quando o seu nó deixou de ser o nó ativo do estado (foi removido ou substituído por um
+    percurso melhor) e é descartada quando chega ao topo do heap. Se f_min diminuir, os nós de '_focal' acima do novo
+    limite regressam a '_pendentes' quando chegam ao topo.
+
+    O valor de f_min no momento da última remoção ('f_min') é um limite inferior do custo ótimo, usado pela procura
+    para calcular o limite de subotimalidade da solução.
+"""
+
+class FronteiraFocal(Fronteira):
+
+    # Inicializa a fronteira com o avaliador principal f(n), o avaliador secundário usado em FOCAL e o fator ε.
+    def __init__(self, avaliador, avaliador_focal, epsilon):
+        self.__avaliador = avaliador
+        self.__avaliador_focal = avaliador_focal
+        self.__epsilon = epsilon
+        super().__init__()
+
+
+    # Propriedade que devolve o fator de subotimalidade ε.
+    @property
+    def epsilon(self):
+        return self.__epsilon
+
+
+    # Propriedade que devolve o menor f(n) em OPEN no momento da última remoção.
+    @property
+    def f_min(self):
+        return self._f_min
+
+
+    @property
+    def vazia(self):
+        return not self._activos
+
+
+    @property
+    def dimensao(self):
+        return len(self._activos)
+
+
+    # Inicializa ou reinicializa a fronteira como vazia.
+    def iniciar(self):
+        self._activos = {}
+        self._open = []
+        self._focal = []
+        self._pendentes = []
+        self._contador = 0
+        self._f_min = 0
+
+
+    # Verifica se existe na fronteira um nó para o estado indicado.
+    def contem(self, estado):
+        return estado in self._activos
+
+
+    # Insere um nó na fronteira, calculando f(n) (guardado em 'prioridade') e a estimativa secundária. O nó passa a ser
+    # o nó ativo do seu estado, tornando obsoleto o nó anterior, se existir.
+    def inserir(self, no):
+        no.prioridade = self.__avaliador.prioridade(no)
+        self._activos[no.estado] = no
+
+        self._contador += 1
+        heapq.heappush(self._open, (no.prioridade, self._contador, no))
+        if no.prioridade <= self.__limite(self._open[0][0]):
+            self.__inserir_focal(no)
+        else:
+            heapq.heappush(self._pendentes, (no.prioridade, self._contador, no))
+
+
+    # Remove e devolve o melhor nó de FOCAL segundo a estimativa secundária.
+    def remover(self):
+
+        # Atualiza f_min e passa para FOCAL os nós pendentes dentro do novo limite.
+        self._f_min = self.__actualizar_open()
+        limite = self.__limite(self._f_min)
+        while self._pendentes and self._pendentes[0][0] <= limite:
+            no = heapq.heappop(self._pendentes)[2]
+            if self._activos.get(no.estado) is no:
+                self.__inserir_focal(no)
+
+        # Retira o melhor nó ativo de FOCAL; os nós acima do limite (f_min diminuiu) regressam aos pendentes.
+        while True:
+            _, _, _, no = heapq.heappop(self._focal)
+            if self._activos.get(no.estado) is not no:
+                continue
+            if no.prioridade > limite:
+                heapq.heappush(self._pendentes, (no.prioridade, self._contador, no))
+                continue
+            del self._activos[no.estado]
+            return no
+
+
+    # Descarta as entradas obsoletas do topo de OPEN e devolve o menor f(n) dos nós ativos.
+    def __actualizar_open(self):
+        while self._activos.get(self._open[0][2].estado) is not self._open[0][2]:
+            heapq.heappop(self._open)
+        return self._open[0][0]
+
+
+    # Coloca um nó em FOCAL, ordenado pela estimativa secundária e, em caso de empate, por f(n).
+    def __inserir_focal(self, no):
+        self._contador += 1
+        heapq.heappush(self._focal, (self.__avaliador_focal.prioridade(no), no.prioridade, self._contador, no))
+
+
+    # Devolve o limite (1 + ε)·f de FOCAL para um valor de f_min.
+    def __limite(self, f_min):
+        return (1 + self.__epsilon) * f_min
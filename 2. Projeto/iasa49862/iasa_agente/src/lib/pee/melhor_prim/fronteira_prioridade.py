@@ -1,5 +1,5 @@
 from pee.mec_proc.fronteira import Fronteira
-import heapq
+from pee.melhor_prim.desempate import Desempate
 
 """
     Classe 'FronteiraPrioridade', derivada de 'Fronteira', responsável por gerir uma fronteira de exploração baseada em
@@ -11,8 +11,18 @@ import heapq
     f(n) = g(n) + h(n)), e procura gulosa (prioridade baseada em h(n)).
 
     A classe depende de um avaliador (instância de 'Avaliador' ou suas subclasses) para calcular a prioridade de cada nó,
-    que é armazenada no atributo 'prioridade' do nó. A estrutura de heap, fornecida pelo módulo 'heapq', assegura operações
-    eficientes de inserção e remoção, com complexidade O(log n).
+    que é armazenada no atributo 'prioridade' do nó.
+
+    O heap é indexado por estado: além da lista '_nos' (heap binário), a fronteira mantém o dicionário '_indices', que
+    associa cada estado presente na fronteira à sua posição no heap. Assim, cada estado aparece na fronteira no máximo
+    uma vez; quando 'ProcuraMelhorPrim._manter' aceita um percurso de menor custo para um estado que ainda está na
+    fronteira, o nó é substituído no lugar e reposicionado (operação 'decrease-key'), em vez de ficar no heap uma entrada
+    obsoleta que mais tarde seria removida e expandida de novo. A inserção, a remoção e a substituição têm complexidade
+    O(log n), e o reposicionamento segue o mesmo algoritmo do módulo 'heapq'.
+
+    Cada entrada do heap é um par (chave, nó), ordenado apenas pela chave. A chave é dada pela política de desempate
+    ('Desempate'): por omissão é a própria prioridade; as restantes políticas acrescentam critérios secundários e um
+    contador de inserção, tornando determinística a ordem entre nós com a mesma prioridade.
 
     A fronteira é essencial para controlar a ordem de expansão dos nós no espaço de estados, impactando a eficiência e a
     direção da procura em problemas como o puzzle de 8 peças ou navegação autónoma.
@@ -20,46 +30,179 @@ import heapq
 
 class FronteiraPrioridade(Fronteira):
 
-    # Inicializa uma instância de 'FronteiraPrioridade' com um avaliador específico.
-    def __init__(self, avaliador):
+    # Inicializa uma instância de 'FronteiraPrioridade' com um avaliador específico e uma política de desempate.
+    def __init__(self, avaliador, desempate = Desempate.NENHUM):
+
+        # Armazena a política de desempate, que define a chave de ordenação dos nós no heap; é guardada antes de
+        # inicializar a fronteira, para que subclasses a possam consultar em 'iniciar'.
+        self._desempate = desempate
 
-        # Chama o construtor da classe base 'Fronteira' para inicializar a lista de nós (_nos) como vazia.
+        # Chama o construtor da classe base 'Fronteira' para inicializar o heap de nós (_nos) como vazio.
         super().__init__()
 
         # Armazena o avaliador como um atributo privado, que será usado para calcular a prioridade dos nós inseridos.
         self.__avaliador = avaliador
 
 
+    # Propriedade que devolve a política de desempate da fronteira.
+    @property
+    def desempate(self):
+        return self._desempate
+
+
+    # Inicializa ou reinicializa a fronteira como vazia.
+    #
+    # Sobrescreve o metodo da classe base para usar uma lista como heap binário e o dicionário de posições por estado.
+    #
+    # O contador de inserções, usado nas chaves de desempate, é também reiniciado.
+    def iniciar(self):
+        self._nos = []
+        self._indices = {}
+        self._contador = 0
+
+
+    # Verifica se existe na fronteira um nó para o estado indicado.
+    def contem(self, estado):
+        return estado in self._indices
+
 
     # Insere um nó na fronteira, atribuindo-lhe uma prioridade calculada pelo avaliador.
     #
-    # Este metodo calcula a prioridade do nó usando o avaliador fornecido, armazena-a no atributo 'prioridade' do nó e
-    # insere o nó na estrutura de heap, que mantém os nós ordenados por prioridade (menor prioridade primeiro).
+    # Este metodo calcula a prioridade do nó usando o avaliador fornecido e armazena-a no atributo 'prioridade' do nó.
+    # Se o estado do nó ainda não está na fronteira, o nó é acrescentado ao heap; caso contrário, substitui o nó
+    # existente para esse estado, que é reposicionado no heap de acordo com a nova prioridade (decrease-key).
     #
-    # A inserção é realizada com a função 'heappush' do módulo 'heapq', garantindo complexidade O(log n), onde n é o
-    # número de nós na fronteira. A prioridade determina a ordem de expansão, essencial para algoritmos como A* ou custo
-    # uniforme.
+    # Em ambos os casos a complexidade é O(log n), onde n é o número de nós na fronteira. A prioridade determina a ordem
+    # de expansão, essencial para algoritmos como A* ou custo uniforme.
     def inserir(self, no):
 
         # Calcula a prioridade do nó usando o metodo 'prioridade' do avaliador, que pode retornar g(n) (custo uniforme),
         # f(n) = g(n) + h(n) (A*), ou h(n) (gulosa).
         no.prioridade = self.__avaliador.prioridade(no)
 
-        # Insere o nó na lista '_nos' usando 'heappush', que mantém a propriedade de heap (nó com menor prioridade no
-        # topo), garantindo que o próximo nó removido será o de menor prioridade.
-        heapq.heappush(self._nos, no)
+        # Coloca o nó no heap de acordo com a prioridade calculada.
+        self._inserir_no(no)
+
+
+    # Reinsere na fronteira um nó com a prioridade indicada, em vez da calculada pelo avaliador (e.g., um nó expandido
+    # parcialmente, que volta à fronteira com o menor f(n) dos sucessores por gerar). Tal como 'inserir', substitui o
+    # nó existente para o mesmo estado.
+    def reinserir(self, no, prioridade):
+        no.prioridade = prioridade
+        self._inserir_no(no)
+
+
+    # Coloca no heap um nó cuja prioridade já foi calculada, acrescentando-o ou substituindo o nó existente para o mesmo
+    # estado (decrease-key).
+    def _inserir_no(self, no):
+
+        # Calcula a chave de ordenação do nó segundo a política de desempate.
+        self._contador += 1
+        entrada = (self._desempate.chave(no, self._contador), no)
+
+        # Obtém a posição do estado no heap, se o estado já estiver na fronteira.
+        indice = self._indices.get(no.estado)
+
+        # Estado novo na fronteira: acrescenta a entrada no fim do heap e sobe-a até à sua posição.
+        if indice is None:
+            self._nos.append(entrada)
+            self._indices[no.estado] = len(self._nos) - 1
+            self._subir(0, len(self._nos) - 1)
+
+        # Estado já presente: substitui a entrada no lugar e reposiciona-a, subindo se a chave diminuiu ou descendo se
+        # aumentou.
+        else:
+            anterior = self._nos[indice]
+            self._nos[indice] = entrada
+            if entrada[0] < anterior[0]:
+                self._subir(0, indice)
+            else:
+                self._descer(indice)
+
+
+    # Devolve, sem o remover, o nó com a menor prioridade da fronteira.
+    def consultar(self):
+        return self._nos[0][1]
+
+
+    # Recalcula a prioridade de todos os nós da fronteira com o avaliador (e.g., depois de alterar o peso da
+    # heurística) e reconstrói a fronteira.
+    def reordenar(self):
+        nos = self.nos()
+        self.iniciar()
+        for no in nos:
+            self.inserir(no)
+
 
+    # Metodo que devolve a lista dos nós ativos na fronteira, por ordem arbitrária (e.g., para calcular o menor f(n)
+    # da fronteira em 'ProcuraARAA').
+    def nos(self):
+        return [entrada[1] for entrada in self._nos]
 
 
     # Remove e devolve o nó com a menor prioridade da fronteira.
     #
-    # Este metodo extrai o nó com a menor prioridade da estrutura de heap usando 'heappop', garantindo que o nó mais
-    # prioritário (com menor valor de prioridade) seja retornado para expansão.
+    # Este metodo extrai o nó do topo do heap, garantindo que o nó mais prioritário (com menor valor de prioridade) seja
+    # retornado para expansão, e remove o seu estado do índice de posições.
     #
     # A remoção tem complexidade O(log n), onde n é o número de nós na fronteira, e é essencial para algoritmos que
     # exploram nós na ordem de prioridade, como procura de custo uniforme, A*, ou gulosa.
     def remover(self):
 
-        # Remove e devolve o nó no topo do heap (menor prioridade) usando 'heappop', que mantém a propriedade de heap
-        # após a remoção.
-        return heapq.heappop(self._nos)
\ No newline at end of file
+        # Retira a última entrada do heap; se o heap ficar vazio, essa entrada é o próprio topo.
+        ultimo = self._nos.pop()
+        if self._nos:
+
+            # Caso contrário, a última entrada ocupa o topo e desce até à sua posição, devolvendo o topo anterior.
+            no = self._nos[0][1]
+            self._nos[0] = ultimo
+            self._indices[ultimo[1].estado] = 0
+            self._descer(0)
+        else:
+            no = ultimo[1]
+
+        # Remove o estado do nó devolvido do índice de posições, deixando de estar na fronteira.
+        del self._indices[no.estado]
+        return no
+
+
+    # Sobe a entrada na posição 'pos' em direção ao topo (até à posição 'inicio') enquanto tiver menor chave que a sua
+    # antecessora no heap, atualizando as posições no índice. Equivalente a 'heapq._siftdown'.
+    def _subir(self, inicio, pos):
+        nos = self._nos
+        indices = self._indices
+        entrada = nos[pos]
+        chave = entrada[0]
+        while pos > inicio:
+            pos_pai = (pos - 1) >> 1
+            pai = nos[pos_pai]
+            if chave < pai[0]:
+                nos[pos] = pai
+                indices[pai[1].estado] = pos
+                pos = pos_pai
+                continue
+            break
+        nos[pos] = entrada
+        indices[entrada[1].estado] = pos
+
+
+    # Desce a entrada na posição 'pos' até uma folha, promovendo sempre o filho de menor chave, e sobe-a depois até à
+    # sua posição final, atualizando as posições no índice. Equivalente a 'heapq._siftup'.
+    def _descer(self, pos):
+        nos = self._nos
+        indices = self._indices
+        fim = len(nos)
+        inicio = pos
+        entrada = nos[pos]
+        filho = 2 * pos + 1
+        while filho < fim:
+            direito = filho + 1
+            if direito < fim and not nos[filho][0] < nos[direito][0]:
+                filho = direito
+            nos[pos] = nos[filho]
+            indices[nos[pos][1].estado] = pos
+            pos = filho
+            filho = 2 * pos + 1
+        nos[pos] = entrada
+        indices[entrada[1].estado] = pos
+        self._subir(inicio, pos)
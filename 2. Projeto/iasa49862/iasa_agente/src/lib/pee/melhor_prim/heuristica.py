@@ -7,7 +7,28 @@ class Heuristica:
         estado atual até o estado objetivo em algoritmos como A* e procura gulosa. A heurística é essencial para
         direcionar a procura em direção a estados promissores, reduzindo o número de nós expandidos em comparação com
         algoritmos não informados, como procura de custo uniforme ou largura.
+
+        Uma heurística pode declarar-se consistente (monotónica), ou seja, h(s) <= c(s,s') + h(s') para qualquer
+        transição de s para s' com custo c(s,s'). Com uma heurística consistente, a procura A* expande cada estado no
+        máximo uma vez, já pelo percurso de menor custo, pelo que não precisa de reabrir estados fechados. Por omissão
+        uma heurística não se declara consistente.
     """
 
+    # Tolerância usada na verificação da consistência, para absorver erros de arredondamento de heurísticas reais.
+    TOLERANCIA = 1e-9
+
+
+    # Propriedade que indica se a heurística é consistente; as subclasses consistentes devem devolver True.
+    @property
+    def consistente(self):
+        return False
+
+
     def h(self, estado):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+
+    # Verifica a condição de consistência h(s) <= c(s,s') + h(s') para uma transição do estado 's' para o estado
+    # sucessor 's_suc' com custo 'custo'. Usado em modo de depuração para validar a declaração de consistência.
+    def verificar_consistencia(self, estado, custo, estado_suc):
+        return self.h(estado) <= custo + self.h(estado_suc) + Heuristica.TOLERANCIA
@@ -0,0 +1,108 @@
+import math
+
+from pee.melhor_prim.heuristica import Heuristica
+
+"""
+    Classe 'HeuristicaMemo', que implementa uma heurística com memorização (memoization) dos valores de outra
+    heurística.
+
+    Os avaliadores das procuras informadas ('AvaliadorAA', 'AvaliadorSof') calculam h(n) para cada nó gerado, incluindo
+    os nós para estados repetidos que são depois descartados. Esta classe guarda o valor de h de cada estado num
+    dicionário indexado pelo identificador do estado ('Estado.id_valor'), pelo que cada estado só é avaliado pela
+    heurística original uma vez enquanto estiver na memória. É útil para heurísticas dispendiosas (e.g., heurísticas de
+    marcos ou bases de dados de padrões), cujo custo passa a ser pago uma vez por estado.
+
+    A memória pode ter uma capacidade máxima (número de estados): quando está cheia, o valor de um novo estado substitui
+    o valor consultado há mais tempo (os valores são mantidos no dicionário por ordem de consulta). Por omissão a
+    capacidade é ilimitada.
+
+    O âmbito da memória depende do uso: com 'AvaliadorHeur.dim_memo', o avaliador cria uma nova memória em cada procura;
+    uma instância criada explicitamente e passada a várias procuras (e.g., replaneamentos para o mesmo objetivo, como no
+    'PlaneadorPEE') partilha os valores entre elas. São registadas as consultas e os acertos ('taxa_acertos'). A
+    consistência declarada é a da heurística original.
+"""
+
+class HeuristicaMemo(Heuristica):
+
+    # Inicializa a memorização da heurística indicada, com a capacidade máxima (número de estados) da memória, que tem
+    # de ser pelo menos 1.
+    def __init__(self, heuristica, capacidade = math.inf):
+        if capacidade < 1:
+            raise ValueError("a capacidade da memória tem de ser pelo menos 1")
+        self.__heuristica = heuristica
+        self.__capacidade = capacidade
+        self.limpar()
+
+
+    # Propriedade que devolve a heurística original.
+    @property
+    def heuristica(self):
+        return self.__heuristica
+
+
+    # Propriedade que devolve a capacidade máxima da memória.
+    @property
+    def capacidade(self):
+        return self.__capacidade
+
+
+    # A heurística memorizada é consistente se a heurística original o for.
+    @property
+    def consistente(self):
+        return self.__heuristica.consistente
+
+
+    # Propriedade que devolve o número de estados na memória.
+    @property
+    def dimensao(self):
+        return len(self.__valores)
+
+
+    # Propriedade que devolve o número de consultas desde a última limpeza.
+    @property
+    def consultas(self):
+        return self.__consultas
+
+
+    # Propriedade que devolve o número de consultas respondidas pela memória desde a última limpeza.
+    @property
+    def acertos(self):
+        return self.__acertos
+
+
+    # Propriedade que devolve a fração das consultas respondidas pela memória (0 se não houve consultas).
+    @property
+    def taxa_acertos(self):
+        return self.__acertos / self.__consultas if self.__consultas else 0
+
+
+    # Esvazia a memória e reinicia os contadores.
+    def limpar(self):
+        self.__valores = {}
+        self.__consultas = 0
+        self.__acertos = 0
+
+
+    # Devolve o valor de h do estado, calculado pela heurística original apenas se não estiver na memória.
+    def h(self, estado):
+
+        self.__consultas += 1
+        chave = estado.id_valor()
+        valores = self.__valores
+
+        # Com a capacidade limitada, o valor consultado é retirado e volta a ser colocado no fim da ordem de
+        # substituição.
+        if self.__capacidade == math.inf:
+            valor = valores.get(chave)
+        else:
+            valor = valores.pop(chave, None)
+
+        if valor is not None:
+            self.__acertos += 1
+        else:
+            valor = self.__heuristica.h(estado)
+            if len(valores) >= self.__capacidade:
+                del valores[next(iter(valores))]
+
+        valores[chave] = valor
+        return valor
@@ -1,6 +1,9 @@
 from pee.melhor_prim.procura_informada import ProcuraInformada
 from pee.melhor_prim.procura_melhor_prim import ProcuraMelhorPrim
 from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_baldes import FronteiraBaldes
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
 
 """
     Classe 'ProcuraAA', derivada de 'ProcuraMelhorPrim', responsável por implementar o algoritmo de procura A*.
@@ -16,6 +19,19 @@ from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
     a prioridade com base em f(n) = g(n) + h(n). É adequada para problemas como o puzzle
     de 8 peças, onde a distância de Manhattan é uma heurística comum, ou navegação autónoma, onde a distância euclidiana
     pode guiar a procura.
+
+    Quando a heurística se declara consistente ('Heuristica.consistente'), a procura usa uma lista fechada: com uma
+    heurística consistente, um estado é expandido pela primeira vez já pelo percurso de menor custo, pelo que qualquer
+    sucessor para um estado fechado é descartado sem comparar custos e nenhum estado é reaberto. Os nós expandidos
+    deixam também de ser guardados em '_explorados', que passa a conter apenas os nós abertos; os estados fechados ficam
+    registados apenas no conjunto '_fechados'.
+
+    Um filtro de estados visitados ('filtro') também ativa a lista fechada, pelo que só é aceite com uma heurística
+    declarada consistente: com outra heurística, a procura poderia devolver uma solução de custo superior ao ótimo.
+
+    Em modo de depuração (sem a opção -O do Python), a consistência declarada é verificada por amostragem: a cada
+    'intervalo_verificacao' expansões, todas as transições do nó expandido são testadas com
+    'Heuristica.verificar_consistencia', falhando com 'AssertionError' se a heurística não for consistente.
 """
 
 class ProcuraAA(ProcuraInformada):
@@ -28,11 +44,72 @@ class ProcuraAA(ProcuraInformada):
     #
     # A classe base 'ProcuraMelhorPrim' inicializa a 'FronteiraPrioridade' e gerencia a lógica de procura em grafos,
     # incluindo a gestão de estados repetidos, enquanto 'ProcuraAA' define a estratégia de avaliação específica para A*.
-    def __init__(self):
+    #
+    # Com 'baldes' a True, a fronteira é uma 'FronteiraBaldes' (fila de Dial), útil quando os custos e a heurística são
+    # inteiros; com uma heurística real, como 'HeurDist', a fronteira passa automaticamente a usar o heap. A política de
+    # 'desempate' define a ordem entre nós com o mesmo f(n), relevante nos patamares dos mapas abertos.
+    #
+    # O 'intervalo_verificacao' define de quantas em quantas expansões é verificada a consistência da heurística em modo
+    # de depuração (0 desativa a verificação).
+    def __init__(self, baldes = False, desempate = Desempate.NENHUM, intervalo_verificacao = 64):
+
+        # Armazena o intervalo de verificação da consistência da heurística.
+        self.__intervalo_verificacao = intervalo_verificacao
+
+        # A lista fechada só é ativada em 'procurar', de acordo com a heurística fornecida.
+        self.__lista_fechada = False
 
         # Incializa o AvaliadorAA
         avaliador_aa = AvaliadorAA()
 
+        # Cria a fronteira de baldes, se selecionada, ou a 'FronteiraPrioridade', com a política de desempate indicada.
+        if baldes:
+            fronteira = FronteiraBaldes(avaliador_aa, desempate)
+        else:
+            fronteira = FronteiraPrioridade(avaliador_aa, desempate)
+
         # Chama o construtor da classe base 'ProcuraMelhorPrim', passando o avaliador para configurar a fronteira e a
         # lógica de procura com base em A*.
-        super().__init__(avaliador_aa)
\ No newline at end of file
+        super().__init__(avaliador_aa, fronteira)
+
+
+    # Propriedade que indica se a última procura usou a lista fechada (heurística consistente ou filtro de estados
+    # visitados).
+    @property
+    def lista_fechada(self):
+        return self.__lista_fechada or self._filtro is not None
+
+
+    # Executa a procura A* com a heurística fornecida, ativando a lista fechada se a heurística for consistente. Gera
+    # 'ValueError' se houver um filtro de estados visitados e a heurística não for declarada consistente.
+    def procurar(self, problema, heuristica):
+        if self._filtro is not None and not heuristica.consistente:
+            raise ValueError(f"a procura '{type(self).__name__}' só aceita um filtro de estados visitados com uma "
+                             f"heurística declarada consistente")
+        self.__lista_fechada = heuristica.consistente
+        return super().procurar(problema, heuristica)
+
+
+    # Metodo protegido '_usar_lista_fechada', que ativa a lista fechada quando a heurística é consistente, além do
+    # caso da classe base (filtro de estados visitados, apenas aceite com uma heurística consistente).
+    def _usar_lista_fechada(self):
+        return self.__lista_fechada or super()._usar_lista_fechada()
+
+
+    # Metodo protegido '_expandir', responsável por expandir um nó.
+    #
+    # Com a lista fechada e uma heurística declarada consistente, em modo de depuração as transições do nó são
+    # verificadas por amostragem.
+    def _expandir(self, problema, no):
+        sucessores = super()._expandir(problema, no)
+
+        if self.__lista_fechada:
+            if __debug__ and self.__intervalo_verificacao and \
+                    self._estatisticas.nos_expandidos % self.__intervalo_verificacao == 0:
+                heuristica = self._avaliador.heuristica
+                for no_sucessor in sucessores:
+                    assert heuristica.verificar_consistencia(no.estado, no_sucessor.custo - no.custo,
+                                                             no_sucessor.estado), \
+                        f"Heurística declarada consistente mas h(s) > c(s,s') + h(s') para {no.estado}"
+
+        return sucessores
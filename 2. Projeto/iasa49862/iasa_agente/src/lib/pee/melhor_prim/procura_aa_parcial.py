@@ -0,0 +1,76 @@
+import math
+
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+from pee.melhor_prim.heuristica import Heuristica
+from pee.melhor_prim.procura_informada import ProcuraInformada
+
+"""
+    Classe 'ProcuraAAParcial', derivada de 'ProcuraInformada', responsável por implementar a procura A* com expansão
+    parcial (Partial Expansion A*, PEA*).
+
+    Na procura A*, cada expansão guarda na fronteira todos os sucessores do nó, mas em problemas com um fator de
+    ramificação elevado (e.g., 'ProblemaContagem' com muitos incrementos) a maior parte deles nunca chega a ser
+    expandida. Na expansão parcial, o valor F guardado em cada nó da fronteira ('prioridade') começa por ser o seu f(n) e
+    a expansão mantém apenas os sucessores com f(n) igual a F; os restantes são descartados sem serem guardados. Se
+    algum sucessor foi descartado, o nó regressa à fronteira com F igual ao menor f(n) desses sucessores, para voltar a
+    ser expandido quando esse valor for o menor da fronteira, gerando então os sucessores correspondentes.
+
+    Na primeira expansão de um nó, os sucessores com f(n) inferior a F (possíveis com heurísticas inconsistentes) são
+    mantidos com os de f(n) igual a F.
+    A ordem de expansão dos nós com cada valor de f(n) é a da procura A*, pelo que a solução é ótima com uma heurística
+    admissível, trocando memória por reexpansões: o número de reinserções é registado em
+    'EstatisticasProcura.nos_reinseridos'. O nó reinserido continua a ser o nó memorizado para o seu estado em
+    '_explorados'; se entretanto for encontrado um percurso melhor para esse estado, o novo nó substitui-o na fronteira e
+    recomeça as expansões parciais a partir do seu próprio f(n).
+
+    Cada expansão, parcial ou não, constrói todos os sucessores do nó para calcular o seu f(n), pelo que todos são
+    contados em 'EstatisticasProcura.nos_gerados', incluindo os descartados: a expansão parcial reduz os nós guardados
+    em memória ('nos_em_memoria'), não os nós gerados, que aumentam com as reexpansões.
+"""
+
+class ProcuraAAParcial(ProcuraInformada):
+
+    # Inicializa uma instância de 'ProcuraAAParcial' com o avaliador 'AvaliadorAA' e a política de desempate.
+    def __init__(self, desempate = Desempate.NENHUM):
+        avaliador = AvaliadorAA()
+        super().__init__(avaliador, FronteiraPrioridade(avaliador, desempate))
+
+
+    # A procura reinsere os nós parcialmente expandidos, que têm de continuar em '_explorados', pelo que não aceita o
+    # filtro de estados visitados (nem usa a lista fechada).
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Metodo protegido '_expandir', responsável por expandir parcialmente um nó.
+    #
+    # Na primeira expansão do nó devolve os sucessores com f(n) não superior ao valor F; nas seguintes, apenas os
+    # sucessores com f(n) igual a F, pois os de f(n) inferior foram gerados nas anteriores. Se houver sucessores
+    # descartados, reinsere o nó na fronteira com o menor f(n) entre eles como novo valor F. Os sucessores descartados
+    # são contados nos nós gerados, tal como os devolvidos (contados em 'MecanismoProcura.procurar').
+    def _expandir(self, problema, no):
+
+        limite = no.prioridade + Heuristica.TOLERANCIA
+        if no.prioridade > self._avaliador.prioridade(no) + Heuristica.TOLERANCIA:
+            minimo = no.prioridade - Heuristica.TOLERANCIA
+        else:
+            minimo = -math.inf
+
+        gerados = super()._expandir(problema, no)
+        sucessores = []
+        proximo = None
+        for no_sucessor in gerados:
+            prioridade = self._avaliador.prioridade(no_sucessor)
+            if minimo <= prioridade <= limite:
+                sucessores.append(no_sucessor)
+            elif prioridade > limite and (proximo is None or prioridade < proximo):
+                proximo = prioridade
+
+        if proximo is not None:
+            self._fronteira.reinserir(no, proximo)
+            self._estatisticas.nos_reinseridos += 1
+
+        self._estatisticas.nos_gerados += len(gerados) - len(sucessores)
+        return sucessores
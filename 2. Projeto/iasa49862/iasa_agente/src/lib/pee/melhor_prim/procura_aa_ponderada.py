@@ -0,0 +1,26 @@
+from pee.melhor_prim.aval.avaliador_aa_ponderado import AvaliadorAAPonderado
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+from pee.melhor_prim.procura_informada import ProcuraInformada
+
+"""
+    Classe 'ProcuraAAPonderada', derivada de 'ProcuraInformada', responsável por implementar a procura A* ponderada
+    (Weighted A*).
+
+    A procura ordena a fronteira por f(n) = g(n) + w·h(n) ('AvaliadorAAPonderado'). Com uma heurística admissível e
+    w >= 1, o custo da solução encontrada é no máximo w vezes o custo ótimo, e a procura expande em geral muito menos
+    nós do que a procura A*, sendo adequada quando o tempo de planeamento é limitado.
+"""
+
+class ProcuraAAPonderada(ProcuraInformada):
+
+    # Inicializa uma instância de 'ProcuraAAPonderada' com o peso da heurística e a política de desempate.
+    def __init__(self, peso = 2.0, desempate = Desempate.NENHUM):
+        avaliador = AvaliadorAAPonderado(peso)
+        super().__init__(avaliador, FronteiraPrioridade(avaliador, desempate))
+
+
+    # Propriedade que devolve o peso da heurística.
+    @property
+    def peso(self):
+        return self._avaliador.peso
@@ -0,0 +1,180 @@
+import math
+import time
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_aa_ponderado import AvaliadorAAPonderado
+from pee.melhor_prim.procura_informada import ProcuraInformada
+
+"""
+    Classe 'ProcuraARAA', derivada de 'ProcuraInformada', responsável por implementar a procura anytime ARA* (Anytime
+    Repairing A*).
+
+    A procura começa como uma procura A* ponderada, com f(n) = g(n) + w·h(n) ('AvaliadorAAPonderado') e um peso inicial
+    elevado, encontrando rapidamente uma solução cujo custo não excede w vezes o ótimo. Enquanto houver orçamento de
+    tempo ou de expansões, o peso é reduzido e a solução é melhorada, reutilizando o esforço das iterações anteriores:
+    - os custos g(n) e os percursos já encontrados para cada estado ('_explorados') são mantidos entre iterações;
+    - numa iteração, cada estado é expandido no máximo uma vez; um estado fechado cujo custo diminui não é reaberto,
+      sendo guardado em '_inconsistentes' para ser expandido apenas na iteração seguinte;
+    - no início de cada iteração, a fronteira passa a conter os nós abertos e inconsistentes, com as prioridades
+      recalculadas para o novo peso ('FronteiraPrioridade.reordenar').
+
+    Uma iteração termina quando o menor f(n) da fronteira não é inferior ao custo da melhor solução. Para cada solução
+    é registado o limite de subotimalidade min(w, custo / min(g(n) + h(n))), calculado sobre os nós abertos e
+    inconsistentes; com um limite de 1 a solução é ótima e a procura termina.
+
+    A primeira iteração é sempre concluída, para que exista uma solução sempre que o problema tenha solução; o
+    orçamento ('tempo_max', em segundos, e 'max_expansoes') aplica-se às iterações de melhoria, sendo devolvida a melhor
+    solução encontrada quando se esgota.
+"""
+
+class ProcuraARAA(ProcuraInformada):
+
+    # Inicializa uma instância de 'ProcuraARAA' com o peso inicial da heurística, o decremento do peso entre iterações
+    # e o orçamento de tempo e de expansões (None para não limitar).
+    def __init__(self, peso_inicial = 3.0, decremento = 0.5, tempo_max = None, max_expansoes = None):
+        super().__init__(AvaliadorAAPonderado(peso_inicial))
+        self.__peso_inicial = peso_inicial
+        self.__decremento = decremento
+        self.__tempo_max = tempo_max
+        self.__max_expansoes = max_expansoes
+        self.__solucoes = []
+
+
+    # Propriedade que devolve as soluções da última procura, pela ordem em que foram publicadas, cada uma como um tuplo
+    # (peso, custo, limite de subotimalidade, nós expandidos acumulados, tempo decorrido).
+    @property
+    def solucoes(self):
+        return self.__solucoes
+
+
+    # Inicializa a memória da procura: a fronteira, os nós por estado ('_explorados'), os estados fechados na iteração
+    # corrente ('_fechados') e os nós inconsistentes ('_inconsistentes').
+    def _iniciar_memoria(self):
+        super()._iniciar_memoria()
+        self._inconsistentes = {}
+
+
+    # A procura ARA* reabre estados entre iterações e mantém os nós expandidos em '_explorados', pelo que não aceita o
+    # filtro de estados visitados (nem usa a lista fechada).
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura ARA* para o problema e a heurística fornecidos, devolvendo a melhor solução encontrada dentro do
+    # orçamento, ou None se o problema não tiver solução.
+    def procurar(self, problema, heuristica):
+
+        self._avaliador.heuristica = heuristica
+        self._avaliador.peso = self.__peso_inicial
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+        self.__solucoes = []
+
+        # Memoriza o nó inicial, que pode ser já uma solução.
+        no = No(problema.estado_inicial)
+        estatisticas.nos_gerados += 1
+        self._explorados[no.estado] = no
+        self._fronteira.inserir(no)
+        self.__no_objectivo = no if problema.objectivo(no.estado) else None
+
+        # Primeira iteração, sempre concluída.
+        self.__melhorar(problema, False)
+
+        while self.__no_objectivo is not None:
+
+            limite = self.__publicar()
+            if limite <= 1 or not self.__melhorar_peso(problema):
+                break
+
+        estatisticas.terminar()
+        if self.__no_objectivo is None:
+            return None
+        return Solucao(self.__no_objectivo)
+
+
+    # Reduz o peso e executa uma iteração de melhoria, indicando se foi concluída dentro do orçamento.
+    def __melhorar_peso(self, problema):
+
+        if self.__esgotado():
+            return False
+
+        # Reduz o peso, juntando os nós inconsistentes aos abertos e recalculando as prioridades para o novo peso.
+        self._avaliador.peso = max(1.0, self._avaliador.peso - self.__decremento)
+        for no in self._inconsistentes.values():
+            self._fronteira.inserir(no)
+        self._inconsistentes = {}
+        self._fronteira.reordenar()
+        self._fechados = set()
+
+        return self.__melhorar(problema, True)
+
+
+    # Expande nós por ordem de f(n) até que nenhum nó da fronteira possa melhorar a solução atual, ou até esgotar o
+    # orçamento (apenas com 'limitada' a True). Indica se a iteração foi concluída.
+    def __melhorar(self, problema, limitada):
+
+        estatisticas = self._estatisticas
+        fronteira = self._fronteira
+
+        while not fronteira.vazia:
+
+            if self.__no_objectivo is not None and fronteira.consultar().prioridade >= self.__no_objectivo.custo:
+                return True
+
+            if limitada and self.__esgotado():
+                return False
+
+            no = fronteira.remover()
+            sucessores = self._expandir(problema, no)
+            estatisticas.nos_expandidos += 1
+            estatisticas.nos_gerados += len(sucessores)
+
+            for no_sucessor in sucessores:
+
+                # Mantém o sucessor apenas se melhorar o custo conhecido para o seu estado.
+                existente = self._explorados.get(no_sucessor.estado)
+                if existente is not None and existente.custo <= no_sucessor.custo:
+                    estatisticas.nos_podados += 1
+                    continue
+                self._explorados[no_sucessor.estado] = no_sucessor
+
+                if problema.objectivo(no_sucessor.estado) and \
+                        (self.__no_objectivo is None or no_sucessor.custo < self.__no_objectivo.custo):
+                    self.__no_objectivo = no_sucessor
+
+                # Um estado fechado nesta iteração não é reaberto: fica inconsistente até à iteração seguinte.
+                if no_sucessor.estado in self._fechados:
+                    estatisticas.nos_reabertos += 1
+                    self._inconsistentes[no_sucessor.estado] = no_sucessor
+                else:
+                    fronteira.inserir(no_sucessor)
+
+            estatisticas.actualizar_memoria(fronteira.dimensao, len(self._explorados))
+
+        return True
+
+
+    # Regista a solução atual com o seu limite de subotimalidade, que é devolvido.
+    def __publicar(self):
+
+        heuristica = self._avaliador.heuristica
+        custo = self.__no_objectivo.custo
+        nos = self._fronteira.nos() + list(self._inconsistentes.values())
+        minimo = min((no.custo + heuristica.h(no.estado) for no in nos), default = math.inf)
+        limite = min(self._avaliador.peso, custo / minimo) if minimo > 0 else self._avaliador.peso
+        limite = max(limite, 1.0)
+
+        self.__solucoes.append((self._avaliador.peso, custo, limite, self._estatisticas.nos_expandidos,
+                                time.perf_counter() - self._estatisticas.inicio))
+        return limite
+
+
+    # Indica se o orçamento de tempo ou de expansões se esgotou.
+    def __esgotado(self):
+        estatisticas = self._estatisticas
+        if self.__max_expansoes is not None and estatisticas.nos_expandidos >= self.__max_expansoes:
+            return True
+        return self.__tempo_max is not None and time.perf_counter() - estatisticas.inicio >= self.__tempo_max
@@ -1,4 +1,7 @@
 from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
+from pee.melhor_prim.desempate import Desempate
+from pee.melhor_prim.fronteira_baldes import FronteiraBaldes
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
 from pee.melhor_prim.procura_melhor_prim import ProcuraMelhorPrim
 
 """
@@ -14,13 +17,23 @@ from pee.melhor_prim.procura_melhor_prim import ProcuraMelhorPrim
 class ProcuraCustoUnif(ProcuraMelhorPrim):
 
     # Inicializa uma instância do algoritmo de procura de custo uniforme.
-    def __init__(self):
+    #
+    # Com 'baldes' a True, a fronteira é uma 'FronteiraBaldes' (fila de Dial), adequada quando os custos das transições
+    # são inteiros pequenos e não negativos; caso contrário a fronteira passa automaticamente a usar o heap. A política
+    # de 'desempate' define a ordem entre nós com o mesmo custo acumulado.
+    def __init__(self, baldes = False, desempate = Desempate.NENHUM):
 
         # Cria uma nova instância de `AvaliadorCustoUnif`, que será usada para avaliar nós com base no custo acumulado
         # g(n)
         avaliador_custo_unif = AvaliadorCustoUnif()
 
+        # Cria a fronteira de baldes, se selecionada, ou a 'FronteiraPrioridade', com a política de desempate indicada.
+        if baldes:
+            fronteira = FronteiraBaldes(avaliador_custo_unif, desempate)
+        else:
+            fronteira = FronteiraPrioridade(avaliador_custo_unif, desempate)
+
         # Chama o construtor da classe base `ProcuraMelhorPrim`, passando o avaliador de custo uniforme para configurar
         # a estratégia de ordenação da fronteira.
-        super().__init__(avaliador_custo_unif)
+        super().__init__(avaliador_custo_unif, fronteira)
 
@@ -0,0 +1,58 @@
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.aval.avaliador_heur import AvaliadorHeur
+from pee.melhor_prim.aval.avaliador_sof import AvaliadorSof
+from pee.melhor_prim.fronteira_focal import FronteiraFocal
+from pee.melhor_prim.procura_informada import ProcuraInformada
+
+"""
+    Classe 'ProcuraFocal', derivada de 'ProcuraInformada', responsável por implementar a procura focal (A*ε).
+
+    A procura usa uma 'FronteiraFocal': a lista OPEN é ordenada por f(n) = g(n) + h(n) ('AvaliadorAA') e o nó expandido
+    é escolhido na sublista FOCAL, com os nós cujo f(n) não excede (1 + ε)·f_min, segundo uma estimativa secundária
+    (por omissão h(n), 'AvaliadorSof', que aproxima os passos que faltam). O fator ε controla o compromisso entre o
+    tempo de procura e a qualidade da solução: com ε = 0 a procura comporta-se como A*; valores maiores expandem menos
+    nós à custa de soluções possivelmente mais caras.
+
+    A gestão de estados repetidos é a de 'ProcuraMelhorPrim' ('_memorizar'/'_manter'): um estado é reaberto sempre
+    que é encontrado um percurso de menor custo, o que é necessário porque os nós não são expandidos por ordem de
+    f(n). Com uma heurística admissível, f_min é um limite inferior do custo ótimo C*, pelo que a solução, removida de
+    FOCAL com custo g <= (1 + ε)·f_min, satisfaz g <= (1 + ε)·C*. O limite efetivo g / f_min, calculado no momento em
+    que a solução é encontrada, é disponibilizado em 'limite_subotimalidade'.
+"""
+
+class ProcuraFocal(ProcuraInformada):
+
+    # Inicializa uma instância de 'ProcuraFocal' com o fator ε e, opcionalmente, o avaliador da estimativa secundária.
+    def __init__(self, epsilon = 0.5, avaliador_focal = None):
+        avaliador_aa = AvaliadorAA()
+        self.__avaliador_focal = avaliador_focal if avaliador_focal is not None else AvaliadorSof()
+        super().__init__(avaliador_aa, FronteiraFocal(avaliador_aa, self.__avaliador_focal, epsilon))
+        self.__limite_subotimalidade = None
+
+
+    # Propriedade que devolve o limite de subotimalidade (custo / f_min) da última solução encontrada, ou None.
+    @property
+    def limite_subotimalidade(self):
+        return self.__limite_subotimalidade
+
+
+    # A procura focal não expande os nós por ordem de f(n) e reabre os estados alcançados por um percurso de menor
+    # custo, pelo que não aceita o filtro de estados visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura focal com a heurística fornecida, que é também usada pela estimativa secundária se esta for
+    # heurística, e calcula o limite de subotimalidade da solução.
+    def procurar(self, problema, heuristica):
+
+        if isinstance(self.__avaliador_focal, AvaliadorHeur):
+            self.__avaliador_focal.heuristica = heuristica
+
+        solucao = super().procurar(problema, heuristica)
+
+        self.__limite_subotimalidade = None
+        if solucao:
+            f_min = self._fronteira.f_min
+            self.__limite_subotimalidade = solucao.custo / f_min if f_min > 0 else 1.0
+        return solucao
@@ -8,3 +8,24 @@ class ProcuraInformada(ProcuraMelhorPrim):
         self._avaliador.heuristica = heuristica
 
         return super().procurar(problema)
+
+
+    # Propriedade que devolve a heurística usada pelo avaliador na última procura, que é uma 'HeuristicaMemo' (com as
+    # consultas e os acertos da memória) se a memorização estiver ativa.
+    @property
+    def heuristica(self):
+        return self._avaliador.heuristica
+
+
+    # Propriedade que devolve a capacidade da memorização da heurística do avaliador ('AvaliadorHeur.dim_memo'), ou
+    # None se estiver desativada.
+    @property
+    def dim_memo(self):
+        return self._avaliador.dim_memo
+
+
+    # Ativa a memorização da heurística em cada procura, com a capacidade indicada ('math.inf' para ilimitada), ou
+    # desativa-a com None.
+    @dim_memo.setter
+    def dim_memo(self, value):
+        self._avaliador.dim_memo = value
@@ -25,11 +25,14 @@ class ProcuraMelhorPrim(ProcuraGrafo):
     #
     # O avaliador é armazenado como atributo para uso no metodo '_manter', que compara prioridades de nós com estados
     # repetidos.
-    def __init__(self, avaliador):
+    #
+    # Opcionalmente pode ser fornecida outra fronteira de prioridade (e.g., 'FronteiraBaldes'), já configurada com o
+    # mesmo avaliador.
+    def __init__(self, avaliador, fronteira = None):
 
-        # Chama o construtor da classe base 'ProcuraGrafo', passando uma 'FronteiraPrioridade' inicializada com o
-        # avaliador, que ordenará os nós com base na prioridade calculada.
-        super().__init__( FronteiraPrioridade(avaliador) )
+        # Chama o construtor da classe base 'ProcuraGrafo', passando a fronteira fornecida ou, por omissão, uma
+        # 'FronteiraPrioridade' inicializada com o avaliador, que ordenará os nós com base na prioridade calculada.
+        super().__init__( fronteira if fronteira is not None else FronteiraPrioridade(avaliador) )
 
         # Armazena o avaliador como atributo para uso em '_manter', permitindo comparar prioridades de nós com estados
         # repetidos.
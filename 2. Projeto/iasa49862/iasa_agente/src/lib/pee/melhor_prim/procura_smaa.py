@@ -0,0 +1,354 @@
+import heapq
+import math
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.procura_informada import ProcuraInformada
+
+"""
+    Classe 'ProcuraSMAA', derivada de 'ProcuraInformada', responsável por implementar uma versão simplificada da procura
+    A* com memória limitada (Simplified Memory-bounded A*, SMA*).
+
+    A procura A* guarda em memória todos os nós gerados, o que pode esgotar a memória em mapas muito grandes. A procura
+    SMA* mantém em memória uma árvore de procura com no máximo 'max_nos' nós e, tal como A*, escolhe sempre o candidato
+    com menor f(n) = g(n) + h(n) (o mais profundo, em caso de empate). Quando um nó é expandido, o f(n) de cada
+    sucessor é guardado no nó, associado ao estado do sucessor, mas só o melhor sucessor é memorizado; cada nova escolha
+    do nó memoriza o melhor dos sucessores restantes. Quando a memória está cheia e é preciso guardar um novo nó, é
+    esquecida a pior folha (maior f(n), a menos profunda em caso de empate), e o seu f(n) volta a ser guardado no
+    antecessor. Um nó com sucessores fora da memória é candidato com o menor f(n) desses sucessores, e um sucessor
+    esquecido e regenerado recupera o valor aprendido antes de ser esquecido.
+
+    O valor de f(n) de cada nó expandido é atualizado (propagado para os antecessores) como o menor f(n) dos sucessores
+    em memória e fora da memória. Os sucessores herdam o valor de f(n) do antecessor se este for superior ao seu
+    (pathmax). Os nós na profundidade máxima ('max_nos' - 1) que não são objetivo não podem ter sucessores em memória,
+    pelo que têm f(n) infinito e não são guardados.
+
+    A procura é ótima se o percurso da solução ótima couber na memória disponível (profundidade inferior a 'max_nos').
+    Quando a memória não chega para nenhuma solução, o f(n) do nó inicial torna-se infinito e a procura devolve None;
+    como cada percurso que cabe na memória pode ter de ser explorado, isso pode exigir muitas expansões quando
+    'max_nos' é próximo da profundidade da solução. Os sucessores cujo estado já foi alcançado por um percurso de
+    custo e profundidade menores ou iguais são descartados, evitando ciclos e percursos redundantes: além dos nós em
+    memória, é mantido um registo do melhor custo de no máximo 'max_nos' estados, que continua a descartar os percursos
+    alternativos para um estado depois de o nó ser esquecido. O argumento opcional 'max_expansoes' limita o número de
+    expansões, devolvendo None quando é atingido.
+
+    Um sucessor fora da memória é regenerado aplicando apenas o operador guardado com o seu f(n), sem voltar a expandir
+    o antecessor. A propriedade 'nos_em_memoria' conta, além dos nós em memória (no máximo 'max_nos'), os registos de
+    '_custos' (no máximo 'max_nos') e os f(n) guardados dos sucessores fora da memória (no máximo um por operador de
+    cada nó expandido em memória); as entradas desatualizadas dos heaps são removidas sempre que estes excedem
+    'FATOR_COMPACTACAO' vezes 'max_nos' entradas, pelo que a memória usada é limitada por 'max_nos'. O número de nós
+    esquecidos é registado em 'EstatisticasProcura.nos_esquecidos'.
+"""
+
+class ProcuraSMAA(ProcuraInformada):
+
+    # Número de entradas de cada heap, em múltiplos de 'max_nos', a partir do qual as entradas desatualizadas são
+    # removidas.
+    FATOR_COMPACTACAO = 2
+
+    # Inicializa uma instância da procura SMA* com o número máximo de nós em memória, o número máximo de expansões (None
+    # para não limitar) e o avaliador 'AvaliadorAA'.
+    def __init__(self, max_nos, max_expansoes = None):
+        super().__init__(AvaliadorAA())
+        self.__max_nos = max_nos
+        self.__max_expansoes = max_expansoes
+
+
+    # Propriedade que devolve o número máximo de nós em memória.
+    @property
+    def max_nos(self):
+        return self.__max_nos
+
+
+    # Inicializa a memória da procura.
+    #
+    # A árvore em memória é representada pelo dicionário '_filhos', que associa cada nó em memória à lista dos seus
+    # sucessores em memória. O dicionário '_pendentes' associa cada nó expandido a um dicionário com o f(n), o custo e o
+    # operador de cada sucessor fora da memória (ainda não memorizado ou esquecido), indexado pelo estado; o total destas
+    # entradas é mantido em '__num_pendentes'. '_estados' associa cada estado ao nó em memória de menor custo para esse
+    # estado, e '_custos' guarda, para no máximo 'max_nos' estados, o custo, a profundidade e o estado antecessor do
+    # melhor percurso memorizado, mesmo depois de o nó ser esquecido.
+    #
+    # Os nós candidatos estão em '_abertos', associados à sua chave (f(n) de um nó por expandir, ou o menor f(n) dos
+    # sucessores fora da memória de um nó expandido). A escolha do melhor candidato e da pior folha usa dois heaps com
+    # remoção diferida: as entradas desatualizadas são ignoradas quando chegam ao topo.
+    def _iniciar_memoria(self):
+        self._filhos = {}
+        self._pendentes = {}
+        self._estados = {}
+        self._custos = {}
+        self._abertos = {}
+        self.__heap_abertos = []
+        self.__heap_folhas = []
+        self.__contador = 0
+        self.__num_pendentes = 0
+
+
+    # Executa a procura SMA* para o problema e a heurística fornecidos, devolvendo a solução ou None se não existir
+    # solução cujo percurso caiba na memória disponível ou se for atingido o número máximo de expansões.
+    def procurar(self, problema, heuristica):
+
+        self._avaliador.heuristica = heuristica
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+        self.__problema = problema
+
+        # Cria e memoriza o nó inicial.
+        self.__raiz = No(problema.estado_inicial)
+        self.__raiz.prioridade = self._avaliador.prioridade(self.__raiz)
+        estatisticas.nos_gerados += 1
+        self.__memorizar(self.__raiz)
+
+        # Sem nenhum percurso que caiba na memória, o f(n) do nó inicial torna-se infinito.
+        while self.__raiz.prioridade < math.inf and estatisticas.nos_expandidos != self.__max_expansoes:
+
+            # Obtém o candidato com menor chave; sem candidatos com chave finita, não há solução em memória.
+            no = self.__remover_melhor()
+            if no is None:
+                break
+
+            if problema.objectivo(no.estado):
+                estatisticas.terminar()
+                return Solucao(no)
+
+            # Na primeira escolha, expande o nó e guarda o f(n) de cada sucessor.
+            if no not in self._pendentes:
+                self.__expandir_pendentes(no)
+
+            # Memoriza o melhor sucessor fora da memória, esquecendo as piores folhas (nunca o nó escolhido) para lhe
+            # dar lugar.
+            no_sucessor = self.__regenerar(no)
+            if no_sucessor is not None:
+                while len(self._filhos) >= self.__max_nos:
+                    self.__esquecer(self.__remover_pior(no))
+                self.__memorizar(no_sucessor)
+
+            # Atualiza o valor de f(n) do nó e dos seus antecessores e a sua chave como candidato.
+            self.__actualizar(no)
+            self.__abrir(no)
+
+            estatisticas.actualizar_memoria(len(self._abertos),
+                                            len(self._filhos) + len(self._custos) + self.__num_pendentes)
+
+        estatisticas.terminar()
+        return None
+
+
+    # Expande um nó, gerando os seus sucessores, sem o registar na lista de fechados de 'ProcuraGrafo', que cresceria
+    # sem limite.
+    def _expandir(self, problema, no):
+        return MecanismoProcura._expandir(self, problema, no)
+
+
+    # A procura esquece e regenera nós, e os estados repetidos são descartados pelos nós em memória e por '_custos',
+    # pelo que não aceita o filtro de estados visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Expande um nó e guarda o f(n) de cada sucessor não descartado (com pathmax), com o custo e o operador que o gera;
+    # os sucessores na profundidade máxima que não são objetivo têm f(n) infinito e não são guardados.
+    def __expandir_pendentes(self, no):
+        sucessores = self._expandir(self.__problema, no)
+        self._estatisticas.nos_expandidos += 1
+        self._estatisticas.nos_gerados += len(sucessores)
+
+        pendentes = self._pendentes[no] = {}
+        for no_sucessor in sucessores:
+            if self.__descartar(no_sucessor):
+                continue
+            if no_sucessor.profundidade >= self.__max_nos - 1 and not self.__problema.objectivo(no_sucessor.estado):
+                continue
+            prioridade = max(self._avaliador.prioridade(no_sucessor), no.prioridade)
+            self.__guardar_pendente(pendentes, no_sucessor, prioridade)
+        self.__num_pendentes += len(pendentes)
+
+
+    # Guarda o f(n), o custo e o operador de um sucessor fora da memória, se forem melhores que os guardados para o seu
+    # estado.
+    def __guardar_pendente(self, pendentes, no, prioridade):
+        existente = pendentes.get(no.estado)
+        if existente is None or (prioridade, no.custo) < existente[:2]:
+            pendentes[no.estado] = (prioridade, no.custo, no.operador)
+
+
+    # Regenera o sucessor fora da memória com menor f(n), aplicando apenas o operador guardado, que recupera o valor
+    # guardado, ou devolve None se não houver nenhum. Um sucessor cujo estado entretanto foi memorizado por um percurso
+    # melhor é descartado.
+    def __regenerar(self, no):
+        pendentes = self._pendentes[no]
+        while pendentes:
+            estado = min(pendentes, key = lambda estado: pendentes[estado][:2])
+            prioridade, custo, operador = pendentes.pop(estado)
+            self.__num_pendentes -= 1
+            no_sucessor = No(estado, operador, no, custo)
+            self._estatisticas.nos_gerados += 1
+            if not self.__descartar(no_sucessor):
+                no_sucessor.prioridade = prioridade
+                return no_sucessor
+        return None
+
+
+    # Indica se um sucessor deve ser descartado por o seu estado já ter sido alcançado por um percurso de custo e
+    # profundidade menores ou iguais: um nó em memória (o que inclui os ciclos) ou um registo de '_custos' de outro
+    # antecessor. O percurso registado continua representado na árvore, em memória ou pelo f(n) guardado num
+    # antecessor, pelo que o descarte não compromete a solução ótima.
+    def __descartar(self, no):
+        existente = self._estados.get(no.estado)
+        if existente is not None and existente.custo <= no.custo and existente.profundidade <= no.profundidade:
+            self._estatisticas.nos_podados += 1
+            return True
+        registo = self._custos.get(no.estado)
+        if registo is not None and registo[0] <= no.custo and registo[1] <= no.profundidade and \
+                registo[2] != no.antecessor.estado:
+            self._estatisticas.nos_podados += 1
+            return True
+        return False
+
+
+    # Regista o custo e a profundidade do percurso de um nó memorizado, se for melhor que o registado para o estado. Os
+    # registos são mantidos por ordem de atualização e, com 'max_nos' registos, é removido o mais antigo.
+    def __registar_custo(self, no):
+        registo = self._custos.get(no.estado)
+        if registo is None or (no.custo, no.profundidade) < registo[:2]:
+            self._custos.pop(no.estado, None)
+            if len(self._custos) >= self.__max_nos:
+                del self._custos[next(iter(self._custos))]
+            self._custos[no.estado] = (no.custo, no.profundidade, no.antecessor.estado)
+
+
+    # Memoriza um nó como uma nova folha da árvore em memória, candidata à expansão.
+    def __memorizar(self, no):
+        self._filhos[no] = []
+        if no.antecessor is not None:
+            self._filhos[no.antecessor].append(no)
+        existente = self._estados.get(no.estado)
+        if existente is None or no.custo < existente.custo:
+            self._estados[no.estado] = no
+        if no.antecessor is not None:
+            self.__registar_custo(no)
+        self.__abrir(no)
+        self.__inserir_folha(no)
+
+
+    # Esquece uma folha, removendo-a da memória e guardando o seu f(n) no antecessor, que volta a ser candidato com o
+    # menor f(n) dos sucessores fora da memória.
+    def __esquecer(self, no):
+        self._estatisticas.nos_esquecidos += 1
+
+        del self._filhos[no]
+        self._abertos.pop(no, None)
+        self.__num_pendentes -= len(self._pendentes.pop(no, {}))
+        if self._estados.get(no.estado) is no:
+            del self._estados[no.estado]
+
+        antecessor = no.antecessor
+        self._filhos[antecessor].remove(no)
+        if no.prioridade < math.inf:
+            pendentes = self._pendentes[antecessor]
+            if no.estado not in pendentes:
+                self.__num_pendentes += 1
+            self.__guardar_pendente(pendentes, no, no.prioridade)
+        self.__abrir(antecessor)
+        if not self._filhos[antecessor]:
+            self.__inserir_folha(antecessor)
+
+
+    # Atualiza o f(n) de um nó expandido como o menor f(n) dos sucessores em memória e fora da memória, propagando a
+    # alteração aos antecessores.
+    def __actualizar(self, no):
+        while no is not None:
+            filhos = self._filhos[no]
+            prioridade = min((filho.prioridade for filho in filhos), default = math.inf)
+            prioridade = min(prioridade, self.__melhor_pendente(no))
+            if prioridade == no.prioridade:
+                break
+            no.prioridade = prioridade
+            if not filhos:
+                self.__inserir_folha(no)
+            no = no.antecessor
+
+
+    # Devolve o menor f(n) dos sucessores fora da memória de um nó expandido (infinito se não houver).
+    def __melhor_pendente(self, no):
+        pendentes = self._pendentes[no]
+        return min(pendente[0] for pendente in pendentes.values()) if pendentes else math.inf
+
+
+    # Atualiza a chave de um nó como candidato: f(n) se ainda não foi expandido, ou o menor f(n) dos sucessores fora da
+    # memória; nós com chave infinita não são candidatos.
+    def __abrir(self, no):
+        chave = self.__melhor_pendente(no) if no in self._pendentes else no.prioridade
+        if chave == math.inf:
+            self._abertos.pop(no, None)
+        elif self._abertos.get(no) != chave:
+            self._abertos[no] = chave
+            self.__contador += 1
+            heapq.heappush(self.__heap_abertos, (chave, -no.profundidade, self.__contador, no))
+            if len(self.__heap_abertos) > self.FATOR_COMPACTACAO * self.__max_nos:
+                self.__heap_abertos = self.__compactar(self.__heap_abertos,
+                                                       lambda entrada: self._abertos.get(entrada[3]) == entrada[0])
+
+
+    # Regista uma folha como candidata a ser esquecida, com o seu f(n) atual.
+    def __inserir_folha(self, no):
+        self.__contador += 1
+        heapq.heappush(self.__heap_folhas, (-no.prioridade, no.profundidade, self.__contador, no))
+        if len(self.__heap_folhas) > self.FATOR_COMPACTACAO * self.__max_nos:
+            self.__heap_folhas = self.__compactar(self.__heap_folhas, self.__folha_valida)
+
+
+    # Indica se uma entrada do heap das folhas corresponde a uma folha em memória, que não é o nó inicial, com o seu
+    # f(n) atual.
+    def __folha_valida(self, entrada):
+        no = entrada[3]
+        return no in self._filhos and not self._filhos[no] and -entrada[0] == no.prioridade and no is not self.__raiz
+
+
+    # Devolve um novo heap apenas com as entradas válidas de um heap, mantendo uma entrada por nó (a primeira a sair do
+    # heap). As entradas desatualizadas mantêm referências para nós esquecidos e, através dos antecessores, para os seus
+    # percursos, pelo que a compactação é necessária para limitar a memória.
+    def __compactar(self, heap, valida):
+        entradas = {}
+        for entrada in heap:
+            if valida(entrada):
+                no = entrada[3]
+                if no not in entradas or entrada < entradas[no]:
+                    entradas[no] = entrada
+        heap = list(entradas.values())
+        heapq.heapify(heap)
+        return heap
+
+
+    # Remove e devolve o candidato com menor chave (o mais profundo, em caso de empate), ou None se não houver
+    # candidatos.
+    def __remover_melhor(self):
+        while self.__heap_abertos:
+            chave, _, _, no = heapq.heappop(self.__heap_abertos)
+            if self._abertos.get(no) == chave:
+                del self._abertos[no]
+                return no
+        return None
+
+
+    # Remove e devolve a folha com maior f(n) (a menos profunda, em caso de empate), excluindo o nó inicial e o nó
+    # indicado, que está a ser expandido. Gera 'RuntimeError' se não houver nenhuma folha que possa ser esquecida.
+    def __remover_pior(self, excluido):
+        excluidas = []
+        while True:
+            if not self.__heap_folhas:
+                raise RuntimeError(f"não há folhas que possam ser esquecidas para memorizar um sucessor com "
+                                   f"'max_nos' = {self.__max_nos}")
+            entrada = heapq.heappop(self.__heap_folhas)
+            no = entrada[3]
+            if self.__folha_valida(entrada):
+                if no is excluido:
+                    excluidas.append(entrada)
+                    continue
+                for excluida in excluidas:
+                    heapq.heappush(self.__heap_folhas, excluida)
+                return no
@@ -0,0 +1,22 @@
+from pee.proc_densa.procura_densa import ProcuraDensa
+
+"""
+    Classe 'ProcuraAADensa', derivada de 'ProcuraDensa', que implementa a procura A* com a memória em vetores indexados
+    pelo código denso dos estados.
+
+    Tal como a 'ProcuraAA', expande os nós por ordem de f(n) = g(n) + h(n) e encontra a solução ótima com uma heurística
+    admissível. Com uma heurística consistente, nenhum estado é reaberto; com uma heurística apenas admissível, os estados
+    fechados alcançados por um percurso de menor custo são reabertos ('EstatisticasProcura.nos_reabertos').
+"""
+
+class ProcuraAADensa(ProcuraDensa):
+
+    # Executa a procura A* com a heurística fornecida.
+    def procurar(self, problema, heuristica):
+        self.__heuristica = heuristica
+        return super().procurar(problema)
+
+
+    # A prioridade de um nó é f(n) = g(n) + h(n).
+    def _prioridade(self, custo, estado):
+        return custo + self.__heuristica.h(estado)
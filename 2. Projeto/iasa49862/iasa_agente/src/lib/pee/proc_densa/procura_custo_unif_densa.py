@@ -0,0 +1,15 @@
+from pee.proc_densa.procura_densa import ProcuraDensa
+
+"""
+    Classe 'ProcuraCustoUnifDensa', derivada de 'ProcuraDensa', que implementa a procura de custo uniforme com a memória
+    em vetores indexados pelo código denso dos estados.
+
+    Tal como a 'ProcuraCustoUnif', expande os nós por ordem do custo acumulado g(n) e encontra a solução de menor custo,
+    desde que os custos dos operadores sejam positivos.
+"""
+
+class ProcuraCustoUnifDensa(ProcuraDensa):
+
+    # A prioridade de um nó é o seu custo acumulado g(n).
+    def _prioridade(self, custo, estado):
+        return custo
@@ -0,0 +1,169 @@
+import heapq
+import math
+from abc import abstractmethod
+from array import array
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+
+"""
+    Classe abstrata 'ProcuraDensa', derivada de 'MecanismoProcura', responsável por implementar as procuras de melhor
+    primeiro em grafos cuja memória é guardada em vetores indexados pelo código denso dos estados.
+
+    Nas procuras em grafos ('ProcuraGrafo'), os nós explorados e os estados fechados são guardados em dicionários e
+    conjuntos indexados pelos estados, o que obriga a calcular a dispersão ('Estado.__hash__') e a comparar estados em
+    cada consulta. Quando o problema tem uma codificação densa dos estados ('Problema.num_codigos' e 'Problema.codigo',
+    e.g., as células do 'ModeloMundo'), esta procura guarda, num vetor por atributo indexado pelo código do estado:
+    - 'custos': o menor custo conhecido g(n) (infinito se o estado ainda não foi alcançado);
+    - 'antecessores': o código do estado antecessor no melhor percurso (-1 no estado inicial);
+    - 'operadores': o índice do operador do problema que gerou o estado;
+    - 'fechados': se o estado já foi expandido;
+    - 'estados': o estado, para ser expandido e para reconstruir a solução.
+
+    Não são criados objetos 'No' durante a procura: a fronteira é um heap de entradas (prioridade, ordem, custo, código),
+    com os empates resolvidos por ordem de inserção. Um sucessor é mantido se o seu custo for menor do que o custo
+    conhecido do estado (reabrindo-o, se já tiver sido expandido); as entradas de percursos entretanto melhorados são
+    ignoradas quando retiradas ('EstatisticasProcura.nos_obsoletos'). A solução é reconstruída percorrendo os códigos dos
+    antecessores desde o estado objetivo, recalculando os custos com os operadores, que mantêm assim o seu tipo numérico
+    em vez dos reais do vetor 'custos'. As subclasses definem a prioridade dos nós.
+"""
+
+class ProcuraDensa(MecanismoProcura):
+
+    # Inicializa a procura sem fronteira; a fronteira e a memória são criadas em cada procura.
+    def __init__(self):
+        super().__init__(None)
+
+
+    # Inicializa a memória de uma procura, com os vetores dimensionados para o número de códigos do problema.
+    def _iniciar_memoria(self, num_codigos):
+        self._custos = array("d", [math.inf]) * num_codigos
+        self._antecessores = array("i", [-1]) * num_codigos
+        self._operadores = array("h", [-1]) * num_codigos
+        self._fechados = bytearray(num_codigos)
+        self._estados = [None] * num_codigos
+        self._abertos = []
+        self._alcancados = 0
+
+
+    # Número de nós guardados pela procura: os estados alcançados, um por código.
+    def _nos_memoria(self, no):
+        return self._alcancados
+
+
+    # Metodo abstrato '_prioridade', que devolve a prioridade de um nó com o custo e o estado indicados.
+    @abstractmethod
+    def _prioridade(self, custo, estado):
+        """Abstract Method"""
+
+
+    # Os estados alcançados são registados nos vetores indexados pelo código, pelo que a procura não aceita o filtro
+    # de estados visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura para o problema fornecido, devolvendo a solução encontrada ou None se não existir solução.
+    # Gera 'ValueError' se o problema não tiver uma codificação densa dos estados ('Problema.num_codigos').
+    def procurar(self, problema):
+
+        num_codigos = problema.num_codigos()
+        if num_codigos is None:
+            raise ValueError(f"a procura '{type(self).__name__}' requer um problema com codificação densa dos estados "
+                             f"('Problema.num_codigos')")
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria(num_codigos)
+
+        custos = self._custos
+        antecessores = self._antecessores
+        operadores_estado = self._operadores
+        fechados = self._fechados
+        estados = self._estados
+        abertos = self._abertos
+        operadores = list(enumerate(problema.operadores))
+        codigo = problema.codigo
+        ordem = 0
+
+        # Memoriza o estado inicial.
+        estado = problema.estado_inicial
+        codigo_inicial = codigo(estado)
+        custos[codigo_inicial] = 0
+        estados[codigo_inicial] = estado
+        self._alcancados = 1
+        heapq.heappush(abertos, (self._prioridade(0, estado), ordem, 0, codigo_inicial))
+        estatisticas.nos_gerados += 1
+
+        while abertos:
+
+            _, _, custo, codigo_estado = heapq.heappop(abertos)
+
+            # Ignora a entrada se o percurso do estado tiver sido melhorado depois de ter sido inserida.
+            if custo > custos[codigo_estado]:
+                estatisticas.nos_obsoletos += 1
+                continue
+
+            estado = estados[codigo_estado]
+            if problema.objectivo(estado):
+                solucao = self.__solucao(problema, codigo_estado)
+                estatisticas.terminar()
+                return solucao
+
+            fechados[codigo_estado] = 1
+            for indice_op, operador in operadores:
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is None:
+                    continue
+                estatisticas.nos_gerados += 1
+
+                # Mantém o sucessor apenas se o estado for novo ou o percurso for de menor custo.
+                custo_suc = custo + operador.custo(estado, estado_suc)
+                codigo_suc = codigo(estado_suc)
+                custo_anterior = custos[codigo_suc]
+                if custo_suc >= custo_anterior:
+                    estatisticas.nos_podados += 1
+                    continue
+
+                if custo_anterior == math.inf:
+                    self._alcancados += 1
+                elif fechados[codigo_suc]:
+                    fechados[codigo_suc] = 0
+                    estatisticas.nos_reabertos += 1
+
+                custos[codigo_suc] = custo_suc
+                antecessores[codigo_suc] = codigo_estado
+                operadores_estado[codigo_suc] = indice_op
+                estados[codigo_suc] = estado_suc
+                ordem += 1
+                heapq.heappush(abertos, (self._prioridade(custo_suc, estado_suc), ordem, custo_suc, codigo_suc))
+
+            estatisticas.nos_expandidos += 1
+            estatisticas.actualizar_memoria(len(abertos), self._alcancados)
+
+        estatisticas.terminar()
+        return None
+
+
+    # Reconstrói a solução que termina no estado com o código indicado, percorrendo os códigos dos antecessores e
+    # recalculando os custos com os operadores.
+    def __solucao(self, problema, codigo_estado):
+
+        percurso = []
+        while codigo_estado != -1:
+            percurso.append(codigo_estado)
+            codigo_estado = self._antecessores[codigo_estado]
+        percurso.reverse()
+
+        no = None
+        for codigo_estado in percurso:
+            indice_op = self._operadores[codigo_estado]
+            if indice_op == -1:
+                no = No(self._estados[codigo_estado])
+            else:
+                operador = problema.operadores[indice_op]
+                estado = self._estados[codigo_estado]
+                no = No(estado, operador, no, no.custo + operador.custo(no.estado, estado))
+        return Solucao(no)
@@ -0,0 +1,25 @@
+from pee.mec_proc.no import No
+
+"""
+    Classe 'NoFronteira', derivada de 'No', que representa um nó aberto da procura de fronteira ('ProcuraFronteira').
+
+    Ao contrário dos nós das restantes procuras, um nó da procura de fronteira não guarda o antecessor nem o operador que
+    o gerou, pois os nós fechados são libertados e o percurso é reconstruído no fim da procura. Em seu lugar, o nó guarda:
+    - 'usados', os bits dos operadores já usados (bit i para o operador i do problema), que ligam o estado a vizinhos já
+      gerados e não podem voltar a ser aplicados;
+    - 'meio', o estado intermédio do seu percurso à profundidade escolhida para a divisão do percurso, ou None se o nó
+      ainda não passou essa profundidade.
+"""
+
+class NoFronteira(No):
+
+    __slots__ = ("usados", "meio")
+
+
+    # Inicializa um nó com o estado, o custo e a profundidade do seu percurso, os bits dos operadores usados e o estado
+    # intermédio do percurso.
+    def __init__(self, estado, custo = 0, profundidade = 0, usados = 0, meio = None):
+        super().__init__(estado, custo = custo)
+        self.profundidade = profundidade
+        self.usados = usados
+        self.meio = meio
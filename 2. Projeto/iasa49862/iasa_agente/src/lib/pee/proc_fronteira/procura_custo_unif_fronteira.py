@@ -0,0 +1,24 @@
+from pee.melhor_prim.aval.avaliador_custo_unif import AvaliadorCustoUnif
+from pee.melhor_prim.fronteira_prioridade import FronteiraPrioridade
+from pee.proc_fronteira.procura_fronteira import ProcuraFronteira
+
+"""
+    Classe 'ProcuraCustoUnifFronteira', derivada de 'ProcuraFronteira', que implementa a procura de custo uniforme sem
+    lista de fechados (Uniform-Cost Frontier Search).
+
+    Tal como a 'ProcuraCustoUnif', ordena a fronteira pelo custo g(n) ('FronteiraPrioridade' com 'AvaliadorCustoUnif') e
+    encontra a solução de menor custo, mas guarda apenas os nós abertos, com os bits dos operadores usados. Quando é
+    encontrado um percurso mais barato para um estado aberto, o nó é atualizado e reposicionado na fronteira
+    (decrease-key); o percurso é reconstruído por divisão e conquista.
+"""
+
+class ProcuraCustoUnifFronteira(ProcuraFronteira):
+
+    # Inicializa a procura com uma fronteira de prioridade ordenada por g(n).
+    def __init__(self):
+        super().__init__(FronteiraPrioridade(AvaliadorCustoUnif()))
+
+
+    # A procura de custo uniforme minimiza o custo do percurso.
+    def _medida(self, custo, profundidade):
+        return custo
@@ -0,0 +1,187 @@
+from abc import abstractmethod
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.proc_fronteira.no_fronteira import NoFronteira
+
+"""
+    Classe abstrata 'ProcuraFronteira', derivada de 'MecanismoProcura', responsável por implementar a procura de
+    fronteira (Frontier Search), uma procura em grafos sem lista de fechados.
+
+    Numa procura em grafos ('ProcuraGrafo'), todos os estados gerados ficam em '_explorados' até ao fim da procura, o
+    que domina a memória das procuras em largura e de custo uniforme em espaços grandes. Na procura de fronteira só são
+    guardados os nós abertos ('_abertos', indexados por estado): um nó expandido é libertado. Para que um estado fechado
+    não volte a ser gerado, cada nó aberto guarda os bits dos operadores que o ligam a vizinhos já gerados ('usados'):
+    quando um nó é expandido, cada sucessor recebe (ou, se já estiver aberto, acrescenta) o bit do operador inverso, que
+    leva do sucessor de volta ao nó expandido, e esse operador não é aplicado quando o sucessor for expandido. O
+    operador inverso é obtido aplicando os operadores do problema ao sucessor, e é memorizado para cada operador.
+
+    Sem antecessores, o percurso é reconstruído por divisão e conquista: depois de encontrado o objetivo à
+    profundidade d, a procura é repetida desde o estado inicial até ao estado objetivo, propagando em cada nó o estado do
+    seu percurso à profundidade d // 2 ('meio'). O percurso é depois reconstruído recursivamente nas duas metades, até
+    que cada segmento tenha um só passo, cujo operador é o de menor custo entre os dois estados. Cada segmento é uma
+    procura ótima entre os seus extremos, pelo que a solução tem o custo ótimo; as estatísticas acumulam todas as
+    procuras, e a memória é a da maior fronteira, em vez da área explorada.
+
+    Os operadores do problema devem ser reversíveis, como os movimentos do 'ModeloMundo' (grafo não orientado). Com
+    operadores irreversíveis, um estado fechado pode voltar a ser gerado e expandido, o que mantém a procura correta mas
+    aumenta o trabalho. As subclasses definem a fronteira e a medida do percurso que é minimizada.
+"""
+
+class ProcuraFronteira(MecanismoProcura):
+
+    # Inicializa a procura de fronteira com a fronteira que define a ordem de expansão.
+    def __init__(self, fronteira):
+        super().__init__(fronteira)
+
+
+    # Inicializa a memória de uma procura: a fronteira e os nós abertos por estado.
+    def _iniciar_memoria(self):
+        super()._iniciar_memoria()
+        self._abertos = {}
+
+
+    # Número de nós guardados pela procura: apenas os nós abertos.
+    def _nos_memoria(self, no):
+        return len(self._abertos)
+
+
+    # Metodo abstrato '_medida', que devolve a medida minimizada pela procura (e.g., profundidade ou custo) de um
+    # percurso com o custo e a profundidade indicados.
+    @abstractmethod
+    def _medida(self, custo, profundidade):
+        """Abstract Method"""
+
+
+    # Executa a procura de fronteira para o problema, devolvendo a solução encontrada ou None se não existir.
+    def procurar(self, problema):
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self.__inversos = {}
+
+        no_final = self.__procurar_segmento(problema, problema.estado_inicial, problema.objectivo, None)
+        if no_final is None:
+            estatisticas.terminar()
+            return None
+
+        # Reconstrói os passos do percurso e constrói a cadeia de nós da solução.
+        passos = self.__reconstruir(problema, problema.estado_inicial, no_final.estado, no_final.profundidade)
+        no = No(problema.estado_inicial)
+        for operador, estado in passos:
+            no = No(estado, operador, no, no.custo + operador.custo(no.estado, estado))
+
+        estatisticas.terminar()
+        return Solucao(no)
+
+
+    # Reconstrói os passos (operador, estado) de um percurso ótimo entre dois estados, cujo percurso encontrado pela
+    # procura tem a profundidade indicada, dividindo-o pelo estado intermédio.
+    def __reconstruir(self, problema, estado_inicial, estado_final, profundidade):
+
+        if profundidade == 0:
+            return []
+        if profundidade == 1:
+            return [(self.__operador_directo(problema, estado_inicial, estado_final), estado_final)]
+
+        # Procura o segmento registando o estado intermédio; se o percurso encontrado tiver outra profundidade (e.g.,
+        # um percurso de igual custo com outro número de passos), a procura é repetida com a profundidade correta.
+        objectivo = lambda estado: estado == estado_final
+        prof_meio = profundidade // 2
+        no = self.__procurar_segmento(problema, estado_inicial, objectivo, prof_meio)
+        if no.profundidade != profundidade:
+            profundidade = no.profundidade
+            if profundidade <= 1:
+                return self.__reconstruir(problema, estado_inicial, estado_final, profundidade)
+            prof_meio = profundidade // 2
+            no = self.__procurar_segmento(problema, estado_inicial, objectivo, prof_meio)
+
+        meio = no.meio
+        return self.__reconstruir(problema, estado_inicial, meio, prof_meio) + \
+            self.__reconstruir(problema, meio, estado_final, profundidade - prof_meio)
+
+
+    # Executa uma procura de fronteira desde o estado inicial até um estado que satisfaça o objetivo, devolvendo o nó
+    # objetivo ou None. Com 'prof_meio', cada nó guarda o estado do seu percurso a essa profundidade.
+    def __procurar_segmento(self, problema, estado_inicial, objectivo, prof_meio):
+
+        estatisticas = self._estatisticas
+        operadores = problema.operadores
+        self._iniciar_memoria()
+
+        no = NoFronteira(estado_inicial)
+        estatisticas.nos_gerados += 1
+        self._abertos[no.estado] = no
+        self._fronteira.inserir(no)
+
+        while not self._fronteira.vazia:
+
+            no = self._fronteira.remover()
+            del self._abertos[no.estado]
+
+            if objectivo(no.estado):
+                return no
+
+            # Aplica os operadores ainda não usados; o nó expandido é libertado no fim da iteração.
+            estado = no.estado
+            profundidade = no.profundidade + 1
+            for indice, operador in enumerate(operadores):
+
+                if no.usados & (1 << indice):
+                    continue
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is None:
+                    continue
+
+                estatisticas.nos_gerados += 1
+                custo = no.custo + operador.custo(estado, estado_suc)
+                inverso = self.__inverso(operadores, indice, estado, estado_suc)
+                meio = no.meio
+                if meio is None and profundidade == prof_meio:
+                    meio = estado_suc
+
+                existente = self._abertos.get(estado_suc)
+                if existente is None:
+                    no_sucessor = NoFronteira(estado_suc, custo, profundidade, inverso, meio)
+                    self._abertos[estado_suc] = no_sucessor
+                    self._fronteira.inserir(no_sucessor)
+                    continue
+
+                # Estado já aberto: regista o operador inverso e, se o novo percurso for melhor, atualiza o nó.
+                existente.usados |= inverso
+                if self._medida(custo, profundidade) < self._medida(existente.custo, existente.profundidade):
+                    existente.custo = custo
+                    existente.profundidade = profundidade
+                    existente.meio = meio
+                    self._fronteira.inserir(existente)
+                else:
+                    estatisticas.nos_podados += 1
+
+            estatisticas.nos_expandidos += 1
+            estatisticas.actualizar_memoria(self._fronteira.dimensao, self._nos_memoria(no))
+
+        return None
+
+
+    # Devolve o bit do operador que leva do sucessor de volta ao estado expandido, ou 0 se não existir. O índice do
+    # operador inverso de cada operador é memorizado e confirmado antes de ser reutilizado.
+    def __inverso(self, operadores, indice, estado, estado_suc):
+
+        indice_inv = self.__inversos.get(indice)
+        if indice_inv is not None and operadores[indice_inv].aplicar(estado_suc) == estado:
+            return 1 << indice_inv
+
+        for indice_inv, operador in enumerate(operadores):
+            if operador.aplicar(estado_suc) == estado:
+                self.__inversos[indice] = indice_inv
+                return 1 << indice_inv
+        return 0
+
+
+    # Devolve o operador de menor custo que leva diretamente de um estado ao outro.
+    @staticmethod
+    def __operador_directo(problema, estado, estado_suc):
+        return min((operador for operador in problema.operadores if operador.aplicar(estado) == estado_suc),
+                   key = lambda operador: operador.custo(estado, estado_suc))
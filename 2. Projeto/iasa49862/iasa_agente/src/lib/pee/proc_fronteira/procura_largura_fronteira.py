@@ -0,0 +1,22 @@
+from pee.larg.fronteira_fifo import FronteiraFIFO
+from pee.proc_fronteira.procura_fronteira import ProcuraFronteira
+
+"""
+    Classe 'ProcuraLarguraFronteira', derivada de 'ProcuraFronteira', que implementa a procura em largura sem lista de
+    fechados (Breadth-First Frontier Search).
+
+    Tal como a 'ProcuraLargura', usa uma fronteira FIFO e encontra a solução de menor profundidade, mas guarda apenas os
+    nós abertos (no máximo duas camadas de profundidade), com os bits dos operadores usados, e reconstrói o percurso por
+    divisão e conquista.
+"""
+
+class ProcuraLarguraFronteira(ProcuraFronteira):
+
+    # Inicializa a procura com uma fronteira FIFO.
+    def __init__(self):
+        super().__init__(FronteiraFIFO())
+
+
+    # A procura em largura minimiza a profundidade do percurso.
+    def _medida(self, custo, profundidade):
+        return profundidade
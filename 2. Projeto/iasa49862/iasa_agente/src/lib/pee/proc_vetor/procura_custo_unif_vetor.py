@@ -0,0 +1,75 @@
+import heapq
+
+from pee.proc_vetor.procura_vetor import ProcuraVetor
+
+"""
+    Classe 'ProcuraCustoUnifVetor', derivada de 'ProcuraVetor', que implementa a procura de custo uniforme com os nós
+    guardados em vetores paralelos.
+
+    Tal como a 'ProcuraCustoUnif', é uma procura em grafos que expande os nós por ordem do custo acumulado g(n) e mantém
+    um sucessor apenas se o seu estado ainda não tiver sido alcançado ou se o novo percurso for de menor custo (reabrindo
+    o estado, se já tiver sido expandido). O melhor nó de cada estado é registado num dicionário indexado por
+    'Estado.id_valor()', que guarda apenas o índice do nó na tabela. A fronteira é um heap de pares (custo, índice), sem
+    objetos 'No'; em vez de reposicionar o nó no heap, um percurso melhor acrescenta uma nova entrada, e as entradas de
+    nós entretanto substituídos são ignoradas quando retiradas ('EstatisticasProcura.nos_obsoletos'). Os empates de
+    custo são resolvidos por ordem de geração.
+
+    O filtro de estados visitados ('MecanismoProcura.filtro') não é aceite por esta procura.
+"""
+
+class ProcuraCustoUnifVetor(ProcuraVetor):
+
+    # A procura reabre os estados alcançados por um percurso de menor custo, pelo que não aceita o filtro de estados
+    # visitados.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Expande os nós por ordem de custo acumulado, até retirar da fronteira um nó objetivo.
+    def _procurar_indice(self, problema):
+
+        estatisticas = self._estatisticas
+        tabela = self._tabela
+        estados = tabela.estados
+        custos = tabela.custos
+        operadores = list(enumerate(problema.operadores))
+
+        # Melhor nó (índice na tabela) conhecido para cada estado, e fronteira com o nó inicial.
+        melhores = {estados[0].id_valor(): 0}
+        fronteira = [(0.0, 0)]
+
+        while fronteira:
+
+            custo, indice = heapq.heappop(fronteira)
+            estado = estados[indice]
+
+            # Ignora o nó se tiver sido substituído por um percurso de menor custo para o mesmo estado.
+            if melhores[estado.id_valor()] != indice:
+                estatisticas.nos_obsoletos += 1
+                continue
+
+            if problema.objectivo(estado):
+                return indice
+
+            for indice_op, operador in operadores:
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is None:
+                    continue
+                estatisticas.nos_gerados += 1
+
+                # Mantém o sucessor apenas se o estado for novo ou o percurso for de menor custo.
+                custo_suc = custo + operador.custo(estado, estado_suc)
+                id_suc = estado_suc.id_valor()
+                existente = melhores.get(id_suc)
+                if existente is not None and custos[existente] <= custo_suc:
+                    estatisticas.nos_podados += 1
+                    continue
+
+                indice_suc = tabela.inserir(estado_suc, indice, indice_op, custo_suc)
+                melhores[id_suc] = indice_suc
+                heapq.heappush(fronteira, (custo_suc, indice_suc))
+
+            estatisticas.nos_expandidos += 1
+            estatisticas.actualizar_memoria(len(fronteira), len(estados))
+
+        return None
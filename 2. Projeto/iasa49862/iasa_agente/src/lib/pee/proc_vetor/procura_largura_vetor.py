@@ -0,0 +1,54 @@
+from pee.proc_vetor.procura_vetor import ProcuraVetor
+
+"""
+    Classe 'ProcuraLarguraVetor', derivada de 'ProcuraVetor', que implementa a procura em largura com os nós guardados
+    em vetores paralelos.
+
+    Tal como a 'ProcuraLargura', é uma procura em árvore que expande os nós por ordem de geração e encontra a solução de
+    menor profundidade. Como os índices da tabela são atribuídos por ordem de geração, a fronteira FIFO é o intervalo de
+    índices ainda por expandir: basta um cursor para o próximo nó, sem qualquer estrutura adicional. Com um filtro de
+    estados visitados ('MecanismoProcura.filtro'), os sucessores para estados já gerados são descartados.
+"""
+
+class ProcuraLarguraVetor(ProcuraVetor):
+
+    # Expande os nós da tabela por ordem de índice, acrescentando os sucessores no fim, até encontrar o objetivo.
+    def _procurar_indice(self, problema):
+
+        estatisticas = self._estatisticas
+        tabela = self._tabela
+        estados = tabela.estados
+        custos = tabela.custos
+        filtro = self._filtro
+        operadores = list(enumerate(problema.operadores))
+
+        # Os nós com índice a partir de 'proximo' formam a fronteira.
+        proximo = 0
+        while proximo < len(estados):
+
+            indice = proximo
+            proximo += 1
+            estado = estados[indice]
+
+            if problema.objectivo(estado):
+                return indice
+
+            custo = custos[indice]
+            for indice_op, operador in operadores:
+                estado_suc = operador.aplicar(estado)
+                if estado_suc is None:
+                    continue
+                estatisticas.nos_gerados += 1
+
+                if filtro is not None:
+                    if estado_suc in filtro:
+                        estatisticas.nos_podados += 1
+                        continue
+                    filtro.add(estado_suc)
+
+                tabela.inserir(estado_suc, indice, indice_op, custo + operador.custo(estado, estado_suc))
+
+            estatisticas.nos_expandidos += 1
+            estatisticas.actualizar_memoria(len(estados) - proximo, len(estados))
+
+        return None
@@ -0,0 +1,70 @@
+from abc import abstractmethod
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.proc_vetor.tabela_nos import TabelaNos
+
+"""
+    Classe abstrata 'ProcuraVetor', derivada de 'MecanismoProcura', responsável por implementar o núcleo das procuras
+    cujos nós são guardados numa 'TabelaNos' (vetores paralelos) e referidos por índices inteiros.
+
+    Nas restantes procuras, cada sucessor gerado é um objeto 'No' com referências para o estado, o operador e o
+    antecessor, que é criado, seguido pelo coletor de lixo e libertado; em procuras com milhões de nós, esses objetos
+    dominam a memória e o tempo de gestão de memória. Aqui, um sucessor é uma posição nos vetores da tabela, a fronteira
+    guarda apenas índices e os objetos 'No' só são criados para o percurso da solução.
+
+    A procura insere o nó inicial e delega nas subclasses o ciclo de procura ('_procurar_indice'), que devolve o índice
+    do nó objetivo, a partir do qual a solução é reconstruída. As estatísticas são as das restantes procuras; a memória
+    é o número de nós da tabela, que são mantidos até ao fim da procura.
+"""
+
+class ProcuraVetor(MecanismoProcura):
+
+    # Inicializa a procura com uma tabela de nós vazia; a fronteira é gerida pelas subclasses.
+    def __init__(self):
+        super().__init__(None)
+        self._tabela = TabelaNos()
+
+
+    # Propriedade que devolve a tabela de nós da última procura.
+    @property
+    def tabela(self):
+        return self._tabela
+
+
+    # Inicializa a memória de uma procura: a tabela de nós e o filtro de estados visitados, se existir.
+    def _iniciar_memoria(self):
+        self._tabela.limpar()
+        if self._filtro is not None:
+            self._filtro.limpar()
+
+
+    # Número de nós guardados pela procura: todos os nós da tabela.
+    def _nos_memoria(self, no):
+        return len(self._tabela)
+
+
+    # Executa a procura para o problema fornecido, devolvendo a solução encontrada ou None se não existir solução.
+    def procurar(self, problema):
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+
+        self._tabela.inserir(problema.estado_inicial)
+        estatisticas.nos_gerados += 1
+        if self._filtro is not None:
+            self._filtro.add(problema.estado_inicial)
+
+        indice = self._procurar_indice(problema)
+
+        solucao = None if indice is None else self._tabela.solucao(indice, problema.operadores)
+        estatisticas.terminar()
+        return solucao
+
+
+    # Metodo abstrato '_procurar_indice', que executa o ciclo de procura a partir do nó inicial (índice 0) e devolve o
+    # índice do nó objetivo, ou None se não existir solução.
+    @abstractmethod
+    def _procurar_indice(self, problema):
+        """Abstract Method"""
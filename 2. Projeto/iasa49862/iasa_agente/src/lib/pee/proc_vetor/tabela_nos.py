@@ -0,0 +1,82 @@
+from array import array
+
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+
+"""
+    Classe 'TabelaNos', responsável por guardar os nós de uma procura em vetores paralelos (struct-of-arrays), em vez de
+    um objeto 'No' por nó.
+
+    Cada nó é identificado por um índice inteiro, atribuído por ordem de inserção, e os seus atributos ocupam a mesma
+    posição em cada vetor:
+    - 'estados': estado do problema associado ao nó (lista de referências);
+    - 'antecessores': índice do nó antecessor ('NENHUM' no nó inicial);
+    - 'operadores': índice do operador do problema que gerou o nó ('NENHUM' no nó inicial);
+    - 'custos': custo acumulado desde o estado inicial, como número real (usado apenas durante a procura);
+    - 'profundidades': profundidade do nó na árvore de procura.
+
+    Os vetores numéricos são 'array.array' tipados, que guardam os valores sem objetos Python: cada nó ocupa 20 bytes
+    nesses vetores e 8 bytes na lista de estados, em vez de um objeto 'No' com as suas referências, e os nós não são
+    seguidos pelo coletor de lixo. Os vetores são acedidos diretamente pelas procuras, tal como os atributos de 'No'.
+
+    A solução é reconstruída percorrendo os índices dos antecessores desde o nó objetivo, criando os objetos 'No' apenas
+    para os nós do percurso. O custo de cada nó da solução é recalculado com os custos dos operadores, pelo que mantém o
+    tipo numérico destes (e.g., inteiro), tal como nas procuras com objetos 'No'.
+"""
+
+class TabelaNos:
+
+    # Índice do antecessor e do operador do nó inicial.
+    NENHUM = -1
+
+
+    # Inicializa uma tabela vazia.
+    def __init__(self):
+        self.limpar()
+
+
+    # Esvazia a tabela, antes de uma nova procura.
+    def limpar(self):
+        self.estados = []
+        self.antecessores = array("i")
+        self.operadores = array("i")
+        self.custos = array("d")
+        self.profundidades = array("i")
+
+
+    # Número de nós guardados na tabela.
+    def __len__(self):
+        return len(self.estados)
+
+
+    # Acrescenta um nó à tabela, devolvendo o seu índice.
+    def inserir(self, estado, antecessor = NENHUM, operador = NENHUM, custo = 0):
+        indice = len(self.estados)
+        self.estados.append(estado)
+        self.antecessores.append(antecessor)
+        self.operadores.append(operador)
+        self.custos.append(custo)
+        self.profundidades.append(0 if antecessor == TabelaNos.NENHUM else self.profundidades[antecessor] + 1)
+        return indice
+
+
+    # Reconstrói a solução que termina no nó indicado, percorrendo os índices dos antecessores; os operadores dos nós
+    # são obtidos da lista de operadores do problema e os custos são recalculados com esses operadores.
+    def solucao(self, indice, operadores):
+
+        percurso = []
+        while indice != TabelaNos.NENHUM:
+            percurso.append(indice)
+            indice = self.antecessores[indice]
+        percurso.reverse()
+
+        no = None
+        for indice in percurso:
+            indice_op = self.operadores[indice]
+            if indice_op == TabelaNos.NENHUM:
+                no = No(self.estados[indice])
+            else:
+                operador = operadores[indice_op]
+                estado = self.estados[indice]
+                no = No(estado, operador, no, no.custo + operador.custo(no.estado, estado))
+        return Solucao(no)
@@ -7,27 +7,34 @@ Esta classe herda da classe abstrata 'Fronteira' e é usada na procura em profun
 mais recentes, situados em maior profundidade, são explorados primeiro. Isso resulta numa exploração que prioriza 
 avançar ao longo de uma ramificação até atingir um limite ou encontrar a solução.
 
-A estratégia LIFO insere novos nós no início da lista e remove nós do início, funcionando como uma pilha, o que 
-assegura a exploração em profundidade da árvore de procura.
+A estratégia LIFO insere novos nós no topo e remove nós do topo, funcionando como uma pilha, o que assegura a 
+exploração em profundidade da árvore de procura. O topo da pilha é o fim da 'deque' interna, pelo que a inserção e a
+remoção têm custo O(1), mantendo a mesma ordem de expansão que a inserção no início de uma lista.
 """
 
 class FronteiraLIFO(Fronteira):
 
     # Inicializa uma instância da fronteira LIFO, configurando-a como vazia.
-    # Este metodo chama o construtor da classe base 'Fronteira' para inicializar a lista interna de nós, garantindo
+    # Este metodo chama o construtor da classe base 'Fronteira' para inicializar a estrutura interna de nós, garantindo
     # que a fronteira esteja pronta para uso na procura em profundidade.
     def __init__(self):
-        # Chama o construtor da classe base 'Fronteira' para executar a inicialização padrão, que define a lista
+        # Chama o construtor da classe base 'Fronteira' para executar a inicialização padrão, que define a estrutura
         # '_nos' como vazia.
         super().__init__()
 
 
-    # Insere um nó no início da fronteira, seguindo a lógica LIFO.
-    # Este metodo adiciona o nó ao início da lista interna de nós, garantindo que os nós mais recentes sejam
+    # Insere um nó no topo da fronteira, seguindo a lógica LIFO.
+    # Este metodo adiciona o nó ao topo da pilha interna de nós, garantindo que os nós mais recentes sejam
     # explorados primeiro, característica essencial da procura em profundidade.
-    # ATT: A inserção no início da lista assegura que os sucessores recém-gerados sejam priorizados, levando a uma
+    # ATT: A inserção no topo da pilha assegura que os sucessores recém-gerados sejam priorizados, levando a uma
     # exploração em profundidade.
     def inserir(self, no):
-        # Insere o nó na posição inicial (índice 0) da lista interna '_nos', implementando a lógica de uma pilha
-        # onde o último nó inserido será o primeiro a ser removido.
-        self._nos.insert(0, no)
\ No newline at end of file
+        # Adiciona o nó ao fim da 'deque' interna '_nos' (topo da pilha), em tempo O(1), onde o último nó inserido
+        # será o primeiro a ser removido.
+        self._nos.append(no)
+
+
+    # Remove e devolve o nó do topo da fronteira, seguindo a lógica LIFO.
+    def remover(self):
+        # Remove o nó do fim da 'deque' interna '_nos' (topo da pilha), em tempo O(1).
+        return self._nos.pop()
\ No newline at end of file
@@ -0,0 +1,103 @@
+import math
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.prof.procura_profundidade import ProcuraProfundidade
+
+"""
+    Classe 'ProcuraIDAA', que implementa a procura A* com aprofundamento iterativo (Iterative Deepening A*, IDA*).
+
+    Esta classe herda da classe 'ProcuraProfundidade' e, tal como 'ProcuraProfIter', realiza múltiplas procuras em
+    profundidade, mas o limite de cada iteração é um valor de f(n) = g(n) + h(n) em vez de uma profundidade. Em cada
+    iteração só são explorados os nós com f(n) menor ou igual ao limite; o limite da iteração seguinte é o menor valor
+    de f(n) que ultrapassou o limite atual. O limite inicial é h(n) do estado inicial.
+
+    Com uma heurística admissível, a primeira solução encontrada é de custo mínimo, tal como na procura A*, mas a
+    memória necessária é apenas a da procura em profundidade (complexidade espacial O(b·d)), pois não há lista de
+    explorados nem fronteira de prioridade. Os sucessores que repetem um estado do próprio percurso são descartados,
+    evitando ciclos em problemas como 'ProblemaContagem' com incrementos negativos.
+
+    Com heurísticas reais, como 'HeurDist', os valores de f(n) são muito variados e cada iteração pode subir o limite
+    apenas uma fração mínima, multiplicando o número de iterações. O argumento 'inc_limite' de 'procurar', análogo a
+    'inc_prof' em 'ProcuraProfIter', define um incremento mínimo do limite entre iterações; a solução encontrada tem
+    então um custo que excede o ótimo em menos de 'inc_limite'. Por omissão o incremento é 0 e a solução é ótima.
+
+    Para cada iteração é registado o par (limite, nós expandidos) em 'iteracoes'; as estatísticas da procura acumulam os
+    valores de todas as iterações.
+"""
+
+class ProcuraIDAA(ProcuraProfundidade):
+
+    # Inicializa uma instância da procura IDA*, com o avaliador 'AvaliadorAA' para calcular f(n) = g(n) + h(n).
+    def __init__(self):
+        super().__init__()
+        self._avaliador = AvaliadorAA()
+        self.__iteracoes = []
+
+
+    # Propriedade que devolve a lista de iterações da última procura, cada uma como um par (limite, nós expandidos).
+    @property
+    def iteracoes(self):
+        return self.__iteracoes
+
+
+    # Um filtro de estados visitados descartaria um estado alcançado primeiro por um percurso de maior custo,
+    # impedindo o percurso ótimo, pelo que a procura não o aceita; os ciclos são evitados pelo percurso do nó.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura IDA* para o problema e a heurística fornecidos.
+    #
+    # Em cada iteração é executada a procura em profundidade da classe base com o limite de f(n) atual. A procura
+    # termina quando é encontrada uma solução, quando nenhum nó ultrapassou o limite (o espaço de estados foi esgotado)
+    # ou quando o limite seguinte excede 'limite_custo', devolvendo None nestes dois últimos casos. Entre iterações o
+    # limite sobe pelo menos 'inc_limite'.
+    def procurar(self, problema, heuristica, inc_limite = 0, limite_custo = math.inf):
+
+        self._avaliador.heuristica = heuristica
+        self.__iteracoes = []
+        estatisticas = EstatisticasProcura()
+
+        # O limite inicial é a estimativa do custo a partir do estado inicial.
+        self.__limite = heuristica.h(problema.estado_inicial)
+
+        while self.__limite <= limite_custo:
+
+            # O menor valor de f(n) acima do limite é calculado durante a iteração.
+            self.__proximo_limite = math.inf
+
+            # Executa a procura em profundidade limitada por f(n) e acumula as estatísticas da iteração.
+            solucao = super().procurar(problema)
+            estatisticas.acumular(self._estatisticas)
+            self.__iteracoes.append((self.__limite, self._estatisticas.nos_expandidos))
+
+            if solucao or self.__proximo_limite == math.inf:
+                self._estatisticas = estatisticas
+                return solucao
+
+            self.__limite = max(self.__proximo_limite, self.__limite + inc_limite)
+
+        self._estatisticas = estatisticas
+        return None
+
+
+    # Expande um nó, mantendo apenas os sucessores com f(n) dentro do limite da iteração.
+    #
+    # Os sucessores acima do limite são descartados, guardando-se o menor dos seus valores de f(n) como limite da
+    # iteração seguinte. Os sucessores cujo estado já existe no percurso do nó são descartados, por formarem um ciclo.
+    def _expandir(self, problema, no):
+
+        sucessores = []
+        for no_sucessor in super()._expandir(problema, no):
+
+            if self._no_percurso(no, no_sucessor.estado):
+                continue
+
+            no_sucessor.prioridade = self._avaliador.prioridade(no_sucessor)
+            if no_sucessor.prioridade <= self.__limite:
+                sucessores.append(no_sucessor)
+            elif no_sucessor.prioridade < self.__proximo_limite:
+                self.__proximo_limite = no_sucessor.prioridade
+
+        return sucessores
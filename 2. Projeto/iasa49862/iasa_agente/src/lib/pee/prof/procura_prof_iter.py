@@ -1,4 +1,5 @@
 from pee.prof.procura_prof_lim import ProcuraProfLim
+from pee.prof.tabela_transposicao import TabelaTransposicao
 
 """
 Classe 'ProcuraProfIter', que implementa a estratégia de procura em profundidade iterativa 
@@ -10,6 +11,12 @@ incrementando o limite de profundidade em cada iteração até encontrar uma sol
 A procura em profundidade iterativa combina a eficiência espacial da procura em profundidade 
 (complexidade espacial O(b·d)) com a completitude e optimalidade da procura em largura, garantindo 
 que a solução encontrada seja a de menor profundidade em grafos sem custos diferenciados.
+
+Sem deteção de estados repetidos, cada iteração explora todos os percursos até ao limite, o que em grafos com muitos
+ciclos, como a grelha do 'ModeloMundo', cresce exponencialmente com a profundidade. Com 'dim_tabela', a procura usa uma
+tabela de transposição ('TabelaTransposicao') com essa capacidade, que guarda a menor profundidade a que cada estado foi
+alcançado e descarta os estados alcançados de novo, dentro de cada iteração e entre iterações, mantendo a solução de
+menor profundidade. Os estados descartados são registados em 'EstatisticasProcura.nos_podados'.
 """
 
 class ProcuraProfIter(ProcuraProfLim):
@@ -20,11 +27,21 @@ class ProcuraProfIter(ProcuraProfLim):
     # O valor padrão de 'prof_max_inicial' é 99, mas pode ser personalizado para adaptar a procura a
     # diferentes problemas.
     # att: A inicialização define a base para as iterações com limites crescentes.
-    def __init__(self, prof_max_inicial = 10):
+    # Com 'dim_tabela', é criada uma tabela de transposição com essa capacidade (número de estados, pelo menos 1).
+    def __init__(self, prof_max_inicial = 10, dim_tabela = None):
         # Chama o construtor da classe base 'ProcuraProfLim', inicializando o mecanismo de procura com
         # o limite de profundidade especificado, que será atualizado nas iterações subsequentes.
         super().__init__(prof_max_inicial)
 
+        # Cria a tabela de transposição, se pedida.
+        self.__tabela = TabelaTransposicao(dim_tabela) if dim_tabela is not None else None
+
+
+    # Propriedade que devolve a tabela de transposição, ou None se a procura não a usar.
+    @property
+    def tabela(self):
+        return self.__tabela
+
 
     # Executa a procura em profundidade iterativa para encontrar uma solução ao problema fornecido.
     # Este metodo percorre os limites de profundidade crescentes, começando de 0 até um limite máximo
@@ -35,6 +52,10 @@ class ProcuraProfIter(ProcuraProfLim):
     # ATT: A procura iterativa garante completitude e optimalidade ao combinar múltiplas procuras com
     # limites crescentes.
     def procurar(self, problema, inc_prof, limite_prof):
+        # Esvazia a tabela de transposição, se existir, para que a procura não use estados de outro problema.
+        if self.__tabela is not None:
+            self.__tabela.limpar()
+
         # Percorre uma sequência de limites de profundidade, começando de 0 e incrementando por
         # 'inc_prof' até atingir ou exceder 'limite_prof', para realizar procuras sucessivas.
         for profundidade in range(0, limite_prof + 1, inc_prof):
@@ -42,6 +63,8 @@ class ProcuraProfIter(ProcuraProfLim):
             # Atualiza o limite de profundidade máximo da classe base ('_prof_max') para a iteração
             # atual, definindo o novo limite para a procura em profundidade limitada.
             self._prof_max = profundidade
+            if self.__tabela is not None:
+                self.__tabela.nova_iteracao()
 
             # Chama o metodo 'procurar' da classe base 'ProcuraProfLim', que executa uma procura em
             # profundidade limitada com o limite atual, retornando uma solução ou None.
@@ -53,3 +76,19 @@ class ProcuraProfIter(ProcuraProfLim):
                 # Devolve a solução encontrada, que representa o percurso até o estado objetivo,
                 # garantindo que seja a de menor profundidade devido à ordem crescente dos limites.
                 return solucao
+
+
+    # Memoriza um nó na fronteira; com a tabela de transposição, o nó é descartado se o seu estado já foi alcançado a
+    # uma profundidade menor, ou à mesma profundidade nesta iteração.
+    def _memorizar(self, no):
+        if self.__tabela is not None and not self.__tabela.registar(no.estado, no.profundidade):
+            self._estatisticas.nos_podados += 1
+            return
+        super()._memorizar(no)
+
+
+    # Número de nós guardados pela procura: os da procura em profundidade e os estados da tabela de transposição.
+    def _nos_memoria(self, no):
+        if self.__tabela is not None:
+            return super()._nos_memoria(no) + self.__tabela.dimensao
+        return super()._nos_memoria(no)
@@ -32,6 +32,12 @@ class ProcuraProfLim(ProcuraProfundidade):
         self._prof_max = prof_max
 
 
+    # Um filtro de estados visitados descartaria um estado alcançado primeiro por um percurso mais profundo,
+    # impedindo uma solução dentro do limite pelo percurso mais curto, pelo que a procura não o aceita.
+    def _aceitar_filtro(self):
+        return False
+
+
     # Expande um nó, gerando seus sucessores, mas apenas se a profundidade do nó não exceder o
     # limite máximo.
     # Este metodo sobrescreve o '_expandir' da classe base para adicionar a restrição de
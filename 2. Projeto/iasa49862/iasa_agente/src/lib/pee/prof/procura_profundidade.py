@@ -26,3 +26,13 @@ class ProcuraProfundidade(MecanismoProcura):
         # e remoção no início da lista de nós, funcionando como uma pilha.
         super().__init__(FronteiraLIFO())
 
+
+    # Verifica se um estado pertence ao percurso desde o nó inicial até ao nó indicado, permitindo às variantes da
+    # procura em profundidade descartar sucessores que formariam um ciclo no percurso (em tempo O(d)).
+    @staticmethod
+    def _no_percurso(no, estado):
+        while no is not None:
+            if no.estado == estado:
+                return True
+            no = no.antecessor
+        return False
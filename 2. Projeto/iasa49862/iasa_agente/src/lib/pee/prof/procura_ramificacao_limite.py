@@ -0,0 +1,147 @@
+import math
+
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+from pee.melhor_prim.aval.avaliador_aa import AvaliadorAA
+from pee.melhor_prim.heuristica import Heuristica
+from pee.melhor_prim.procura_sof import ProcuraSofraga
+from pee.prof.procura_profundidade import ProcuraProfundidade
+
+"""
+    Classe 'ProcuraRamificacaoLimite', que implementa a procura em profundidade por ramificação e limite (Depth-First
+    Branch and Bound, DFBnB).
+
+    Esta classe herda da classe 'ProcuraProfundidade' e, ao contrário desta, não termina na primeira solução: guarda o
+    custo da melhor solução encontrada como limite superior e continua a procura em profundidade, descartando qualquer
+    nó cujo f(n) = g(n) + h(n) não seja inferior a esse limite. Cada nova solução mais barata reduz o limite, e a
+    procura termina quando a fronteira fica vazia, devolvendo a melhor solução, que é ótima com uma heurística
+    admissível.
+
+    Os sucessores de um nó são colocados na fronteira por ordem decrescente de f(n), para que o mais promissor seja
+    explorado primeiro e as boas soluções (e os cortes que permitem) surjam cedo. Os sucessores que repetem um estado do
+    próprio percurso são descartados, como em 'ProcuraIDAA'. Não há lista de explorados: a memória é a da procura em
+    profundidade, o percurso atual mais os irmãos pendentes de cada nível (complexidade espacial O(b·d)).
+
+    Sem limite inicial, a procura em profundidade pode descer indefinidamente antes da primeira solução em espaços
+    infinitos (e.g., 'ProblemaContagem' com incrementos negativos). O limite inicial pode ser indicado em
+    'limite_inicial' ou obtido com uma procura sôfrega ('ProcuraSofraga'), rápida mas não ótima, cuja solução é usada
+    como melhor solução inicial; as estatísticas da procura sôfrega são acumuladas às da procura por ramificação e
+    limite.
+"""
+
+class ProcuraRamificacaoLimite(ProcuraProfundidade):
+
+    # Inicializa uma instância da procura por ramificação e limite, com o avaliador 'AvaliadorAA' para calcular
+    # f(n) = g(n) + h(n).
+    def __init__(self):
+        super().__init__()
+        self._avaliador = AvaliadorAA()
+        self.__solucoes = []
+
+
+    # Propriedade que devolve as soluções encontradas na última procura, por ordem, cada uma como um par (custo, nós
+    # expandidos), incluindo a solução da procura sôfrega inicial, se existir.
+    @property
+    def solucoes(self):
+        return self.__solucoes
+
+
+    # Um filtro de estados visitados descartaria um estado alcançado primeiro por um percurso de maior custo,
+    # impedindo o percurso ótimo, pelo que a procura não o aceita; os ciclos são evitados pelo percurso do nó.
+    def _aceitar_filtro(self):
+        return False
+
+
+    # Executa a procura por ramificação e limite para o problema e a heurística fornecidos.
+    #
+    # Com 'sofrega' a True, a solução da procura sôfrega define o limite inicial, se for mais barata do que
+    # 'limite_inicial'. Devolve a melhor solução encontrada, ou None se não existir solução de custo inferior ao limite
+    # inicial.
+    def procurar(self, problema, heuristica, limite_inicial = math.inf, sofrega = False):
+
+        self._avaliador.heuristica = heuristica
+        self.__solucoes = []
+        self.__limite = limite_inicial
+        solucao_inicial = None
+        no_objectivo = None
+
+        estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+
+        # Obtém o limite inicial a partir da solução da procura sôfrega.
+        if sofrega:
+            mec_sofrega = ProcuraSofraga()
+            solucao = mec_sofrega.procurar(problema, heuristica)
+            estatisticas.acumular(mec_sofrega.estatisticas)
+            if solucao is not None and solucao.custo < self.__limite:
+                solucao_inicial = solucao
+                self.__limite = solucao.custo
+                self.__solucoes.append((solucao.custo, estatisticas.nos_expandidos))
+
+        self._estatisticas = estatisticas
+        self._iniciar_memoria()
+
+        no = No(problema.estado_inicial)
+        no.prioridade = self._avaliador.prioridade(no)
+        estatisticas.nos_gerados += 1
+        self._memorizar(no)
+
+        while not self._fronteira.vazia:
+
+            no = self._fronteira.remover()
+
+            # O limite pode ter descido depois de o nó ter sido inserido na fronteira.
+            if self.__podar(no):
+                estatisticas.nos_podados += 1
+                continue
+
+            # Uma solução que chega aqui é mais barata do que a melhor conhecida e passa a definir o limite; como os
+            # custos são positivos, os seus descendentes não podem ser melhores, pelo que o nó não é expandido.
+            if problema.objectivo(no.estado):
+                no_objectivo = no
+                self.__limite = no.custo
+                self.__solucoes.append((no.custo, estatisticas.nos_expandidos))
+                continue
+
+            sucessores = self._expandir(problema, no)
+            estatisticas.nos_expandidos += 1
+            estatisticas.nos_gerados += len(sucessores)
+            for no_sucessor in sucessores:
+                self._memorizar(no_sucessor)
+
+            estatisticas.actualizar_memoria(self._fronteira.dimensao, self._nos_memoria(no))
+
+        # Devolve a melhor solução: a última encontrada na procura ou, se nenhuma a melhorou, a da procura sôfrega.
+        estatisticas.terminar()
+        if no_objectivo is None:
+            return solucao_inicial
+        return Solucao(no_objectivo)
+
+
+    # Expande um nó, mantendo apenas os sucessores com f(n) inferior ao limite, ordenados por f(n) decrescente para
+    # que o melhor fique no topo da fronteira. Os sucessores cujo estado já existe no percurso do nó são descartados,
+    # por formarem um ciclo.
+    def _expandir(self, problema, no):
+
+        sucessores = []
+        for no_sucessor in super()._expandir(problema, no):
+
+            if self._no_percurso(no, no_sucessor.estado):
+                continue
+
+            no_sucessor.prioridade = self._avaliador.prioridade(no_sucessor)
+            if self.__podar(no_sucessor):
+                self._estatisticas.nos_podados += 1
+            else:
+                sucessores.append(no_sucessor)
+
+        sucessores.sort(key = lambda no_sucessor: no_sucessor.prioridade, reverse = True)
+        return sucessores
+
+
+    # Indica se um nó deve ser descartado, por f(n) não ser inferior ao limite. A tolerância da heurística evita que
+    # erros de arredondamento de h(n) tornem um percurso de custo igual ao da melhor solução aparentemente mais barato,
+    # o que obrigaria a explorar todos os percursos ótimos alternativos.
+    def __podar(self, no):
+        return no.prioridade >= self.__limite - Heuristica.TOLERANCIA
@@ -0,0 +1,102 @@
+from pee.mec_proc.estatisticas_procura import EstatisticasProcura
+from pee.mec_proc.mecanismo_procura import MecanismoProcura
+from pee.mec_proc.no import No
+from pee.mec_proc.solucao import Solucao
+
+"""
+    Classe 'ProcuraRetrocesso', que implementa a procura em profundidade com retrocesso (Backtracking Search).
+
+    Na 'ProcuraProfundidade', cada expansão gera a lista completa dos sucessores e coloca-os todos na fronteira LIFO,
+    pelo que os irmãos ainda por explorar de cada nível ficam em memória (complexidade espacial O(b·d)). Nesta procura,
+    cada nível do percurso atual é uma entrada da pilha com o nó e um gerador ('_gerar_sucessores') que aplica os
+    operadores do problema um de cada vez, à medida que os sucessores são pedidos: só o sucessor em exploração é criado,
+    e quando os operadores de um nó se esgotam a procura retrocede para o nível anterior. A memória é O(d) entradas da
+    pilha, e os irmãos ainda por explorar nunca chegam a ser criados.
+
+    Os operadores são aplicados por ordem inversa, para que a ordem de exploração seja a mesma da 'ProcuraProfundidade'
+    (cujo último sucessor inserido na fronteira é o primeiro a ser explorado). Os sucessores cujo estado já pertence ao
+    percurso atual são descartados, o que evita ciclos; os estados do percurso são mantidos num conjunto, tornando a
+    verificação O(1). Opcionalmente, 'prof_max' limita a profundidade, como na 'ProcuraProfLim'. A solução é devolvida
+    como uma 'Solucao' construída a partir do nó objetivo, tal como nas restantes procuras.
+
+    Com um filtro de estados visitados ('MecanismoProcura.filtro', e.g., 'FiltroBloom'), cada estado expandido é
+    registado no filtro e não volta a ser explorado por outro percurso, o que torna a procura uma procura em grafos com
+    memória de alguns bits por estado; com 'prof_max', um estado alcançado primeiro a uma profundidade maior deixa de
+    ser explorado a uma profundidade menor, e a procura pode não encontrar uma solução existente dentro do limite.
+"""
+
+class ProcuraRetrocesso(MecanismoProcura):
+
+    # Inicializa uma instância da procura com retrocesso com a profundidade máxima (None para não limitar). A procura
+    # não usa fronteira: o percurso atual é a pilha de geradores.
+    def __init__(self, prof_max = None):
+        super().__init__(None)
+        self._prof_max = prof_max
+
+
+    # Inicializa a memória da procura: a pilha de níveis do percurso atual e o conjunto dos seus estados.
+    def _iniciar_memoria(self):
+        self._pilha = []
+        self._percurso = set()
+        if self._filtro is not None:
+            self._filtro.limpar()
+
+
+    # Número de nós guardados pela procura: um por nível do percurso atual.
+    def _nos_memoria(self, no):
+        return len(self._pilha)
+
+
+    # Executa a procura em profundidade com retrocesso para o problema fornecido, devolvendo a primeira solução
+    # encontrada ou None se não existir solução (dentro da profundidade máxima).
+    def procurar(self, problema):
+
+        estatisticas = self._estatisticas = EstatisticasProcura()
+        estatisticas.iniciar()
+        self._iniciar_memoria()
+
+        no = No(problema.estado_inicial)
+        estatisticas.nos_gerados += 1
+
+        while True:
+
+            # Avança para o nó gerado: testa o objetivo e, se o nó puder ser expandido, abre um novo nível.
+            if problema.objectivo(no.estado):
+                estatisticas.terminar()
+                return Solucao(no)
+
+            if self._prof_max is None or no.profundidade < self._prof_max:
+                self._pilha.append((no, self._gerar_sucessores(problema, no)))
+                self._percurso.add(no.estado)
+                if self._filtro is not None:
+                    self._filtro.add(no.estado)
+                estatisticas.nos_expandidos += 1
+                estatisticas.actualizar_memoria(len(self._pilha), self._nos_memoria(no))
+
+            # Obtém o sucessor seguinte do nível mais profundo, retrocedendo enquanto os operadores estiverem esgotados.
+            no = None
+            while self._pilha and no is None:
+                no_nivel, sucessores = self._pilha[-1]
+                no = next(sucessores, None)
+                if no is None:
+                    self._pilha.pop()
+                    self._percurso.discard(no_nivel.estado)
+
+            if no is None:
+                estatisticas.terminar()
+                return None
+
+
+    # Gera os sucessores de um nó um de cada vez, aplicando os operadores por ordem inversa e descartando os estados do
+    # percurso atual e, com um filtro de estados visitados, os estados já expandidos.
+    def _gerar_sucessores(self, problema, no):
+        estado = no.estado
+        for operador in reversed(problema.operadores):
+            estado_suc = operador.aplicar(estado)
+            if estado_suc is None:
+                continue
+            if estado_suc in self._percurso or (self._filtro is not None and estado_suc in self._filtro):
+                self._estatisticas.nos_podados += 1
+                continue
+            self._estatisticas.nos_gerados += 1
+            yield No(estado_suc, operador, no, no.custo + operador.custo(estado, estado_suc))
@@ -0,0 +1,80 @@
+"""
+    Classe 'TabelaTransposicao', que implementa uma tabela de transposição de dimensão limitada para as procuras em
+    profundidade iterativa.
+
+    A tabela associa o identificador de cada estado ('Estado.id_valor') à menor profundidade a que o estado foi
+    alcançado e à iteração em que essa profundidade foi registada. Um estado alcançado de novo é descartado se:
+    - já foi alcançado a uma profundidade menor, nesta ou numa iteração anterior, pois o percurso mais curto até ao
+      estado é (ou será) explorado nesta iteração com mais profundidade disponível;
+    - já foi alcançado à mesma profundidade nesta iteração, pois o estado já foi (ou está a ser) explorado com a mesma
+      profundidade disponível.
+    Estas regras preservam os percursos de menor profundidade, pelo que a procura continua a encontrar a solução de
+    menor profundidade.
+
+    Quando a tabela está cheia, o registo de um novo estado substitui o registo consultado há mais tempo (os registos
+    são mantidos no dicionário por ordem de consulta). A substituição apenas reduz os cortes: um estado esquecido volta
+    a ser explorado como se nunca tivesse sido alcançado.
+"""
+
+class TabelaTransposicao:
+
+    # Inicializa uma tabela de transposição vazia com a capacidade máxima indicada (número de estados), que tem de ser
+    # pelo menos 1.
+    def __init__(self, capacidade):
+        if capacidade < 1:
+            raise ValueError("a capacidade da tabela de transposição tem de ser pelo menos 1")
+        self.__capacidade = capacidade
+        self.limpar()
+
+
+    # Propriedade que devolve a capacidade máxima da tabela.
+    @property
+    def capacidade(self):
+        return self.__capacidade
+
+
+    # Propriedade que devolve o número de estados registados na tabela.
+    @property
+    def dimensao(self):
+        return len(self.__registos)
+
+
+    # Propriedade que devolve o número de registos substituídos por falta de espaço desde a última limpeza.
+    @property
+    def substituicoes(self):
+        return self.__substituicoes
+
+
+    # Esvazia a tabela, antes de uma nova procura.
+    def limpar(self):
+        self.__registos = {}
+        self.__iteracao = 0
+        self.__substituicoes = 0
+
+
+    # Inicia uma nova iteração da procura; os registos das iterações anteriores são mantidos.
+    def nova_iteracao(self):
+        self.__iteracao += 1
+
+
+    # Regista um estado alcançado à profundidade indicada, devolvendo False se o estado deve ser descartado.
+    def registar(self, estado, profundidade):
+
+        # O registo consultado é retirado e volta a ser colocado no fim da ordem de substituição.
+        chave = estado.id_valor()
+        registo = self.__registos.pop(chave, None)
+
+        if registo is not None:
+            prof_registo, iteracao_registo = registo
+            if profundidade > prof_registo or \
+                    (profundidade == prof_registo and iteracao_registo == self.__iteracao):
+                self.__registos[chave] = registo
+                return False
+
+        # Estado novo com a tabela cheia: substitui o registo consultado há mais tempo.
+        elif len(self.__registos) >= self.__capacidade:
+            del self.__registos[next(iter(self.__registos))]
+            self.__substituicoes += 1
+
+        self.__registos[chave] = (profundidade, self.__iteracao)
+        return True
@@ -13,4 +13,19 @@ class ModeloPlan(ABC):
 
     @abstractmethod
     def obter_operadores(self):
-        """ABSTRACT METHOD"""
\ No newline at end of file
+        """ABSTRACT METHOD"""
+
+    # Devolve os antecessores de um estado, como uma lista de pares (operador, estado antecessor); opcional, usado pela
+    # procura bidirecional. Por omissão devolve None (sem antecessores).
+    def obter_antecessores(self, estado):
+        return None
+
+    # Devolve o número de células da codificação densa dos estados (inteiros de 0 a n - 1); opcional, usado pelas
+    # procuras com memória em vetores indexados por estado. Por omissão devolve None (sem codificação densa).
+    def obter_num_celulas(self):
+        return None
+
+    # Devolve a célula (inteiro) da codificação densa de um estado; opcional, como 'obter_num_celulas' (por omissão
+    # devolve None).
+    def obter_celula(self, estado):
+        return None
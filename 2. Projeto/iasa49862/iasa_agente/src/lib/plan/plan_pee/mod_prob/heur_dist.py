@@ -1,5 +1,7 @@
 import math
 
+from pee.melhor_prim.heuristica import Heuristica
+
 """
     Classe 'HeurDistad' que implementa uma função heurística baseada na distância euclidiana para problemas de planeamento.
 
@@ -15,7 +17,7 @@ import math
      o ciclo de tomada de decisão.
 """
 
-class HeurDist:
+class HeurDist(Heuristica):
 
     # Inicializa uma instância da heurística com um estado final.
     def __init__(self, estado_final):
@@ -25,6 +27,14 @@ class HeurDist:
         self.__estado_final = estado_final
 
 
+    # Propriedade que declara a heurística como consistente: o custo de cada transição ('OperadorMover.custo') é
+    # max(1, distância euclidiana entre as posições), que nunca é inferior ao deslocamento euclidiano, pelo que, pela
+    # desigualdade triangular, h(s) <= dist(s, s') + h(s') <= c(s, s') + h(s').
+    @property
+    def consistente(self):
+        return True
+
+
     # MEtodo que calcula a estimativa heurística para um estado.
     #
     # Este mEtodo retorna a distância euclidiana entre a posição do estado fornecido e a posição do estado final,
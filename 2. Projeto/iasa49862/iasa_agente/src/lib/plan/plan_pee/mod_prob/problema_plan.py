@@ -27,6 +27,28 @@ class ProblemaPlan(Problema):
         # condição de objetivo.
         self.__estado_final = estado_final
 
+        # Armazena o modelo de planeamento, usado para obter os antecessores e a codificação densa de um estado.
+        self.__modelo_plan = modelo_plan
+
+    # Propriedade que devolve o estado final (objetivo) do problema.
+    @property
+    def estado_final(self):
+        return self.__estado_final
+
+    # Metodo que devolve os antecessores de um estado, obtidos do modelo de planeamento, permitindo a procura a partir
+    # do estado final (e.g., 'ProcuraBidireccional').
+    def antecessores(self, estado):
+        return self.__modelo_plan.obter_antecessores(estado)
+
+    # Metodo que devolve o número de códigos da codificação densa dos estados, que é o número de células do modelo de
+    # planeamento (e.g., a grelha do 'ModeloMundo').
+    def num_codigos(self):
+        return self.__modelo_plan.obter_num_celulas()
+
+    # Metodo que devolve o código de um estado, que é a sua célula no modelo de planeamento.
+    def codigo(self, estado):
+        return self.__modelo_plan.obter_celula(estado)
+
     # Metodo que verifica se um estado é o estado objetivo do problema.
     # Este metodo compara o estado fornecido com o estado final, retornando verdadeiro se forem iguais, indicando que o
     # objetivo foi alcançado.
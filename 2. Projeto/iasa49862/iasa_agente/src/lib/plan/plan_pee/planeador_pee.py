@@ -1,5 +1,8 @@
 from pee.melhor_prim.procura_aa import ProcuraAA
+from pee.melhor_prim.procura_araa import ProcuraARAA
 from pee.melhor_prim.procura_custo_unif import ProcuraCustoUnif
+from pee.melhor_prim.heuristica_memo import HeuristicaMemo
+from pee.proc_densa.procura_aa_densa import ProcuraAADensa
 from plan.plan_pee.mod_prob.heur_dist import HeurDist
 from plan.plan_pee.mod_prob.problema_plan import ProblemaPlan
 from plan.planeador import Planeador
@@ -17,14 +20,47 @@ from plan.plano_pee import PlanoPEE
 
     A classe é projetada para integrar-se com agentes deliberativos e simuladores, suportando planeamento automático 
     em cenários de tomada de decisão sequencial.  
+
+    Quando o agente tem de replanear em cada passo em mapas grandes, pode ser indicado um orçamento de tempo por
+    planeamento ('tempo_max', em segundos): o planeador usa então a procura anytime 'ProcuraARAA', que encontra
+    rapidamente uma solução de custo limitado e a melhora enquanto houver tempo.
+
+    Com 'densa' a True (e sem orçamento de tempo), o planeador usa a 'ProcuraAADensa', que guarda os custos, os
+    antecessores e os estados fechados em vetores indexados pela célula, em vez de dicionários de nós indexados por
+    estado, sempre que o modelo de planeamento tiver uma codificação densa dos estados ('ModeloPlan.obter_num_celulas',
+    e.g., as células do 'ModeloMundo'); com um modelo sem essa codificação, usa a 'ProcuraAA'.
+
+    Com 'dim_memo' definido (capacidade da memória, 'math.inf' para ilimitada), a heurística é memorizada numa
+    'HeuristicaMemo' que é mantida entre planeamentos enquanto o objetivo não mudar, pelo que os replaneamentos para o
+    mesmo objetivo reutilizam os valores de h(n) já calculados ('heuristica' devolve a heurística usada, com a taxa de
+    acertos da memória).
 """
 
 class PlaneadorPEE(Planeador):
 
-    # Inicializa uma instância do planeador PEE.
-    def __init__(self):
-        # Define o mecanismo de procura como uma instância de 'ProcuraAA'
-        self.__mec_pee  = ProcuraAA()
+    # Inicializa uma instância do planeador PEE, com um orçamento de tempo opcional por planeamento, a opção de usar a
+    # procura com memória em vetores indexados pela codificação densa dos estados e a capacidade opcional da
+    # memorização da heurística entre planeamentos.
+    def __init__(self, tempo_max = None, densa = False, dim_memo = None):
+        # Define o mecanismo de procura como uma instância de 'ProcuraAA' ou, com orçamento de tempo, de 'ProcuraARAA'
+        if tempo_max is not None:
+            self.__mec_pee  = ProcuraARAA(tempo_max = tempo_max)
+        else:
+            self.__mec_pee  = ProcuraAA()
+
+        # Com a opção 'densa', a 'ProcuraAADensa' é usada em vez da 'ProcuraAA' nos modelos com codificação densa.
+        self.__mec_densa = ProcuraAADensa() if densa and tempo_max is None else None
+
+        # Capacidade da memorização da heurística (None desativa), heurística e objetivo do último planeamento.
+        self.__dim_memo   = dim_memo
+        self.__heuristica = None
+        self.__objectivo  = None
+
+
+    # Propriedade que devolve a heurística usada no último planeamento.
+    @property
+    def heuristica(self):
+        return self.__heuristica
 
 
     # Gera um plano para alcançar um objetivo num modelo de planeamento.
@@ -49,15 +85,35 @@ class PlaneadorPEE(Planeador):
         problema = ProblemaPlan(modelo_plan, estado_final)
 
         # Instancia uma heurística de distância baseada no estado final, que estima o custo restante para alcançar
-        # o objetivo, guiando a procura A*.
-        heuristica = HeurDist(estado_final)
+        # o objetivo, guiando a procura A*. Com memorização, a heurística do planeamento anterior é reutilizada se o
+        # objetivo for o mesmo.
+        heuristica = self.__obter_heuristica(estado_final)
 
         # Executa a procura A* no problema usando o mecanismo de procura ('ProcuraAA') e a heurística, retornando
         # uma solução (sequência de ações) se encontrada.
-        solucao = self.__mec_pee.procurar(problema, heuristica)
+        solucao = self.__obter_mecanismo(problema).procurar(problema, heuristica)
 
         # Verifica se uma solução foi encontrada; se sim, retorna um plano PEE baseado na solução.
         if solucao:
             # Cria e retorna uma instância de 'PlanoPEE' com a solução, encapsulando a sequência de ações para
             # alcançar o estado final.
             return PlanoPEE(solucao)
+
+
+    # Devolve o mecanismo de procura para o problema: a 'ProcuraAADensa', se foi pedida e o modelo de planeamento tiver
+    # a codificação densa dos estados ('num_codigos' diferente de None), ou o mecanismo geral.
+    def __obter_mecanismo(self, problema):
+        if self.__mec_densa is not None and problema.num_codigos() is not None:
+            return self.__mec_densa
+        return self.__mec_pee
+
+
+    # Devolve a heurística de distância para o estado final: uma nova 'HeurDist' ou, com memorização, a 'HeuristicaMemo'
+    # do planeamento anterior se o objetivo não mudou.
+    def __obter_heuristica(self, estado_final):
+        if self.__dim_memo is None:
+            self.__heuristica = HeurDist(estado_final)
+        elif self.__heuristica is None or self.__objectivo != estado_final:
+            self.__heuristica = HeuristicaMemo(HeurDist(estado_final), self.__dim_memo)
+        self.__objectivo = estado_final
+        return self.__heuristica
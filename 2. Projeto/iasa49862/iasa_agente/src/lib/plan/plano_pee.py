@@ -2,25 +2,30 @@ from plan.plano import Plano
 
 class PlanoPEE(Plano):
 
+    # O plano guarda a solução e um cursor para o próximo passo, que avança em cada ação, em vez de copiar os passos
+    # para uma lista e remover o primeiro em cada ação.
     def __init__(self, solucao):
 
-        self.__passos = [passo for passo in solucao]
+        self.__solucao = solucao
+
+        self.__indice = 0
 
 
     def obter_accao(self, estado):
 
-        if self.__passos:
-            passo = self.__passos.pop(0)
+        if self.__indice < self.__solucao.dimensao:
+            passo = self.__solucao[self.__indice]
+            self.__indice += 1
 
             if passo.estado == estado:
                 return passo.operador
 
 
     def mostrar(self, vista):
-        if self.__passos:
-            for passo in self.__passos:
-                vista.mostrar_vector(passo.estado.posicao, passo.operador.ang)
+        for indice in range(self.__indice, self.__solucao.dimensao):
+            passo = self.__solucao[indice]
+            vista.mostrar_vector(passo.estado.posicao, passo.operador.ang)
 
     @property
     def dimensao(self):
-        return len(self.__passos)
+        return self.__solucao.dimensao - self.__indice